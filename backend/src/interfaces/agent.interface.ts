@@ -23,6 +23,11 @@ export interface IAgent {
     has_tools: ToolPermission;
     has_code_exec: CodePermission;
     max_consecutive_auto_reply: number;
+    summary_threshold: number;
+    summary_window: number;
+    max_parallel_tools: number;
+    tool_timeout: number | null;
+    tool_timeouts: Map<string, number>;
     models: Map<ModelType, Types.ObjectId | IModelDocument>;
     created_by: Types.ObjectId | IUserDocument;
     updated_by: Types.ObjectId | IUserDocument;
@@ -22,6 +22,18 @@ export interface References {
     code_executions?: Types.ObjectId[] | ICodeExecutionDocument[];
 }
 
+// Handle of node references offloaded to the workflow's blob store
+export interface BlobHandle {
+    blob_id: string;
+    size: number;
+    count: number;
+    summary: string;
+}
+
+export interface NodeReferences extends References {
+    blob?: BlobHandle;
+}
+
 export interface ReferenceHolder {
     references?: References;
 }
@@ -32,6 +32,12 @@ export interface ITask extends DataClusterHolder {
   recursive: boolean;
   start_node: string | null;
   node_end_code_routing: Map<string, Map<string, any>> | null;
+  parallel_nodes: Map<string, Array<string>> | null;
+  map_nodes: Map<string, { input_variable: string; item_variable: string; max_concurrency?: number }> | null;
+  cached_nodes: Array<string> | null;
+  task_timeout: number | null;
+  node_timeouts: Map<string, number>;
+  parallel_safe: boolean;
   exit_codes: Map<string, string>;
   exit_code_response_map: Map<string, number> | null;
   created_by: Types.ObjectId | IUserDocument;
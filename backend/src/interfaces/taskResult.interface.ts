@@ -1,6 +1,6 @@
 import { Document, Types, Model } from 'mongoose';
 import { IUserDocument } from './user.interface';
-import { ReferenceHolder, References } from './references.interface';
+import { NodeReferences, References } from './references.interface';
 import { Embeddable } from './embeddingChunk.interface';
 
 export interface ExecutionHistoryItem {
@@ -10,7 +10,8 @@ export interface ExecutionHistoryItem {
     exit_code?: number;
 }
 
-export interface NodeResponse extends ExecutionHistoryItem, ReferenceHolder {
+export interface NodeResponse extends ExecutionHistoryItem {
+    references?: NodeReferences;
 }
 
 export interface ITaskResult extends Embeddable {
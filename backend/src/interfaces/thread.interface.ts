@@ -6,6 +6,8 @@ import { Document } from "mongoose";
 export interface IChatThread {
     name?: string;
     messages: Types.ObjectId[] | IMessageDocument[];
+    summary?: string;
+    summarized_messages?: number;
     created_by: Types.ObjectId | IUserDocument;
     updated_by: Types.ObjectId | IUserDocument;
 }
@@ -7,6 +7,11 @@ const agentSchema = new Schema<IAgentDocument, IAgentModel>({
   name: { type: String, required: true },
   system_message: { type: Schema.Types.ObjectId, ref: 'Prompt', autopopulate: true },
   max_consecutive_auto_reply: { type: Number, default: 10 },
+  summary_threshold: { type: Number, default: 0 },
+  summary_window: { type: Number, default: 10 },
+  max_parallel_tools: { type: Number, default: 4 },
+  tool_timeout: { type: Number, default: null },
+  tool_timeouts: { type: Map, of: Number, default: {} },
   has_code_exec: {
     type: Number,
     enum: Object.values(CodePermission).filter(value => typeof value === 'number'),
@@ -36,6 +41,11 @@ agentSchema.methods.apiRepresentation = function() {
     has_tools: this.has_tools || 0,
     has_code_exec: this.has_code_exec || 0,
     max_consecutive_auto_reply: this.max_consecutive_auto_reply || 10,
+    summary_threshold: this.summary_threshold || 0,
+    summary_window: this.summary_window ?? 10,
+    max_parallel_tools: this.max_parallel_tools || 4,
+    tool_timeout: this.tool_timeout || null,
+    tool_timeouts: this.tool_timeouts ? Object.fromEntries(this.tool_timeouts) : {},
     models: this.models || {},
     created_by: this.created_by || null,
     updated_by: this.updated_by || null,
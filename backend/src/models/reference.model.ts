@@ -1,5 +1,5 @@
 import mongoose, { Schema } from 'mongoose';
-import { IDataClusterDocument, IDataClusterModel, References } from "../interfaces/references.interface";
+import { BlobHandle, IDataClusterDocument, IDataClusterModel, NodeReferences, References } from "../interfaces/references.interface";
 import mongooseAutopopulate from 'mongoose-autopopulate';
 import { getObjectId, getObjectIdForList } from '../utils/utils';
 
@@ -94,6 +94,17 @@ function ensureObjectIdForUpdate(
 referencesSchema.pre('save', ensureObjectIdForSave);
 referencesSchema.pre('findOneAndUpdate', ensureObjectIdForUpdate);
 
+const blobHandleSchema = new Schema<BlobHandle>({
+    blob_id: { type: String, required: true },
+    size: { type: Number, required: true },
+    count: { type: Number, default: 0 },
+    summary: { type: String, default: '' }
+}, { _id: false });
+
+// References of a node response, which the workflow may offload to its blob store, keeping only the handle
+export const nodeReferencesSchema = referencesSchema.clone() as unknown as Schema<NodeReferences>;
+nodeReferencesSchema.add({ blob: { type: blobHandleSchema, default: undefined } });
+
 dataClusterSchema.plugin(mongooseAutopopulate);
 dataClusterSchema.pre('save', ensureObjectIdForSave);
 dataClusterSchema.pre('findOneAndUpdate', ensureObjectIdForUpdate);
@@ -28,6 +28,12 @@ const taskSchema = new Schema<ITaskDocument, ITaskModel>({
     exit_code_response_map: { type: Map, of: Number, default: null },
     start_node: { type: String, default: null },
     node_end_code_routing: { type: Map, of: Map, default: null },
+    parallel_nodes: { type: Map, of: [String], default: null },
+    map_nodes: { type: Map, of: Schema.Types.Mixed, default: null },
+    cached_nodes: { type: [String], default: null },
+    task_timeout: { type: Number, default: null },
+    node_timeouts: { type: Map, of: Number, default: {} },
+    parallel_safe: { type: Boolean, default: true },
     max_attempts: { type: Number, default: 1 },
     required_apis: { type: [String], default: null },
     agent: { 
@@ -67,6 +73,12 @@ taskSchema.methods.apiRepresentation = function (this: ITaskDocument) {
         node_end_code_routing: this.node_end_code_routing ? Object.fromEntries(
             Array.from(this.node_end_code_routing.entries()).map(([key, value]) => [key, Object.fromEntries(value)])
         ) : null,
+        parallel_nodes: this.parallel_nodes ? Object.fromEntries(this.parallel_nodes) : null,
+        map_nodes: this.map_nodes ? Object.fromEntries(this.map_nodes) : null,
+        cached_nodes: this.cached_nodes || null,
+        task_timeout: this.task_timeout || null,
+        node_timeouts: this.node_timeouts ? Object.fromEntries(this.node_timeouts) : {},
+        parallel_safe: this.parallel_safe ?? true,
         data_cluster: this.data_cluster || null,
         max_attempts: this.max_attempts || 1,
         agent: this.agent ? (this.agent._id || this.agent) : null,
@@ -1,6 +1,6 @@
 import mongoose, { Schema } from 'mongoose';
 import { ExecutionHistoryItem, ITaskResultDocument, ITaskResultModel, NodeResponse } from '../interfaces/taskResult.interface';
-import { referencesSchema } from './reference.model';
+import { nodeReferencesSchema } from './reference.model';
 import mongooseAutopopulate from 'mongoose-autopopulate';
 import { getObjectId, getObjectIdForList } from '../utils/utils';
 import { EncryptionService } from '../utils/encrypt.utils';
@@ -18,7 +18,7 @@ const nodeResponseSchema = new Schema<NodeResponse>({
   node_name: { type: String, required: true },
   execution_order: { type: Number, required: true },
   exit_code: { type: Number },
-  references: { type: referencesSchema, default: () => ({}) }
+  references: { type: nodeReferencesSchema, default: () => ({}) }
 });
 
 // Node middleware remains the same
@@ -7,6 +7,8 @@ import { IChatThreadDocument, IChatThreadModel } from '../interfaces/thread.inte
 const chatThreadSchema = new Schema<IChatThreadDocument, IChatThreadModel>({
     name: { type: String },
     messages: [{ type: Schema.Types.ObjectId, ref: 'Message' }],
+    summary: { type: String },
+    summarized_messages: { type: Number, default: 0 },
     created_by: { type: Schema.Types.ObjectId, ref: 'User', required: true, autopopulate: true },
     updated_by: { type: Schema.Types.ObjectId, ref: 'User', required: true, autopopulate: true }
 }, {
@@ -21,6 +23,8 @@ chatThreadSchema.methods.apiRepresentation = function (this: IChatThreadDocument
         id: this._id,
         name: this.name || null,
         messages: this.messages || [],
+        summary: this.summary || null,
+        summarized_messages: this.summarized_messages || 0,
         created_by: this.created_by ? (this.created_by._id || this.created_by) : null,
         updated_by: this.updated_by ? (this.updated_by._id || this.updated_by) : null,
         createdAt: this.createdAt || null,
@@ -5,7 +5,7 @@ import { IMessageDocument } from '../interfaces/message.interface';
 import auth from '../middleware/auth.middleware';
 import { AuthRequest } from '../interfaces/auth.interface';
 import { createRoutes } from '../utils/routeGenerator';
-import { createChat, createMessageInChat, updateChat } from '../utils/chat.utils';
+import { createChat, createMessageInChat, createMessagesInThread, updateChat } from '../utils/chat.utils';
 import Logger from '../utils/logger';
 import rateLimiterMiddleware from '../middleware/rateLimiter.middleware';
 import { Types } from 'mongoose';
@@ -46,6 +46,33 @@ customRouter.patch('/:chatId/add_message', async (req: AuthRequest, res: Respons
     res.status(500).json({ message: (error as Error).message, stack: (error as Error).stack });
   }
 });
+customRouter.patch('/:chatId/add_messages', async (req: AuthRequest, res: Response) => {
+  const { chatId } = req.params;
+  const messages: Partial<IMessageDocument>[] = req.body.messages;
+  const threadId = req.body.threadId;
+  const userId = req.effectiveUserId;
+
+  try {
+    if (!userId) {
+      return res.status(401).json({ message: 'Unauthorized' });
+    }
+    if (!chatId || !threadId || !Array.isArray(messages) || messages.length === 0) {
+      return res.status(400).json({ message: 'Chat ID, thread ID and a non-empty list of messages are required' });
+    }
+    const messageIds = await createMessagesInThread(userId, chatId, messages, threadId);
+    if (!messageIds) {
+      return res.status(500).json({ message: 'Failed to add messages' });
+    }
+
+    res.status(200).json({ message: 'Messages added successfully', message_ids: messageIds });
+  } catch (error) {
+    Logger.error('Error in add_messages route:', {
+      error: (error as Error).message,
+      stack: (error as Error).stack
+    });
+    res.status(500).json({ message: (error as Error).message, stack: (error as Error).stack });
+  }
+});
 customRouter.patch('/:chatId/add_thread', async (req: AuthRequest, res: Response) => {
   const { chatId } = req.params;
   const { threadId } = req.body;
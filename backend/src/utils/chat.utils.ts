@@ -11,6 +11,7 @@ import { PopulationService } from './population.utils';
 import { createChatThread, updateChatThread } from './thread.utils';
 import { IChatThread } from '../interfaces/thread.interface';
 import { ChatThread } from '../models/thread.model';
+import Message from '../models/message.model';
 
 const popService = new PopulationService()
 
@@ -239,6 +240,52 @@ export async function createMessageInChat(
     }
 }
 
+export async function createMessagesInThread(
+    userId: string,
+    chatId: string,
+    messagesData: Partial<IMessageDocument>[],
+    threadId: string,
+): Promise<string[] | null> {
+    // Messages are created one by one so they keep the order they were generated in. MongoDB
+    // runs standalone in the compose files, without transactions, so a failed write deletes the
+    // messages created so far: either every message is stored and appended to the thread, or none.
+    const messageIds: Types.ObjectId[] = [];
+    try {
+        Logger.debug(`createMessagesInThread called for chat ${chatId} with ${messagesData.length} messages`);
+
+        for (const messageData of messagesData) {
+            const messageDoc = await createMessage(messageData, userId, chatId);
+            if (!messageDoc) {
+                throw new Error('Failed to create message');
+            }
+            messageIds.push(messageDoc._id);
+        }
+
+        const thread = await ChatThread.findByIdAndUpdate(
+            threadId,
+            {
+                $push: { 'messages': { $each: messageIds } },
+                $set: { updated_by: new Types.ObjectId(userId) },
+            },
+            { new: true }
+        );
+        if (!thread) {
+            throw new Error('Failed to update chat thread');
+        }
+
+        Logger.debug(`${messageIds.length} messages added to chat ${chatId}`);
+        return messageIds.map(id => id.toString());
+    } catch (error) {
+        Logger.error('Error in createMessagesInThread:', error);
+        if (messageIds.length) {
+            await Message.deleteMany({ _id: { $in: messageIds } }).catch(rollbackError =>
+                Logger.error('Error deleting messages of failed createMessagesInThread:', rollbackError)
+            );
+        }
+        return null;
+    }
+}
+
 function checkAndUpdateChanges(original: any, updated: any, changeHistoryData: any, field: string): void {
     if (updated[field] && getObjectId(updated[field]).toString() !== getObjectId(original[field]).toString()) {
         changeHistoryData[`previous_${field}`] = original[field];
@@ -1,6 +1,6 @@
 import mongoose, { Model, Document, Types } from 'mongoose';
 import { Embeddable } from '../interfaces/embeddingChunk.interface';
-import { DataClusterHolder, References } from '../interfaces/references.interface';
+import { DataClusterHolder, NodeReferences, References } from '../interfaces/references.interface';
 import Logger from './logger';
 import { ChatThread } from '../models/thread.model';
 import { IChatThreadDocument } from '../interfaces/thread.interface';
@@ -515,8 +515,8 @@ export class PopulationService {
         return result
     }
 
-    private async populateReferencesObject(references: References, userId: string | Types.ObjectId): Promise<References> {
-        const populatedRefs: References = {};
+    private async populateReferencesObject(references: NodeReferences, userId: string | Types.ObjectId): Promise<NodeReferences> {
+        const populatedRefs: NodeReferences = {};
         Logger.debug('Starting populateReferencesObject:', { userId, references });
 
         for (const [refType, modelName] of Object.entries(ReferenceTypeModelMap)) {
@@ -529,6 +529,10 @@ export class PopulationService {
                 );
             }
         }
+        // Offloaded node references keep their blob handle
+        if (references.blob) {
+            populatedRefs.blob = references.blob;
+        }
 
         return populatedRefs;
     }
@@ -212,9 +212,11 @@ async function processNodeReferences(
       node_name: nodeResponse.node_name,
       execution_order: nodeResponse.execution_order,
       exit_code: nodeResponse.exit_code,
-      references: nodeResponse.references ? 
-        await processReferences(nodeResponse.references, userId) : 
-        undefined
+      references: nodeResponse.references ? {
+        ...await processReferences(nodeResponse.references, userId),
+        // Offloaded references only carry their blob handle
+        ...(nodeResponse.references.blob ? { blob: nodeResponse.references.blob } : {})
+      } : undefined
     };
 
     return cleanNodeResponse;
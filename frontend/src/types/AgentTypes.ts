@@ -21,6 +21,11 @@ export interface AliceAgent extends BaseDatabaseObject {
   has_tools: ToolPermission;
   has_code_exec: CodePermission;
   max_consecutive_auto_reply?: number;
+  summary_threshold?: number;
+  summary_window?: number;
+  max_parallel_tools?: number;
+  tool_timeout?: number | null;
+  tool_timeouts?: { [key: string]: number };
   models?: { [key in ModelType]?: AliceModel };
 }
 
@@ -31,6 +36,11 @@ export const convertToAliceAgent = (data: AliceAgent): AliceAgent => ({
   has_tools: data.has_tools || 0,
   has_code_exec: data.has_code_exec || 0,
   max_consecutive_auto_reply: data.max_consecutive_auto_reply,
+  summary_threshold: data.summary_threshold,
+  summary_window: data.summary_window,
+  max_parallel_tools: data.max_parallel_tools,
+  tool_timeout: data.tool_timeout ?? null,
+  tool_timeouts: data.tool_timeouts || {},
   models: data.models || {},
 });
 
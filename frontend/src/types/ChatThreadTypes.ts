@@ -4,6 +4,8 @@ import { convertToPopulatedMessage, PopulatedMessage } from './MessageTypes';
 export interface ChatThread extends BaseDatabaseObject {
     name?: string;
     messages: string[];
+    summary?: string;
+    summarized_messages?: number;
 }
 
 export interface PopulatedChatThread extends Omit<ChatThread, 'messages'> {
@@ -15,6 +17,8 @@ export const convertToChatThread = (data: any): ChatThread => {
         ...convertToBaseDatabaseObject(data),
         name: data?.name || '',
         messages: data?.messages || [],
+        summary: data?.summary,
+        summarized_messages: data?.summarized_messages || 0,
     };
 }
 
@@ -23,6 +27,8 @@ export const convertToPopulatedChatThread = (data: any): PopulatedChatThread =>
         ...convertToBaseDatabaseObject(data),
         name: data?.name || '',
         messages: (data?.messages || []).map(convertToPopulatedMessage),
+        summary: data?.summary,
+        summarized_messages: data?.summarized_messages || 0,
     };
 }
 export interface ChatThreadComponentProps extends EnhancedComponentProps<ChatThread | PopulatedChatThread> {
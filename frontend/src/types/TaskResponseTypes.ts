@@ -8,12 +8,20 @@ export interface ExecutionHistoryItem {
     exit_code?: number;
 }
 
+// Handle of node references offloaded to the workflow's blob store
+export interface BlobHandle {
+    blob_id: string;
+    size: number;
+    count: number;
+    summary: string;
+}
+
 export interface NodeResponse extends ExecutionHistoryItem {
-    references: DataCluster;
+    references: DataCluster & { blob?: BlobHandle };
 }
 
 export interface PopulatedNodeResponse extends Omit<NodeResponse, 'references'> {
-    references: PopulatedDataCluster;
+    references: PopulatedDataCluster & { blob?: BlobHandle };
 }
 
 interface EntityMetadata {
@@ -78,7 +86,10 @@ export const convertToPopulatedTaskResponse = (data: any): PopulatedTaskResponse
         execution_history: data?.execution_history || [],
         node_references: data?.node_references ? data.node_references.map((node: any) => ({
                 ...node,
-                references: convertToDataCluster(node.references),
+                references: {
+                    ...convertToDataCluster(node.references),
+                    blob: node.references?.blob,
+                },
             })
         ) : [],
     };
@@ -24,6 +24,12 @@ export type RouteMapTuple = [string | null, boolean];
 export type RouteMap = { [key: number]: RouteMapTuple };
 export type TasksEndCodeRouting = { [key: string]: RouteMap };
 
+export type MapNodeConfig = {
+  input_variable: string;
+  item_variable: string;
+  max_concurrency?: number;
+};
+
 export interface AliceTask extends BaseDatabaseObject {
   task_name: string;
   task_description: string;
@@ -37,6 +43,12 @@ export interface AliceTask extends BaseDatabaseObject {
   start_node?: string | null;
   required_apis?: ApiType[] | null;
   node_end_code_routing?: TasksEndCodeRouting | null;
+  parallel_nodes?: { [key: string]: string[] } | null;
+  map_nodes?: { [key: string]: MapNodeConfig } | null;
+  cached_nodes?: string[] | null;
+  task_timeout?: number | null;
+  node_timeouts?: { [key: string]: number };
+  parallel_safe?: boolean;
   user_checkpoints?: { [key: string]: UserCheckpoint };
   data_cluster?: string;
   recursive: boolean;
@@ -63,6 +75,12 @@ export const convertToAliceTask = (data: any): AliceTask => {
     start_node: data?.start_node || null,
     required_apis: data?.required_apis || null,
     node_end_code_routing: data?.node_end_code_routing || null,
+    parallel_nodes: data?.parallel_nodes || null,
+    map_nodes: data?.map_nodes || null,
+    cached_nodes: data?.cached_nodes || null,
+    task_timeout: data?.task_timeout || null,
+    node_timeouts: data?.node_timeouts || {},
+    parallel_safe: data?.parallel_safe ?? true,
     max_attempts: data?.max_attempts || undefined,
     agent: data?.agent || null,
     user_checkpoints: data?.user_checkpoints || {},
@@ -85,6 +103,12 @@ export const convertToPopulatedTask = (data: any): PopulatedTask => {
     start_node: data?.start_node || null,
     required_apis: data?.required_apis || null,
     node_end_code_routing: data?.node_end_code_routing || null,
+    parallel_nodes: data?.parallel_nodes || null,
+    map_nodes: data?.map_nodes || null,
+    cached_nodes: data?.cached_nodes || null,
+    task_timeout: data?.task_timeout || null,
+    node_timeouts: data?.node_timeouts || {},
+    parallel_safe: data?.parallel_safe ?? true,
     max_attempts: data?.max_attempts || undefined,
     agent: data?.agent || null,
     user_checkpoints: data?.user_checkpoints || {},
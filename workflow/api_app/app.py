@@ -6,10 +6,12 @@ from concurrent.futures import ThreadPoolExecutor
 from workflow.db_app import ContainerAPI, DB_STRUCTURE, token_validation_middleware
 from workflow.api_app.middleware import add_cors_middleware, auth_middleware
 from workflow.api_app.routes import (
-    health_route, task_execute, chat_response, db_init, file_transcript,
+    health_route, task_execute, task_batch_execute, chat_response, db_init, file_transcript,
     task_resume, chat_resume, validate_apis
 )
-from workflow.util import LOGGER
+from workflow.util import LOGGER, BLOB_STORE
+from workflow.core.tasks import NODE_RESULT_CACHE, CHECKPOINT_STORE
+from workflow.core.api import CLIENT_REGISTRY
 from workflow.test.component_tests import TestEnvironment, DBTests
 from workflow.api_app.util.queue_manager import QueueManager
 
@@ -34,6 +36,10 @@ async def lifespan(app: FastAPI):
 
     # Initialize core services
     db_app = ContainerAPI()
+    await db_app.open_session()
+    await db_app.entity_cache.initialize()
+    await NODE_RESULT_CACHE.initialize()
+    await CHECKPOINT_STORE.initialize()
     thread_pool = ThreadPoolExecutor()
     app.state.db_app = db_app
 
@@ -46,6 +52,7 @@ async def lifespan(app: FastAPI):
     app.state.request_processor = asyncio.create_task(
         queue_manager.process_requests()
     )
+    app.state.blob_collector = asyncio.create_task(BLOB_STORE.collect_periodically())
 
     # Run initial tests
     await run_initial_tests(app)
@@ -55,7 +62,13 @@ async def lifespan(app: FastAPI):
     # Cleanup
     thread_pool.shutdown()
     app.state.request_processor.cancel()
+    app.state.blob_collector.cancel()
     await queue_manager.cleanup()
+    await db_app.entity_cache.cleanup()
+    await NODE_RESULT_CACHE.cleanup()
+    await CHECKPOINT_STORE.cleanup()
+    await CLIENT_REGISTRY.close()
+    await db_app.close_session()
 
 # Initialize FastAPI app
 WORKFLOW_APP = FastAPI(lifespan=lifespan)
@@ -100,7 +113,7 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
         })()
 
         # Validate token using the mock request
-        validation = token_validation_middleware(db_app)(mock_request)
+        validation = await token_validation_middleware(db_app)(mock_request)
         if not validation["valid"]:
             await websocket.close(code=1008, reason=validation["message"])
             return
@@ -126,6 +139,7 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
 # Include routes
 WORKFLOW_APP.include_router(health_route)
 WORKFLOW_APP.include_router(task_execute)
+WORKFLOW_APP.include_router(task_batch_execute)
 WORKFLOW_APP.include_router(chat_response)
 WORKFLOW_APP.include_router(db_init)
 WORKFLOW_APP.include_router(file_transcript)
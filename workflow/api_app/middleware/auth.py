@@ -34,7 +34,7 @@ async def auth_middleware(request: Request, call_next):
         raise HTTPException(status_code=503, detail="Service not ready. Please try again later.")
 
     # Use token_validation_middleware
-    validation = token_validation_middleware(db_app)(request)
+    validation = await token_validation_middleware(db_app)(request)
     LOGGER.debug(f"Token validation result: {validation}")
     if not validation["valid"]:
         LOGGER.error(f"Token validation failed: {validation['message']}")
@@ -1,10 +1,11 @@
 from .chat_response import router as chat_response
 from .health_report import router as health_route
 from .task_execute import router as task_execute
+from .task_batch_execute import router as task_batch_execute
 from .db_init import router as db_init
 from .file_transcript import router as file_transcript
 from .task_resume import router as task_resume
 from .chat_resume import router as chat_resume
 from .validate_apis import router as validate_apis
 
-__all__ = ['chat_response', 'health_route', 'task_execute', 'db_init', 'file_transcript', 'task_resume', 'chat_resume', 'validate_apis']
\ No newline at end of file
+__all__ = ['chat_response', 'health_route', 'task_execute', 'task_batch_execute', 'db_init', 'file_transcript', 'task_resume', 'chat_resume', 'validate_apis']
\ No newline at end of file
@@ -1,11 +1,45 @@
+import asyncio
+from typing import Dict
 from fastapi import APIRouter, HTTPException, Depends
 from workflow.api_app.util.utils import deep_api_check, ChatResponseRequest
 from workflow.api_app.util.dependencies import get_db_app, get_queue_manager
 from workflow.core import AliceChat, ChatThread
-from workflow.util import LOGGER
+from workflow.core.api import APIManager
+from workflow.db_app.app import MessageOutbox, BackendAPI
+from workflow.util import LOGGER, tracing, stream_events
 
 router = APIRouter()
 
+# Summaries being folded, by thread id: a thread is summarized by one job at a time
+SUMMARY_JOBS: Dict[str, asyncio.Task] = {}
+
+def schedule_thread_summary(db_app: BackendAPI, api_manager: APIManager, chat_data: AliceChat, thread_data: ChatThread, thread_id: str):
+    """
+    Folds the older messages of the thread into its summary in the background, after the turn
+    was answered, if it grew past the agent's summary threshold.
+    """
+    if thread_id in SUMMARY_JOBS:
+        return
+    agent = chat_data.alice_agent
+    if not thread_data.messages_to_summarize(agent.summary_threshold, agent.summary_window):
+        return
+    # db_app serves other users' requests meanwhile, so the job stores the summary as this one
+    user_token = db_app.user_data.get('user_token')
+
+    async def summarize():
+        try:
+            # Not part of the turn's response: nothing to stream
+            with stream_events(None):
+                if await chat_data.update_thread_summary(api_manager, thread_data):
+                    await db_app.update_chat_thread_summary(thread_id, thread_data.summary, thread_data.summarized_messages, user_token)
+                    LOGGER.info(f'Folded thread {thread_id} into its summary, up to message {thread_data.summarized_messages}')
+        except Exception as e:
+            LOGGER.error(f'Error summarizing thread {thread_id}: {e}', exc_info=True)
+
+    job = asyncio.create_task(summarize())
+    SUMMARY_JOBS[thread_id] = job
+    job.add_done_callback(lambda _: SUMMARY_JOBS.pop(thread_id, None))
+
 @router.post("/chat_response")
 async def chat_response(
     request: ChatResponseRequest,
@@ -31,7 +65,9 @@ async def chat_response(
 
     Note:
         This function performs deep API checks and logs warnings if any are found.
-        It also serializes and stores each generated message individually.
+        Generated messages are stored together, with one bulk request per turn.
+        Only the thread's summary and its messages not yet folded into it are sent to the
+        model; older messages are folded in the background once the turn is stored.
     """
     if enqueue:
         LOGGER.info(f'Enqueuing chat response for chat_id: {request.chat_id}')
@@ -68,24 +104,24 @@ async def chat_response(
             if api_check_result["status"] == "warning":
                 LOGGER.warning(f'API Warning: {api_check_result["warnings"]}')
 
-            chat_data.messages = thread_data.messages
+            chat_data.load_thread(thread_data)
             # TODO: Add current time to the available data
-            responses = await chat_data.generate_response(api_manager, user_data=db_app.user_data.get('user_obj'))
+            # Spans of the turn are exported with the trace, see TRACE_EXPORT_DIR
+            async with tracing(f"chat_{request.chat_id}"):
+                responses = await chat_data.generate_response(api_manager, user_data=db_app.user_data.get('user_obj'))
 
             LOGGER.debug(f'Responses: {responses}')
 
-            # Store messages and task results in order
+            # Store messages and task results in order, in a single request
             if responses:
-                stored_responses = []
-                for response in responses:
-                    stored_chat = await db_app.store_chat_message(request.chat_id, request.thread_id, response)
-                    if not stored_chat:
-                        LOGGER.error(f"Failed to store message: {response} in chat_id {request.chat_id}")
-                    else:
-                        stored_responses.append(stored_chat)
-
-                LOGGER.debug(f'Stored messages: {responses}')
-                return {"status": "success", "messages": stored_responses}
+                outbox = MessageOutbox(db_app=db_app, chat_id=request.chat_id, thread_id=request.thread_id)
+                outbox.extend(responses)
+                stored_messages = await outbox.flush()
+
+                LOGGER.debug(f'Stored messages: {stored_messages}')
+                thread_data.messages.extend(responses)
+                schedule_thread_summary(db_app, api_manager, chat_data, thread_data, request.thread_id)
+                return {"status": "success", "messages": [message.model_dump(by_alias=True) for message in stored_messages]}
 
             return {"status": "no responses generated"}
         except Exception as e:
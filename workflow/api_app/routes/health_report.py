@@ -3,6 +3,7 @@ from workflow.test.component_tests import APITests, TestEnvironment, DBTests
 from workflow.db_app.initialization import DBStructure
 from workflow.api_app.util.dependencies import get_db_app, get_queue_manager
 from workflow.api_app.middleware.auth import auth_middleware
+from workflow.core.api import CLIENT_REGISTRY
 
 router = APIRouter()
 
@@ -16,6 +17,36 @@ async def health_check() -> dict:
     """
     return {"status": "OK", "message": "Workflow service is healthy"}
 
+@router.get("/health/queue")
+async def queue_health_check(queue_manager=Depends(get_queue_manager)) -> dict:
+    """
+    Reports the live state of the request queue's worker pool.
+
+    Returns:
+        dict: Active, waiting and queued job counts, globally and per endpoint.
+    """
+    return {"status": "OK", "queue": await queue_manager.get_queue_stats()}
+
+@router.get("/health/backend")
+async def backend_health_check(db_app=Depends(get_db_app)) -> dict:
+    """
+    Reports the state of the connection pool shared by all backend requests and of the entity cache.
+
+    Returns:
+        dict: Pool limits, request and connection counters, in-use/idle connections, and cache hit counters.
+    """
+    return {"status": "OK", "pool": db_app.get_pool_stats(), "entity_cache": db_app.entity_cache.get_stats()}
+
+@router.get("/health/clients")
+async def clients_health_check() -> dict:
+    """
+    Reports the SDK and HTTP clients shared by the API engines.
+
+    Returns:
+        dict: Open clients, in total and per provider, and created, reused and evicted counters.
+    """
+    return {"status": "OK", "clients": CLIENT_REGISTRY.get_stats()}
+
 @router.get("/health/api")
 async def api_health_check(
     request: Request,
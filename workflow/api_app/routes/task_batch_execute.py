@@ -0,0 +1,106 @@
+import asyncio, time
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends
+from workflow.util import LOGGER, get_traceback, emit_event, stream_events
+from workflow.core import AliceTask
+from workflow.api_app.util.utils import TaskBatchExecutionRequest, deep_api_check
+from workflow.api_app.util.dependencies import get_db_app, get_queue_manager
+from workflow.api_app.routes.task_execute import run_and_store_task, store_failed_task_response
+
+router = APIRouter()
+
+@router.post("/execute_task_batch")
+async def execute_task_batch_endpoint(
+    request: TaskBatchExecutionRequest,
+    db_app=Depends(get_db_app),
+    queue_manager=Depends(get_queue_manager),
+    enqueue: bool = True
+) -> dict:
+    """
+    Execute a task once per set of inputs and store a response for each run.
+
+    The task and API manager are loaded and checked once for the whole batch, then the
+    inputs are run concurrently, at most `max_concurrency` at a time. Each finished run is
+    streamed as a `batch_item_completed` event, and a summary of the batch is returned.
+
+    Args:
+        request (TaskBatchExecutionRequest): The request containing task ID, inputs and concurrency.
+        db_app: The database application instance (injected dependency).
+
+    Returns:
+        dict: The batch summary, with the stored task response IDs in the order of the inputs.
+
+    Raises:
+        ValueError: If the task can't be loaded. The batch fails as a whole, without storing
+            a response per input.
+
+    Note:
+        - A failing run is stored as a failed task response and doesn't stop the others.
+        - `max_concurrency` is capped to BATCH_MAX_CONCURRENCY_LIMIT.
+    """
+    if enqueue:
+        LOGGER.info(f'Enqueuing task batch: {request.taskId} ({len(request.inputs)} inputs)')
+        task_data = {
+            "taskId": request.taskId,
+            "inputs": request.inputs,
+            "max_concurrency": request.max_concurrency,
+            "user_data": db_app.user_data.get('user_obj', {})
+        }
+        enqueued_task_id = await queue_manager.enqueue_request(
+            endpoint="/execute_task_batch",
+            data=task_data
+        )
+        return {"task_id": enqueued_task_id}
+
+    # Process the batch immediately (called by QueueManager)
+    LOGGER.info(f'Processing task batch: {request.taskId} ({len(request.inputs)} inputs)')
+    start_time = time.time()
+    user_data = db_app.user_data.get('user_obj', {})
+    task: Optional[AliceTask] = await db_app.get_task(request.taskId)
+    if not task:
+        raise ValueError(f"Task with ID {request.taskId} not found")
+    api_manager = await db_app.api_setter()
+    api_check_result = await deep_api_check(task, api_manager)
+    if api_check_result["status"] == "warning":
+        LOGGER.warning(f'API Warning: {api_check_result["warnings"]}')
+
+    slots = asyncio.Semaphore(request.max_concurrency)
+
+    async def run_item(index: int, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        inputs_copy = {**inputs, 'user_data': user_data}
+        async with slots:
+            try:
+                # Each run gets its own copy: tasks are mutated while they run
+                item_task = task.model_copy(deep=True)
+                # Only the batch's own events are streamed, not the turns of every run
+                with stream_events(None):
+                    db_result = await run_and_store_task(db_app, item_task, api_manager, inputs_copy)
+            except Exception as e:
+                LOGGER.error(f'Error in batch item {index}: {e}\nTraceback: {get_traceback()}')
+                db_result = await store_failed_task_response(db_app, request.taskId, task, inputs_copy, e)
+        db_result = db_result or {}
+        await emit_event(
+            "batch_item_completed",
+            task_id=request.taskId,
+            index=index,
+            task_response_id=db_result.get('_id'),
+            status=db_result.get('status'),
+            result_code=db_result.get('result_code'),
+        )
+        return db_result
+
+    results: List[Dict[str, Any]] = await asyncio.gather(
+        *(run_item(index, inputs) for index, inputs in enumerate(request.inputs))
+    )
+    statuses = [result.get('status') for result in results]
+    summary = {
+        "task_id": request.taskId,
+        "total": len(results),
+        "completed": statuses.count("complete"),
+        "failed": statuses.count("failed"),
+        "pending": statuses.count("pending"),
+        "task_response_ids": [result.get('_id') for result in results],
+        "duration": time.time() - start_time,
+    }
+    LOGGER.info(f'Task batch {request.taskId} finished: {summary}')
+    return summary
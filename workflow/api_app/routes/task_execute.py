@@ -1,8 +1,10 @@
+from typing import Any, Dict, Optional
 from fastapi import APIRouter, Depends
-from workflow.util import LOGGER
-from workflow.core import AliceTask
+from workflow.util import LOGGER, get_traceback, tracing
+from workflow.core import AliceTask, APIManager
 from workflow.api_app.util import TaskExecutionRequest
 from workflow.core import TaskResponse
+from workflow.core.tasks import CHECKPOINT_STORE, checkpointing
 from workflow.api_app.util.utils import deep_api_check
 from workflow.api_app.util.dependencies import get_db_app, get_queue_manager
 
@@ -77,29 +79,42 @@ async def execute_task_endpoint(
             LOGGER.debug(f'task_inputs: {inputs_copy}')
             LOGGER.debug(f'task type: {type(task)}')
 
-            result = await task.run(api_manager=api_manager, **inputs_copy)
-            if not result:
-                raise ValueError(f"Task execution failed for task ID {taskId}")
-
-            # Process and update file content references
-            LOGGER.debug(f'task_result: {result.model_dump()}')
-            LOGGER.debug(f'type: {type(result)}')
-            db_result = await db_app.create_entity_in_db('task_responses', result.model_dump(by_alias=True))
-            return db_result
+            return await run_and_store_task(db_app, task, api_manager, inputs_copy)
         except Exception as e:
-            import traceback
-            LOGGER.error(f'Error: {e}\nTraceback: {traceback.format_exc()}')
-            result = TaskResponse(
-                task_id=taskId,
-                task_name=task.task_name if task else "Unknown",
-                task_description=task.task_description if task else "Task execution failed",
-                status="failed",
-                result_code=1,
-                task_outputs=None,
-                task_inputs=inputs_copy,
-                result_diagnostic=str(f'Error: {e}\nTraceback: {traceback.format_exc()}'),
-                usage_metrics=None,
-                execution_history=None
-            )
-            db_result = await db_app.create_entity_in_db('task_responses', result.model_dump(by_alias=True))
-            return db_result
\ No newline at end of file
+            LOGGER.error(f'Error: {e}\nTraceback: {get_traceback()}')
+            return await store_failed_task_response(db_app, taskId, task, inputs_copy, e)
+
+async def run_and_store_task(db_app, task: AliceTask, api_manager: APIManager, inputs: Dict[str, Any]) -> dict:
+    """Runs the task with the given inputs and stores its response, returning the stored response."""
+    async with tracing(f"task_{task.id}") as trace:
+        with checkpointing(task.id) as scope:
+            result = await task.run(api_manager=api_manager, **inputs)
+    if not result:
+        raise ValueError(f"Task execution failed for task ID {task.id}")
+    if trace:
+        result.usage_metrics = {**(result.usage_metrics or {}), "trace": trace.summary()}
+
+    # Process and update file content references
+    LOGGER.debug(f'task_result: {result.model_dump()}')
+    LOGGER.debug(f'type: {type(result)}')
+    db_result = await db_app.create_entity_in_db('task_responses', result.model_dump(by_alias=True))
+    # A paused task is resumed from its checkpoint, stored under the response id
+    if result.status == "pending" and scope.checkpoint and db_result and db_result.get('_id'):
+        await CHECKPOINT_STORE.save(db_result['_id'], scope.checkpoint)
+    return db_result
+
+async def store_failed_task_response(db_app, task_id: str, task: Optional[AliceTask], inputs: Dict[str, Any], error: Exception) -> dict:
+    """Stores a failed response for a task that could not be run, returning the stored response."""
+    result = TaskResponse(
+        task_id=task_id,
+        task_name=task.task_name if task else "Unknown",
+        task_description=task.task_description if task else "Task execution failed",
+        status="failed",
+        result_code=1,
+        task_outputs=None,
+        task_inputs=inputs,
+        result_diagnostic=str(f'Error: {error}\nTraceback: {get_traceback()}'),
+        usage_metrics=None,
+        execution_history=None
+    )
+    return await db_app.create_entity_in_db('task_responses', result.model_dump(by_alias=True))
\ No newline at end of file
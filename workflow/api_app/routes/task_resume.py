@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from workflow.api_app.util.dependencies import get_db_app, get_queue_manager
 from workflow.api_app.util.utils import TaskResumeRequest, deep_api_check
-from workflow.util import LOGGER
+from workflow.util import LOGGER, tracing
 from workflow.core import AliceTask, TaskResponse, APIManager
+from workflow.core.tasks import CHECKPOINT_STORE, checkpointing
 
 router = APIRouter()
 
@@ -37,8 +38,17 @@ async def resume_task_endpoint(
                     detail=f"Task response with ID {request.task_response_id} not found"
                 )
 
+            # Checkpoint written when the task paused, if it covers the stored nodes. The history is
+            # then restored from it, so only the paused node, answered by the user, is read from
+            # the response
+            stored_nodes = task_response.get('node_references') or []
+            checkpoint = await CHECKPOINT_STORE.load(request.task_response_id)
+            if checkpoint and not checkpoint.applies_to(task_response.get('task_id'), len(stored_nodes)):
+                LOGGER.warning(f'Ignoring stale checkpoint of task response {request.task_response_id}')
+                checkpoint = None
+
             # Convert to TaskResponse object
-            original_response = TaskResponse(**task_response)
+            original_response = TaskResponse(**{**task_response, 'node_references': stored_nodes[-1:] if checkpoint else stored_nodes})
 
             # Validate task response is in a resumable state
             if original_response.status != "pending":
@@ -77,10 +87,17 @@ async def resume_task_endpoint(
             LOGGER.debug(f'Original response: {original_response.model_dump()}')
             LOGGER.debug(f'Combined inputs: {inputs}')
 
-            result = await task.run_from_task_response(
-                task_response=temp_task_response,
-                api_manager=api_manager,
-            )
+            async with tracing(f"task_{task_id}") as trace:
+                with checkpointing(task.id, key=request.task_response_id):
+                    result = await task.run_from_task_response(
+                        task_response=temp_task_response,
+                        checkpoint=checkpoint,
+                        api_manager=api_manager,
+                    )
+            if trace and result:
+                result.usage_metrics = {**(result.usage_metrics or {}), "trace": trace.summary()}
+            if result and result.status != "pending":
+                await CHECKPOINT_STORE.delete(request.task_response_id)
 
             if not result:
                 raise ValueError(f"Task resumption failed for task response ID {request.task_response_id}")
@@ -0,0 +1,180 @@
+import asyncio
+from abc import ABC, abstractmethod
+import os
+import socket
+import time
+from typing import Any, Optional, Set
+from pydantic import BaseModel
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError
+
+from workflow.util import LOGGER, get_traceback
+
+class QueueEntry(BaseModel):
+    """A raw job pulled from a queue backend, before it is parsed into a QueueMessage."""
+    entry_id: Optional[str] = None
+    payload: bytes
+    deliveries: int = 1
+
+class QueueBackend(BaseModel, ABC):
+    """
+    Transport used by the QueueManager to move jobs between the HTTP routes and the workers.
+
+    Backends are responsible for enqueueing serialized messages, handing them to the
+    worker loop one at a time and acknowledging them once `handle_request` has finished.
+    """
+    redis_client: Optional[aioredis.Redis] = None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    async def initialize(self, redis_client: aioredis.Redis):
+        self.redis_client = redis_client
+
+    @abstractmethod
+    async def enqueue(self, payload: str):
+        pass
+
+    @abstractmethod
+    async def next_message(self) -> QueueEntry:
+        pass
+
+    async def ack(self, entry: QueueEntry):
+        pass
+
+    @abstractmethod
+    async def depth(self) -> int:
+        pass
+
+    async def cleanup(self):
+        pass
+
+class ListQueueBackend(QueueBackend):
+    """
+    Single-list backend using LPUSH/BRPOP. Jobs are removed from Redis as soon as they are
+    popped, so a worker crash loses whatever it was running.
+    """
+    queue_name: str = "request_queue"
+
+    async def enqueue(self, payload: str):
+        await self.redis_client.lpush(self.queue_name, payload)
+
+    async def next_message(self) -> QueueEntry:
+        _, message = await self.redis_client.brpop(self.queue_name)
+        return QueueEntry(payload=message)
+
+    async def depth(self) -> int:
+        return await self.redis_client.llen(self.queue_name)
+
+class StreamQueueBackend(QueueBackend):
+    """
+    Redis Streams backend with a consumer group shared by every workflow replica.
+
+    Each replica reads with its own consumer name, so jobs are spread across replicas and
+    stay in the group's pending list until they are acknowledged. Entries left pending by a
+    crashed replica are reclaimed with XAUTOCLAIM once they have been idle for
+    `claim_idle_ms`. Entries still being worked on are periodically re-claimed by their
+    owner to reset their idle time, so long-running jobs are not stolen.
+    """
+    stream_name: str = os.getenv("QUEUE_STREAM_NAME", "request_stream")
+    group_name: str = os.getenv("QUEUE_CONSUMER_GROUP", "workflow_workers")
+    consumer_name: str = os.getenv("QUEUE_CONSUMER_NAME", socket.gethostname())
+    claim_idle_ms: int = int(os.getenv("QUEUE_CLAIM_IDLE_MS", "60000"))
+    claim_interval: float = float(os.getenv("QUEUE_CLAIM_INTERVAL", "15"))
+    block_ms: int = 5000
+
+    in_flight: Set[str] = set()
+    claim_cursor: str = "0-0"
+    last_claim: float = 0.0
+    heartbeat_task: Optional[asyncio.Task] = None
+
+    async def initialize(self, redis_client: aioredis.Redis):
+        await super().initialize(redis_client)
+        try:
+            await self.redis_client.xgroup_create(self.stream_name, self.group_name, id="0", mkstream=True)
+            LOGGER.debug(f"Created consumer group {self.group_name} on stream {self.stream_name}")
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self.heartbeat_task = asyncio.create_task(self.heartbeat())
+        LOGGER.info(f"Consuming {self.stream_name} as {self.consumer_name} in group {self.group_name}")
+
+    async def enqueue(self, payload: str):
+        await self.redis_client.xadd(self.stream_name, {"message": payload})
+
+    async def next_message(self) -> QueueEntry:
+        while True:
+            if time.monotonic() - self.last_claim >= self.claim_interval:
+                entry = await self.reclaim_entry()
+                if entry:
+                    return entry
+
+            response = await self.redis_client.xreadgroup(
+                self.group_name, self.consumer_name, {self.stream_name: ">"}, count=1, block=self.block_ms
+            )
+            if response:
+                _, messages = response[0]
+                if messages:
+                    entry_id, fields = messages[0]
+                    return self._to_entry(entry_id, fields, 1)
+
+    async def reclaim_entry(self) -> Optional[QueueEntry]:
+        """Claims a single entry another consumer left pending for longer than claim_idle_ms."""
+        response = await self.redis_client.xautoclaim(
+            self.stream_name, self.group_name, self.consumer_name,
+            min_idle_time=self.claim_idle_ms, start_id=self.claim_cursor, count=1
+        )
+        next_cursor, messages = response[0], response[1]
+        self.claim_cursor = next_cursor.decode() if isinstance(next_cursor, bytes) else next_cursor
+        messages = [message for message in messages if message and message[1]]
+        if not messages:
+            if self.claim_cursor == "0-0":
+                # Full pass over the pending list without finding stale entries
+                self.last_claim = time.monotonic()
+            return None
+
+        entry_id, fields = messages[0]
+        pending = await self.redis_client.xpending_range(
+            self.stream_name, self.group_name, min=entry_id, max=entry_id, count=1
+        )
+        deliveries = pending[0]["times_delivered"] if pending else 1
+        LOGGER.warning(f"Reclaimed stale queue entry {entry_id} (delivery {deliveries})")
+        return self._to_entry(entry_id, fields, deliveries)
+
+    def _to_entry(self, entry_id: Any, fields: dict, deliveries: int) -> QueueEntry:
+        entry_id = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+        self.in_flight.add(entry_id)
+        payload = fields.get(b"message", fields.get("message"))
+        return QueueEntry(entry_id=entry_id, payload=payload, deliveries=deliveries)
+
+    async def ack(self, entry: QueueEntry):
+        self.in_flight.discard(entry.entry_id)
+        await self.redis_client.xack(self.stream_name, self.group_name, entry.entry_id)
+        await self.redis_client.xdel(self.stream_name, entry.entry_id)
+
+    async def heartbeat(self):
+        """Resets the idle time of the entries this consumer is still running."""
+        interval = max(self.claim_idle_ms / 3000, 1)
+        while True:
+            await asyncio.sleep(interval)
+            if not self.in_flight:
+                continue
+            try:
+                await self.redis_client.xclaim(
+                    self.stream_name, self.group_name, self.consumer_name,
+                    min_idle_time=0, message_ids=list(self.in_flight), justid=True
+                )
+            except Exception as e:
+                LOGGER.error(f"Error refreshing in-flight queue entries: {e}\n{get_traceback()}")
+
+    async def depth(self) -> int:
+        return await self.redis_client.xlen(self.stream_name)
+
+    async def cleanup(self):
+        if self.heartbeat_task:
+            self.heartbeat_task.cancel()
+
+queue_backends = {
+    "list": ListQueueBackend,
+    "streams": StreamQueueBackend,
+}
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 from uuid import uuid4
 
 from pydantic import BaseModel
@@ -9,14 +9,16 @@ from fastapi import WebSocket
 import redis.asyncio as aioredis  # Renamed to avoid conflict
 from redis.asyncio.client import PubSub
 
-from workflow.util import LOGGER, get_traceback
+from workflow.util import LOGGER, get_traceback, stream_events
+from workflow.api_app.util.queue_backends import QueueBackend, QueueEntry, queue_backends
 from workflow.api_app.routes.task_execute import execute_task_endpoint
+from workflow.api_app.routes.task_batch_execute import execute_task_batch_endpoint
 from workflow.api_app.routes.task_resume import resume_task_endpoint
 from workflow.api_app.routes.chat_resume import chat_resume
 from workflow.api_app.routes.chat_response import chat_response
 from workflow.api_app.routes.file_transcript import generate_file_transcript
 from workflow.api_app.routes.health_report import api_health_check
-from workflow.api_app.util.utils import TaskResumeRequest, TaskExecutionRequest, ChatResumeRequest, ChatResponseRequest, FileTranscriptRequest, HealthAPIRequest
+from workflow.api_app.util.utils import TaskResumeRequest, TaskExecutionRequest, TaskBatchExecutionRequest, ChatResumeRequest, ChatResponseRequest, FileTranscriptRequest, HealthAPIRequest
 from workflow.api_app.routes.validate_apis import validate_chat_apis, validate_task_apis, ValidationRequest
 
 class QueueMessage(BaseModel):
@@ -27,17 +29,56 @@ class QueueMessage(BaseModel):
 
 class QueueManager(BaseModel):
     db_app: Any
-    message_buffer: Dict[str, list] = {}
     redis_url: str = os.getenv("REDIS_URL", "redis://redis:6379/0")
     redis_client: Optional[aioredis.Redis] = None  # Renamed field
     connections: Dict[str, WebSocket] = {}
 
+    # Queue transport: "list" (LPUSH/BRPOP) or "streams" (consumer groups, shared by replicas)
+    queue_backend: str = os.getenv("QUEUE_BACKEND", "list")
+    backend: Optional[QueueBackend] = None
+    max_deliveries: int = int(os.getenv("QUEUE_MAX_DELIVERIES", "3"))
+    result_ttl: int = int(os.getenv("QUEUE_RESULT_TTL", "3600"))
+
+    # Worker pool configuration
+    max_concurrent_jobs: int = int(os.getenv("QUEUE_MAX_CONCURRENT_JOBS", "16"))
+    # Jobs pulled from Redis but not finished, running or waiting for a slot
+    max_pending_jobs: int = int(os.getenv("QUEUE_MAX_PENDING_JOBS", "64"))
+    default_endpoint_limit: int = int(os.getenv("QUEUE_MAX_JOBS_PER_ENDPOINT", "8"))
+    endpoint_limits: Dict[str, int] = {
+        "/chat_response": int(os.getenv("QUEUE_MAX_CHAT_RESPONSE_JOBS", "8")),
+        "/execute_task": int(os.getenv("QUEUE_MAX_EXECUTE_TASK_JOBS", "8")),
+        # Each batch job already runs several tasks at once
+        "/execute_task_batch": int(os.getenv("QUEUE_MAX_EXECUTE_TASK_BATCH_JOBS", "2")),
+    }
+
+    # Worker pool state
+    global_slots: Optional[asyncio.Semaphore] = None
+    pending_slots: Optional[asyncio.Semaphore] = None
+    endpoint_slots: Dict[str, asyncio.Semaphore] = {}
+    active_jobs: Dict[str, int] = {}
+    waiting_jobs: Dict[str, int] = {}
+    running_jobs: Set[asyncio.Task] = set()
+
+    # Endpoints whose incremental events (turns, token deltas, tool calls) are published while they run
+    streaming_endpoints: Set[str] = {
+        endpoint.strip() for endpoint in
+        os.getenv("QUEUE_STREAMING_ENDPOINTS", "/execute_task,/execute_task_batch,/resume_task,/chat_response,/chat_resume").split(",")
+        if endpoint.strip()
+    }
+
     class Config:
         arbitrary_types_allowed = True
 
     async def initialize(self):
         self.redis_client = aioredis.from_url(self.redis_url)
-        LOGGER.debug(f"Connected to Redis at {self.redis_url}")
+        if self.queue_backend not in queue_backends:
+            raise ValueError(f"Unknown queue backend: {self.queue_backend}. Available: {list(queue_backends)}")
+        self.backend = queue_backends[self.queue_backend]()
+        await self.backend.initialize(self.redis_client)
+        self.global_slots = asyncio.Semaphore(self.max_concurrent_jobs)
+        self.pending_slots = asyncio.Semaphore(max(self.max_pending_jobs, self.max_concurrent_jobs))
+        LOGGER.debug(f"Connected to Redis at {self.redis_url} using the {self.queue_backend} queue backend")
+        LOGGER.debug(f"Worker pool initialized with {self.max_concurrent_jobs} global slots")
 
     async def enqueue_request(self, endpoint: str, data: Dict[str, Any]) -> str:
         task_id = str(uuid4())
@@ -46,16 +87,109 @@ class QueueManager(BaseModel):
             endpoint=endpoint,
             data=data
         )
-        await self.redis_client.lpush("request_queue", message.json())
+        await self.backend.enqueue(message.json())
         LOGGER.debug(f"Enqueued task {task_id} for endpoint {endpoint}")
         return task_id
 
     async def process_requests(self):
         while True:
-            _, message = await self.redis_client.brpop("request_queue")
-            queue_message = QueueMessage.parse_raw(message)
-            # Process the request asynchronously
-            asyncio.create_task(self.handle_request(queue_message))
+            # Backpressure: only pull a new job from Redis while fewer than max_pending_jobs are held
+            await self.pending_slots.acquire()
+            try:
+                entry = await self.backend.next_message()
+            except BaseException:
+                self.pending_slots.release()
+                raise
+            queue_message = await self.parse_entry(entry)
+            if not queue_message:
+                self.pending_slots.release()
+                continue
+            # Process the request asynchronously, bounded by the endpoint's slots
+            self.waiting_jobs[queue_message.endpoint] = self.waiting_jobs.get(queue_message.endpoint, 0) + 1
+            job = asyncio.create_task(self.run_job(queue_message, entry))
+            self.running_jobs.add(job)
+            job.add_done_callback(self.running_jobs.discard)
+
+    async def parse_entry(self, entry: QueueEntry) -> Optional[QueueMessage]:
+        """
+        Parses a queue entry, dropping (and acknowledging) entries that are malformed or
+        that have already been delivered more than max_deliveries times.
+        """
+        try:
+            queue_message = QueueMessage.parse_raw(entry.payload)
+        except Exception as e:
+            LOGGER.error(f"Dropping malformed queue entry {entry.entry_id}: {e}")
+            await self.backend.ack(entry)
+            return None
+
+        if entry.deliveries > self.max_deliveries:
+            LOGGER.error(f"Task {queue_message.task_id} exceeded {self.max_deliveries} deliveries, dropping it")
+            await self.publish_result(queue_message.task_id, {
+                "status": "failed",
+                "error": f"Task was abandoned after {self.max_deliveries} delivery attempts",
+                "task_id": queue_message.task_id
+            })
+            await self.backend.ack(entry)
+            return None
+        return queue_message
+
+    def get_endpoint_slots(self, endpoint: str) -> asyncio.Semaphore:
+        """Returns the semaphore bounding concurrent jobs for an endpoint, creating it on first use."""
+        if endpoint not in self.endpoint_slots:
+            limit = self.endpoint_limits.get(endpoint, self.default_endpoint_limit)
+            self.endpoint_slots[endpoint] = asyncio.Semaphore(limit)
+        return self.endpoint_slots[endpoint]
+
+    async def run_job(self, queue_message: QueueMessage, entry: QueueEntry):
+        """
+        Runs a job once its endpoint and then the pool have a free slot. The endpoint slot
+        is taken first, so jobs queued behind a saturated endpoint wait without holding a
+        global slot, and jobs of other endpoints keep running.
+
+        The entry is only acknowledged once handle_request returns, so a job interrupted
+        by a crash or shutdown stays pending and can be reclaimed by another worker.
+        """
+        endpoint = queue_message.endpoint
+        waiting = True
+        try:
+            async with self.get_endpoint_slots(endpoint), self.global_slots:
+                self.waiting_jobs[endpoint] -= 1
+                waiting = False
+                self.active_jobs[endpoint] = self.active_jobs.get(endpoint, 0) + 1
+                try:
+                    await self.handle_request(queue_message)
+                finally:
+                    self.active_jobs[endpoint] -= 1
+            await self.backend.ack(entry)
+        finally:
+            if waiting:
+                self.waiting_jobs[endpoint] -= 1
+            self.pending_slots.release()
+
+    async def get_queue_stats(self) -> Dict[str, Any]:
+        """
+        Returns live counts of the worker pool: jobs running, jobs pulled from Redis
+        waiting for a slot, and jobs still held in Redis (for the
+        streams backend this includes unacknowledged in-flight entries).
+        """
+        endpoints = set(self.active_jobs) | set(self.waiting_jobs) | set(self.endpoint_limits)
+        queued = await self.backend.depth() if self.backend else 0
+        return {
+            "queue_backend": self.queue_backend,
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "max_pending_jobs": self.max_pending_jobs,
+            "active": sum(self.active_jobs.values()),
+            "waiting": sum(self.waiting_jobs.values()),
+            "queued": queued,
+            "endpoints": {
+                endpoint: {
+                    "limit": self.endpoint_limits.get(endpoint, self.default_endpoint_limit),
+                    "active": self.active_jobs.get(endpoint, 0),
+                    "waiting": self.waiting_jobs.get(endpoint, 0),
+                }
+                for endpoint in sorted(endpoints)
+            },
+        }
 
     async def handle_request(self, queue_message: QueueMessage):
         task_id = queue_message.task_id
@@ -63,36 +197,12 @@ class QueueManager(BaseModel):
         data = queue_message.data
 
         try:
-            # Dispatch to the appropriate method based on endpoint
-            if endpoint == "/execute_task":
-                result = await self.execute_task(data)
-            elif endpoint == "/resume_task":
-                result = await self.resume_task(data)
-            elif endpoint == "/chat_resume":
-                result = await self.chat_resume(data)
-            elif endpoint == "/chat_response":
-                result = await self.chat_response(data)
-            elif endpoint == "/file_transcript":
-                result = await self.generate_file_transcript(data)
-            elif endpoint == "/health/api":
-                result = await self.health_api_check(data)
-            elif endpoint == "/validate_chat_apis":
-                result = await self.validate_chat_apis_handler(data)
-            elif endpoint == "/validate_task_apis":
-                result = await self.validate_task_apis_handler(data)
-            else:
-                raise ValueError(f"Unknown endpoint: {endpoint} - Maybe forgot to add it to the Queue manager?")
+            with stream_events(self.event_publisher(task_id) if endpoint in self.streaming_endpoints else None):
+                result = await self.dispatch(endpoint, data)
 
             # Publish the result to a Redis channel
             result = {"status": "completed", "result": result}
-            if task_id in self.connections:
-                await self.redis_client.publish(f"updates:{task_id}", json.dumps(result))
-            else:
-                # Buffer the message if connection isn't ready
-                if task_id not in self.message_buffer:
-                    self.message_buffer[task_id] = []
-                self.message_buffer[task_id].append(result)
-                
+            await self.publish_result(task_id, result)
             LOGGER.debug(f"Task {task_id} completed successfully")
         except Exception as e:
             import traceback
@@ -103,22 +213,64 @@ class QueueManager(BaseModel):
                 "task_id": task_id
             }
             # Publish the error to the Redis channel
-            await self.redis_client.publish(f"updates:{task_id}", json.dumps(error_result))
+            await self.publish_result(task_id, error_result)
             LOGGER.error(f"Task {task_id} failed with error: {e}\n{get_traceback()}")
 
+    async def dispatch(self, endpoint: str, data: Dict[str, Any]) -> Any:
+        # Dispatch to the appropriate method based on endpoint
+        if endpoint == "/execute_task":
+            return await self.execute_task(data)
+        elif endpoint == "/execute_task_batch":
+            return await self.execute_task_batch(data)
+        elif endpoint == "/resume_task":
+            return await self.resume_task(data)
+        elif endpoint == "/chat_resume":
+            return await self.chat_resume(data)
+        elif endpoint == "/chat_response":
+            return await self.chat_response(data)
+        elif endpoint == "/file_transcript":
+            return await self.generate_file_transcript(data)
+        elif endpoint == "/health/api":
+            return await self.health_api_check(data)
+        elif endpoint == "/validate_chat_apis":
+            return await self.validate_chat_apis_handler(data)
+        elif endpoint == "/validate_task_apis":
+            return await self.validate_task_apis_handler(data)
+        raise ValueError(f"Unknown endpoint: {endpoint} - Maybe forgot to add it to the Queue manager?")
+
+    def event_publisher(self, task_id: str):
+        """
+        Returns the handler that forwards the events emitted while a job runs to its channel.
+        Events are published as `{"status": "streaming", "event": {...}}` and are not stored,
+        so clients that only wait for the final result can keep ignoring them.
+        """
+        async def publish_event(event: Dict[str, Any]):
+            payload = json.dumps({"status": "streaming", "task_id": task_id, "event": event}, default=str)
+            await self.redis_client.publish(f"updates:{task_id}", payload)
+        return publish_event
+
+    async def publish_result(self, task_id: str, result: Dict[str, Any]):
+        """
+        Stores the final result of a task in Redis and publishes it on the task's channel.
+        The stored copy lets a WebSocket served by any replica pick up results that were
+        published before it subscribed.
+        """
+        payload = json.dumps(result)
+        await self.redis_client.set(f"result:{task_id}", payload, ex=self.result_ttl)
+        await self.redis_client.publish(f"updates:{task_id}", payload)
+
     async def connect(self, websocket: WebSocket, task_id: str):
         await websocket.accept()
         self.connections[task_id] = websocket
-        
-        # Send any buffered messages
-        if task_id in self.message_buffer:
-            for message in self.message_buffer[task_id]:
-                await websocket.send_json(message)
-            del self.message_buffer[task_id]
-            
-        # Continue with Redis subscription
+
+        # Subscribe before checking for a stored result so nothing published in between is missed
         pubsub = self.redis_client.pubsub()
         await pubsub.subscribe(f"updates:{task_id}")
+        result = await self.get_task_result(task_id)
+        if result:
+            await websocket.send_json(result)
+            await pubsub.aclose()
+            return
         asyncio.create_task(self.listen_to_channel(websocket, pubsub, task_id))
 
     async def listen_to_channel(self, websocket: WebSocket, pubsub: PubSub, task_id: str):
@@ -136,6 +288,9 @@ class QueueManager(BaseModel):
                         break
         except Exception as e:
             LOGGER.error(f"Error in listen_to_channel for task {task_id}: {e}\n{get_traceback()}")
+        finally:
+            # Releases the subscription's connection back to the pool
+            await pubsub.aclose()
 
     async def disconnect(self, task_id: str):
         try:
@@ -152,6 +307,10 @@ class QueueManager(BaseModel):
             LOGGER.error(f"Error during websocket disconnect for task {task_id}: {e}")
 
     async def cleanup(self):
+        for job in list(self.running_jobs):
+            job.cancel()
+        if self.backend:
+            await self.backend.cleanup()
         if self.redis_client:
             await self.redis_client.close()
             LOGGER.debug("Redis connection closed")
@@ -167,6 +326,16 @@ class QueueManager(BaseModel):
         )
         return result
 
+    async def execute_task_batch(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        request_model = TaskBatchExecutionRequest(**data)
+        result = await execute_task_batch_endpoint(
+            request=request_model,
+            db_app=self.db_app,
+            queue_manager=self,
+            enqueue=False
+        )
+        return result
+
     async def resume_task(self, data: Dict[str, Any]) -> Dict[str, Any]:
         request_model = TaskResumeRequest(**data)
         result = await resume_task_endpoint(
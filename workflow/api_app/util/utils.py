@@ -1,5 +1,6 @@
-from typing import Union, Dict, Any, Optional
-from pydantic import BaseModel
+import os
+from typing import Union, Dict, Any, List, Optional
+from pydantic import BaseModel, Field, field_validator
 from workflow.core import AliceChat, AliceTask, APIManager
 
 # Utility function for deep API availability check
@@ -13,9 +14,26 @@ class TaskExecutionRequest(BaseModel):
     taskId: str
     inputs: Dict[str, Any]
 
+class TaskBatchExecutionRequest(BaseModel):
+    """Request model for running a task once per set of inputs."""
+    taskId: str
+    inputs: List[Dict[str, Any]]
+    max_concurrency: int = Field(int(os.getenv("BATCH_MAX_CONCURRENCY", "4")), ge=1, description="Maximum number of inputs run at the same time")
+
+    @field_validator("max_concurrency")
+    @classmethod
+    def clamp_max_concurrency(cls, value: int) -> int:
+        """Caps the requested concurrency to the server's limit, BATCH_MAX_CONCURRENCY_LIMIT."""
+        return min(value, int(os.getenv("BATCH_MAX_CONCURRENCY_LIMIT", "16")))
+
 class ChatResumeRequest(BaseModel):
     """Request model for resuming a chat interaction."""
     interaction_id: str
+
+class ChatResponseRequest(BaseModel):
+    """Request model for generating a response in a chat thread."""
+    chat_id: str
+    thread_id: str
     
 class FileTranscriptRequest(BaseModel):
     file_id: str
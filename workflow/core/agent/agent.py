@@ -47,8 +47,12 @@ class AliceAgent(BaseDataStructure, ToolExecutionAgent, CodeExecutionAgent, Mode
             - EMBEDDINGS: Text embedding generation
             - IMG_GEN: Image generation
         has_tools (ToolPermission): Tool usage permission level
+        max_parallel_tools (int): Maximum number of tool calls of a turn run at the same time
+        tool_timeout (Optional[float]): Time limit of a tool call, overridden per tool by tool_timeouts
         has_code_exec (CodePermission): Code execution permission level
         max_consecutive_auto_reply (int): Auto-reply limit
+        summary_threshold (int): Unsummarized thread messages beyond which older ones are folded into a rolling summary, 0 to disable
+        summary_window (int): Recent thread messages sent as they are when older ones are summarized
     """
     id: Optional[str] = Field(default=None, description="The ID of the agent", alias="_id")
     name: str = Field(..., description="The name of the agent")
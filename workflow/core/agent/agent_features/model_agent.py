@@ -24,14 +24,19 @@ class ModelAgent(BaseModel):
         description="Dictionary of models associated with the agent for different tasks"
     )
     max_consecutive_auto_reply: int = Field(default=10, description="The maximum number of consecutive auto replies")
+    summary_threshold: int = Field(default=0, description="Number of unsummarized thread messages beyond which older ones are folded into a rolling summary, 0 to always send the whole thread")
+    summary_window: int = Field(default=10, description="Number of recent thread messages kept as they are when older ones are folded into the summary")
 
     @property
     def llm_model(self) -> AliceModel:
         return self.models[ModelType.CHAT] or self.models[ModelType.INSTRUCT]
 
-    def _prepare_system_message(self, **kwargs) -> str:
-        """Prepare the system message"""
-        return self.system_message.format_prompt(**kwargs)
+    def _prepare_system_message(self, conversation_summary: Optional[str] = None, **kwargs) -> str:
+        """Prepare the system message, followed by the summary of the earlier conversation if any"""
+        system_message = self.system_message.format_prompt(**kwargs)
+        if conversation_summary:
+            system_message += f"\n\nSummary of the earlier conversation:\n{conversation_summary}"
+        return system_message
 
     def _prepare_messages_for_api(self, messages: List[MessageDict]) -> List[Dict[str, Any]]:
         """Prepare messages for the API call."""
@@ -95,6 +100,39 @@ class ModelAgent(BaseModel):
         })
         return MessageDict(**message_dict)
     
+    async def summarize_messages(self, api_manager: APIManager, messages: List[MessageDict], summary: Optional[str] = None) -> str:
+        """
+        Fold messages into the rolling summary of a conversation with the agent's language model.
+
+        Args:
+            api_manager: Manager for API interactions
+            messages: Messages to fold, in order
+            summary: The summary of the conversation before these messages, if any
+
+        Returns:
+            The summary of the conversation up to the last message
+        """
+        transcript = "\n\n".join(f"[{getattr(msg.role, 'value', msg.role)}]: {str(msg).strip()}" for msg in messages)
+        content = f"Summary so far:\n{summary}\n\nNew messages:\n{transcript}" if summary else f"Messages:\n{transcript}"
+        chat_model = self.llm_model
+        response_ref: References = await api_manager.generate_response_with_api_engine(
+            api_type=ApiType.LLM_MODEL,
+            api_name=chat_model.api_name,
+            model=chat_model,
+            messages=[MessageDict(role=RoleTypes.USER, content=content).convert_to_api_format()],
+            system=(
+                "You maintain the memory of a conversation between a user and an AI assistant. "
+                "Update the summary so far with the new messages, or summarize the messages if there is no summary yet. "
+                "Keep the facts, decisions, open questions and results of tool calls the assistant may need later, "
+                "and drop pleasantries and repetition. Reply with the summary only."
+            ),
+            tool_choice='none',
+            tools=[],
+        )
+        if not response_ref or not response_ref.messages or not response_ref.messages[0].content:
+            raise ValueError("No summary from API")
+        return response_ref.messages[0].content.strip()
+
     async def generate_vision_response(self, api_manager: APIManager, file_references: List[FileReference], prompt: str) -> MessageDict:
         """
         Generate responses for image inputs using the vision model.
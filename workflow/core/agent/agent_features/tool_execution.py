@@ -1,11 +1,11 @@
-import json
+import asyncio, json, os
 from pydantic import Field, BaseModel
 from typing import Dict, List, Callable, Any, Optional, Tuple
 from workflow.core.data_structures import (
     TaskResponse, ContentType, MessageDict,  References, RoleTypes, MessageGenerators,
     ToolFunction, ToolCall, ensure_tool_function
     )
-from workflow.util import LOGGER, resolve_json_type, convert_value_to_type
+from workflow.util import LOGGER, emit_event, stream_events, span, deadline_scope
 from enum import IntEnum
 
 class ToolPermission(IntEnum):
@@ -19,6 +19,16 @@ class ToolExecutionAgent(BaseModel):
         default=ToolPermission.DISABLED,
         description="Level of tool usage permission"
     )
+    max_parallel_tools: int = Field(
+        default=int(os.getenv("AGENT_MAX_PARALLEL_TOOLS", "4")), ge=1,
+        description="Maximum number of tool calls of a turn executed at the same time"
+    )
+    tool_timeout: Optional[float] = Field(
+        default=None, gt=0, description="Maximum time in seconds a tool call can run for"
+    )
+    tool_timeouts: Dict[str, float] = Field(
+        default_factory=dict, description="Maximum time in seconds calls to each listed tool can run for, overriding tool_timeout"
+    )
 
     async def process_tool_calls(self, tool_calls: List[ToolCall] = [], tool_map: Dict[str, Callable] = {}, tools_list: List[ToolFunction] = []) -> List[MessageDict]:
         """
@@ -39,68 +49,130 @@ class ToolExecutionAgent(BaseModel):
             - Respects tool permission levels (DISABLED, NORMAL, WITH_PERMISSION, DRY_RUN)
             - Validates tool inputs against their schemas
             - Creates structured responses for all tool interactions
+            - Runs the calls concurrently, at most `max_parallel_tools` at a time. Tools marked
+              `parallel_safe = False` run alone, after the calls emitted before them and before
+              the ones emitted after them
+            - Returns the messages in the order of the tool calls, whatever order they finish in
         """
         if self.has_tools == ToolPermission.DISABLED:
             return []
-            
-        tool_messages: List[MessageDict] = []
-        
-        for tool_call in tool_calls:
-            function_name = tool_call.function.name
-            arguments_str = tool_call.function.arguments
-            
-            try:
-                if not isinstance(arguments_str, dict):
-                    LOGGER.debug(f"Decoding JSON arguments: {arguments_str}")
-                    arguments = json.loads(arguments_str)
-                else:
-                    arguments = arguments_str
-            except json.JSONDecodeError:
-                error_msg = f"Error decoding JSON arguments: {arguments_str}"
-                tool_messages.append(self._create_tool_error_message(error_msg, function_name))
-                continue
 
-            if function_name not in tool_map:
-                tool_messages.append(self._create_tool_error_message(f"Tool '{function_name}' not found\nTool map: {tool_map}", function_name))
-                continue
-            
-            tool_function = next((tool for tool in (ensure_tool_function(tool) for tool in tools_list) if tool.function.name == function_name), None)
-            if not tool_function:
-                tool_messages.append(self._create_tool_error_message(f"Tool function '{function_name}' not found in tools list", function_name))
-                continue
-            
-            valid_inputs, error_message = self._validate_tool_inputs(ensure_tool_function(tool_function), arguments)
-            if not valid_inputs:
-                tool_messages.append(self._create_tool_error_message(f"Error in tool '{function_name}': {error_message}", function_name))
-                continue
-            
-            # Handle dry run mode
-            if self.has_tools == ToolPermission.DRY_RUN:
-                tool_messages.append(MessageDict(
-                    role=RoleTypes.TOOL,
-                    content=f"DRY RUN: Would execute {function_name} with arguments: {json.dumps(arguments, indent=2)}",
-                    generated_by=MessageGenerators.TOOL,
-                    step=function_name,
-                    type=ContentType.TEXT
-                ))
+        slots = asyncio.Semaphore(self.max_parallel_tools)
+        tool_functions = {tool.function.name: tool for tool in (ensure_tool_function(tool) for tool in tools_list or [])}
+
+        async def run_tool_call(tool_call: ToolCall) -> MessageDict:
+            async with slots:
+                return await self._run_tool_call(tool_call, tool_map, tool_functions)
+
+        # Messages by position of their tool call, so each lines up with its call id
+        tool_messages: List[Optional[MessageDict]] = [None] * len(tool_calls)
+        for batch in self._schedule_tool_calls(tool_calls, tool_map):
+            messages = await asyncio.gather(*(run_tool_call(tool_calls[index]) for index in batch))
+            for index, message in zip(batch, messages):
+                tool_messages[index] = message
+
+        return tool_messages
+
+    def _schedule_tool_calls(self, tool_calls: List[ToolCall], tool_map: Dict[str, Callable]) -> List[List[int]]:
+        """
+        Splits the tool calls into batches, as positions in `tool_calls`. Batches run one after
+        the other, and the calls of a batch concurrently.
+        """
+        batches: List[List[int]] = []
+        parallel: List[int] = []
+        for index, tool_call in enumerate(tool_calls):
+            if getattr((tool_map or {}).get(tool_call.function.name), "parallel_safe", True):
+                parallel.append(index)
                 continue
-            
-            # Execute tool
-            try:
-                result = await tool_map[function_name](**arguments)
-                task_result = result if isinstance(result, TaskResponse) else None
-                tool_messages.append(MessageDict(
-                    role=RoleTypes.TOOL,
-                    content=str(result),
-                    generated_by=MessageGenerators.TOOL,
-                    step=function_name,
-                    type=ContentType.TASK_RESULT if task_result else ContentType.TEXT,
-                    references=References(task_responses=[task_result] if task_result else None),
-                ))
-            except Exception as e:
-                tool_messages.append(self._create_tool_error_message(f"Error executing tool '{function_name}': {str(e)}", function_name))
+            if parallel:
+                batches.append(parallel)
+                parallel = []
+            batches.append([index])
+        if parallel:
+            batches.append(parallel)
+        return batches
+
+    async def _run_tool_call(self, tool_call: ToolCall, tool_map: Dict[str, Callable], tool_functions: Dict[str, ToolFunction]) -> MessageDict:
+        """Runs a tool call within its timeout, emitting its start and result events."""
+        function_name = tool_call.function.name
+        await emit_event(
+            "tool_call_started",
+            tool_call_id=tool_call.id,
+            name=function_name,
+            arguments=tool_call.function.arguments,
+        )
+        timeout = self.tool_timeouts.get(function_name, self.tool_timeout)
+        try:
+            # Nested LLM calls made by the tool must not interleave with the chat's own tokens
+            with stream_events(None), deadline_scope(timeout) as time_left:
+                tool_message = await asyncio.wait_for(self._execute_tool_call(tool_call, tool_map, tool_functions), time_left)
+        except asyncio.TimeoutError:
+            tool_message = self._create_tool_error_message(
+                f"Error executing tool '{function_name}': " + (f"timed out after {timeout} seconds" if timeout else "the deadline of the run expired"),
+                function_name,
+            )
+        task_response = tool_message.references.task_responses[0] if tool_message.references and tool_message.references.task_responses else None
+        await emit_event(
+            "tool_result",
+            tool_call_id=tool_call.id,
+            name=function_name,
+            status=task_response.status if task_response else None,
+            result_code=task_response.result_code if task_response else None,
+            content=tool_message.content,
+        )
+        return tool_message
+
+    async def _execute_tool_call(self, tool_call: ToolCall, tool_map: Dict[str, Callable], tool_functions: Dict[str, ToolFunction]) -> MessageDict:
+        """Validates and runs a single tool call, returning the tool message describing its outcome."""
+        function_name = tool_call.function.name
+        arguments_str = tool_call.function.arguments
         
-        return tool_messages
+        try:
+            if not isinstance(arguments_str, dict):
+                LOGGER.debug(f"Decoding JSON arguments: {arguments_str}")
+                arguments = json.loads(arguments_str)
+            else:
+                arguments = arguments_str
+        except json.JSONDecodeError:
+            error_msg = f"Error decoding JSON arguments: {arguments_str}"
+            return self._create_tool_error_message(error_msg, function_name)
+
+        if function_name not in (tool_map or {}):
+            return self._create_tool_error_message(f"Tool '{function_name}' not found\nTool map: {tool_map}", function_name)
+        
+        tool_function = tool_functions.get(function_name)
+        if not tool_function:
+            return self._create_tool_error_message(f"Tool function '{function_name}' not found in tools list", function_name)
+        
+        valid_inputs, error_message = self._validate_tool_inputs(tool_function, arguments)
+        if not valid_inputs:
+            return self._create_tool_error_message(f"Error in tool '{function_name}': {error_message}", function_name)
+        
+        # Handle dry run mode
+        if self.has_tools == ToolPermission.DRY_RUN:
+            return MessageDict(
+                role=RoleTypes.TOOL,
+                content=f"DRY RUN: Would execute {function_name} with arguments: {json.dumps(arguments, indent=2)}",
+                generated_by=MessageGenerators.TOOL,
+                step=function_name,
+                type=ContentType.TEXT
+            )
+        
+        # Execute tool
+        try:
+            with span(function_name, "tool", tool_call_id=tool_call.id):
+                result = await tool_map[function_name](**arguments)
+            task_result = result if isinstance(result, TaskResponse) else None
+            return MessageDict(
+                role=RoleTypes.TOOL,
+                content=str(result),
+                generated_by=MessageGenerators.TOOL,
+                step=function_name,
+                type=ContentType.TASK_RESULT if task_result else ContentType.TEXT,
+                references=References(task_responses=[task_result] if task_result else None),
+            )
+        except Exception as e:
+            return self._create_tool_error_message(f"Error executing tool '{function_name}': {str(e)}", function_name)
 
     def _create_tool_error_message(self, error_msg: str, function_name: str) -> MessageDict:
         """Helper method to create consistent tool error messages."""
@@ -115,27 +187,4 @@ class ToolExecutionAgent(BaseModel):
 
     def _validate_tool_inputs(self, tool_function: ToolFunction, arguments: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """Validate tool inputs against their schema."""
-        required_params = tool_function.function.parameters.required
-        properties = tool_function.function.parameters.properties
-
-        for param in required_params:
-            if param not in arguments:
-                return False, f"Missing required parameter: {param}"
-
-        for param, value in arguments.items():
-            if param not in properties:
-                return False, f"Unexpected parameter: {param}"
-            
-            expected_type = properties[param].type
-            python_type = resolve_json_type(expected_type)
-            
-            if python_type is None:
-                return False, f"Unknown type '{expected_type}' for parameter '{param}'"
-            
-            if not isinstance(value, python_type):
-                try: 
-                    value = convert_value_to_type(value, param, expected_type)
-                except (ValueError, TypeError) as e:
-                    return False, f"Error converting value for parameter '{param}': expected {expected_type} {str(e)}"
-                
-        return True, None
\ No newline at end of file
+        return tool_function.function.parameters.validate_arguments(arguments)
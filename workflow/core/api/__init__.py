@@ -1,6 +1,7 @@
 from .api import API 
 from .api_manager import APIManager
 from .api_config import APIConfig
+from .client_registry import ClientRegistry, CLIENT_REGISTRY
 from .engines import (
     ArxivSearchAPI, ExaSearchAPI, GoogleSearchAPI, RedditSearchAPI, WikipediaSearchAPI, 
     APIEngine, LLMEngine, LLMAnthropic, VisionModelEngine, ImageGenerationEngine, AnthropicVisionEngine, 
@@ -10,4 +11,5 @@ from .engines import (
 __all__ = ["API", "APIManager", "ArxivSearchAPI", "ExaSearchAPI", "GoogleSearchAPI", "RedditSearchAPI", "APIConfig",
            "WikipediaSearchAPI", "APIEngine", "LLMEngine", "LLMAnthropic", "ImageGenerationEngine", 
            "VisionModelEngine", "AnthropicVisionEngine", "SpeechToTextEngine", 
-           "TextToSpeechEngine", "EmbeddingEngine", "GoogleGraphEngine", "WolframAlphaEngine", "ApiEngineMap"]
\ No newline at end of file
+           "TextToSpeechEngine", "EmbeddingEngine", "GoogleGraphEngine", "WolframAlphaEngine", "ApiEngineMap",
+           "ClientRegistry", "CLIENT_REGISTRY"]
\ No newline at end of file
@@ -1,8 +1,9 @@
-from pydantic import BaseModel
-from typing import Dict, Any, Union, Optional
+import asyncio
+from pydantic import BaseModel, PrivateAttr
+from typing import Dict, Any, Union, Optional, Tuple
 from workflow.core.api.api import API
 from workflow.core.data_structures import References, ApiType, ApiName, ModelConfig, AliceModel
-from workflow.util import LOGGER
+from workflow.util import LOGGER, remaining_time, span
 from workflow.core.api.engines import APIEngine, ApiEngineMap
     
 class APIManager(BaseModel):
@@ -25,6 +26,9 @@ class APIManager(BaseModel):
     
     Attributes:
         apis (Dict[str, API]): Collection of configured APIs indexed by their IDs
+
+    Lookups by type (and name) go through an index of the active APIs that is rebuilt
+    lazily after `add_api`. Code that edits `apis` directly should call `invalidate_index`.
     
     Example:
         ```python
@@ -43,6 +47,7 @@ class APIManager(BaseModel):
         ```
     """
     apis: Dict[str, API] = {}
+    _api_index: Optional[Dict[Tuple[ApiType, Optional[ApiName]], API]] = PrivateAttr(default=None)
 
     def add_api(self, api: API):
         """
@@ -51,6 +56,33 @@ class APIManager(BaseModel):
             api (API): The API object to be added.
         """
         self.apis[api.id] = api
+        self.invalidate_index()
+
+    def invalidate_index(self):
+        """Forces the type/name index to be rebuilt on the next lookup."""
+        self._api_index = None
+
+    def _get_api_index(self) -> Dict[Tuple[ApiType, Optional[ApiName]], API]:
+        """
+        Maps (api_type, api_name) and (api_type, None) to the first active API matching them,
+        in insertion order, which is what a scan over `apis` would return.
+        """
+        if self._api_index is not None:
+            return self._api_index
+        index: Dict[Tuple[ApiType, Optional[ApiName]], API] = {}
+        for api in self.apis.values():
+            if not api.is_active:
+                continue
+            try:
+                api_type = ApiType(api.api_type)
+                api_name = ApiName(api.api_name)
+            except ValueError as e:
+                LOGGER.warning(f"Skipping API {api.id} with unknown type or name: {e}")
+                continue
+            index.setdefault((api_type, api_name), api)
+            index.setdefault((api_type, None), api)
+        self._api_index = index
+        return index
 
     def get_api_by_type(self, api_type: ApiType, api_name: Optional[ApiName] = None) -> Optional[API]:
         """
@@ -67,22 +99,9 @@ class APIManager(BaseModel):
         """
         if isinstance(api_type, str):
             api_type = ApiType(api_type)
-        if api_name:
-            if isinstance(api_name, str):
-                api_name = ApiName(api_name)
-            matching_api = next((
-                api for api in self.apis.values() 
-                if ApiType(api.api_type) == api_type 
-                and ApiName(api.api_name) == api_name
-                and api.is_active
-                ), None)
-            return matching_api
-        matching_api = next((
-            api for api in self.apis.values() 
-            if ApiType(api.api_type) == api_type 
-            and api.is_active
-            ), None)
-        return matching_api
+        if api_name and isinstance(api_name, str):
+            api_name = ApiName(api_name)
+        return self._get_api_index().get((api_type, api_name or None))
         
     def retrieve_api_data(self, api_type: ApiType, api_name: Optional[ApiName] = None, model: Optional[AliceModel] = None) -> Union[Dict[str, Any], ModelConfig]:
         """
@@ -120,6 +139,7 @@ class APIManager(BaseModel):
 
         Raises:
             ValueError: If no API is found or if there's an error in generating the response.
+            TimeoutError: If the deadline of the running task passes before the response is generated.
         """
         LOGGER.debug(f"Chat generate_response_with_api_engine called with api_type: {api_type}, api_name: {api_name}, model: {model}, kwargs: {kwargs}")
         try:
@@ -139,8 +159,17 @@ class APIManager(BaseModel):
             LOGGER.debug(f"Selected API engine: {engine_instance.__class__.__name__}")
             self._validate_inputs(engine_instance, kwargs)
 
-            return await engine_instance.generate_api_response(api_data=api_data, **kwargs)
-
+            # Bounded by the deadline of the running task, if any. Engines also pass the time
+            # left to their SDK clients as request timeout
+            with span(engine_instance.__class__.__name__, "engine", api_type=str(api_type), api_name=str(api_name), model=getattr(api_data, "model", None)) as engine_span:
+                response = await asyncio.wait_for(engine_instance.generate_api_response(api_data=api_data, **kwargs), remaining_time())
+                if engine_span:
+                    engine_span.add_references_usage(response)
+            return response
+
+        except asyncio.TimeoutError:
+            LOGGER.error(f"Timed out generating response with API engine for {api_type}")
+            raise
         except Exception as e:
             import traceback
             LOGGER.error(f"Error generating response with API engine: {str(e)}")
@@ -0,0 +1,184 @@
+import asyncio, hashlib, importlib.util, os, time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+import aiohttp, httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient as OpenAIHttpxClient
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient as AnthropicHttpxClient
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from workflow.util import LOGGER
+
+ClientKey = Tuple[str, Optional[str], Optional[str], int]
+
+def api_key_hash(api_key: Optional[str]) -> Optional[str]:
+    """Identifies an API key in client keys and logs without keeping it."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16] if api_key else None
+
+class ClientEntry(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    client: Any
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    close: Optional[Callable[[Any], Awaitable[Any]]] = None
+    last_used: float = Field(default_factory=time.monotonic)
+
+class ClientRegistry(BaseModel):
+    """
+    Process-wide SDK and HTTP clients, shared by the API engines instead of opening one per
+    call, keyed by provider, base URL and a hash of the API key.
+
+    Each client keeps a keep-alive connection pool (with HTTP/2 if the `h2` package is
+    installed), so consecutive calls to a provider skip the TCP and TLS handshakes. Clients are
+    bound to the event loop they were created on, which is part of their key, and are closed
+    once unused for `idle_ttl` seconds, or when the app shuts down.
+
+    Timeouts are per call, not per client: SDK clients are handed out with
+    `with_options(timeout=...)`, which shares the connection pool, and HTTP sessions take the
+    timeout of each request.
+    """
+    idle_ttl: float = Field(float(os.getenv("CLIENT_IDLE_TTL", "900")), description="Seconds after which an unused client is closed")
+    max_connections: int = Field(int(os.getenv("CLIENT_POOL_LIMIT", "100")), description="Maximum number of open connections per client")
+    max_keepalive_connections: int = Field(int(os.getenv("CLIENT_POOL_KEEPALIVE", "20")), description="Maximum number of idle connections kept open per client")
+    keepalive_expiry: float = Field(float(os.getenv("CLIENT_KEEPALIVE_TIMEOUT", "30")), description="Seconds an idle connection is kept open for reuse")
+    http2: bool = Field(
+        os.getenv("CLIENT_HTTP2", "true").lower() == "true" and importlib.util.find_spec("h2") is not None,
+        description="Whether SDK clients negotiate HTTP/2, which requires the h2 package"
+    )
+    entries: Dict[ClientKey, ClientEntry] = Field(default_factory=dict, exclude=True)
+    stats: Dict[str, int] = Field(default_factory=lambda: {"created": 0, "reused": 0, "evicted": 0}, exclude=True)
+    globally_configured: Dict[str, Optional[str]] = Field(default_factory=dict, exclude=True)
+    _last_sweep: float = PrivateAttr(default_factory=time.monotonic)
+    _closing: Set[asyncio.Task] = PrivateAttr(default_factory=set)
+
+    def get(
+        self,
+        provider: str,
+        base_url: Optional[str],
+        api_key: Optional[str],
+        create: Callable[[], Any],
+        close: Optional[Callable[[Any], Awaitable[Any]]] = None,
+    ) -> Any:
+        """
+        Returns the client of `provider` for this base URL and key on the running loop (if any),
+        calling `create()` to open it on first use. `close(client)` releases it when evicted.
+        """
+        loop = self._running_loop()
+        key = (provider, base_url.rstrip('/') if base_url else None, api_key_hash(api_key), id(loop))
+        self.evict_idle()
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry.last_used = time.monotonic()
+            self.stats["reused"] += 1
+            return entry.client
+        entry = ClientEntry(client=create(), loop=loop, close=close)
+        self.entries[key] = entry
+        self.stats["created"] += 1
+        LOGGER.debug(f"Opened {provider} client for {key[1] or 'default URL'}")
+        return entry.client
+
+    def openai_client(self, api_key: Optional[str], base_url: Optional[str] = None, timeout: Optional[float] = None) -> AsyncOpenAI:
+        """Shared AsyncOpenAI client, also used for OpenAI-compatible endpoints."""
+        client = self.get(
+            "openai", base_url, api_key,
+            lambda: AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=OpenAIHttpxClient(**self._httpx_options())),
+            close=lambda client: client.close(),
+        )
+        return client.with_options(timeout=timeout) if timeout is not None else client
+
+    def anthropic_client(self, api_key: Optional[str], base_url: Optional[str] = None, timeout: Optional[float] = None) -> AsyncAnthropic:
+        """Shared AsyncAnthropic client."""
+        client = self.get(
+            "anthropic", base_url, api_key,
+            lambda: AsyncAnthropic(api_key=api_key, base_url=base_url, http_client=AnthropicHttpxClient(**self._httpx_options())),
+            close=lambda client: client.close(),
+        )
+        return client.with_options(timeout=timeout) if timeout is not None else client
+
+    def http_session(self, provider: str) -> aiohttp.ClientSession:
+        """Shared aiohttp session for plain HTTP APIs; pass the timeout to each request."""
+        return self.get(
+            provider, None, None,
+            lambda: aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=self.keepalive_expiry,
+                ttl_dns_cache=300,
+            )),
+            close=lambda session: session.close(),
+        )
+
+    def configure_global(self, provider: str, api_key: Optional[str], configure: Callable[[], Any]):
+        """
+        For SDKs configured globally rather than through a client (google.generativeai), runs
+        `configure()` only when the key differs from the one last configured, instead of
+        rebuilding the SDK's clients on every call.
+        """
+        key_hash = api_key_hash(api_key)
+        if provider in self.globally_configured and self.globally_configured[provider] == key_hash:
+            self.stats["reused"] += 1
+            return
+        configure()
+        self.globally_configured[provider] = key_hash
+        self.stats["created"] += 1
+
+    def evict_idle(self, force: bool = False) -> int:
+        """
+        Closes the clients unused for `idle_ttl` seconds, at most once a minute unless `force`d.
+        Returns the number of clients evicted.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sweep < min(self.idle_ttl, 60):
+            return 0
+        self._last_sweep = now
+        idle = [key for key, entry in self.entries.items() if now - entry.last_used >= self.idle_ttl]
+        for key in idle:
+            self._close_entry(self.entries.pop(key))
+        self.stats["evicted"] += len(idle)
+        return len(idle)
+
+    async def close(self):
+        """Closes every client opened on the running loop and forgets the others."""
+        loop = self._running_loop()
+        entries, self.entries = list(self.entries.values()), {}
+        self.globally_configured.clear()
+        for entry in entries:
+            if entry.close is None or entry.loop is not loop:
+                continue
+            try:
+                await entry.close(entry.client)
+            except Exception as e:
+                LOGGER.warning(f"Error closing client: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        providers: Dict[str, int] = {}
+        for provider, *_ in self.entries:
+            providers[provider] = providers.get(provider, 0) + 1
+        return {"size": len(self.entries), "providers": providers, "http2": self.http2, **self.stats}
+
+    def _httpx_options(self) -> Dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        }
+
+    def _close_entry(self, entry: ClientEntry):
+        # A client can only be closed on its own loop, and one whose loop is gone has nothing left to release
+        if entry.close is None or entry.loop is None or entry.loop is not self._running_loop():
+            return
+        task = entry.loop.create_task(entry.close(entry.client))
+        self._closing.add(task)
+        task.add_done_callback(self._closed)
+
+    def _closed(self, task: asyncio.Task):
+        self._closing.discard(task)
+        if not task.cancelled() and task.exception():
+            LOGGER.warning(f"Error closing client: {task.exception()}")
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+CLIENT_REGISTRY = ClientRegistry()
@@ -1,7 +1,6 @@
 import re
 from pydantic import Field
 from typing import List
-from openai import AsyncOpenAI
 from workflow.core.data_structures import (
     ModelConfig,
     ApiType,
@@ -12,7 +11,8 @@ from workflow.core.data_structures import (
     CostDict
 )
 from workflow.core.api.engines.api_engine import APIEngine
-from workflow.util import LOGGER, est_token_count, Language, TextSplitter, SemanticTextSplitter, SplitterType, get_language_matching, get_traceback
+from workflow.util import LOGGER, request_timeout, est_token_count, Language, TextSplitter, SemanticTextSplitter, SplitterType, get_language_matching, get_traceback
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 class EmbeddingEngine(APIEngine):
     """
@@ -105,7 +105,7 @@ class EmbeddingEngine(APIEngine):
         Generates embeddings for the given inputs using OpenAI's API.
         """
 
-        client = AsyncOpenAI(api_key=api_data.api_key, base_url=api_data.base_url)
+        client = CLIENT_REGISTRY.openai_client(api_data.api_key, api_data.base_url, timeout=request_timeout())
         model = api_data.model
 
         LOGGER.info(f"Generating embeddings for {len(inputs)} with total char length {[len(input) for input in inputs]} inputs using model: {model}")
@@ -153,7 +153,7 @@ class EmbeddingEngine(APIEngine):
         """
         Generates embeddings for the given inputs using OpenAI's API.
         """
-        client = AsyncOpenAI(api_key=api_data.api_key, base_url=api_data.base_url)
+        client = CLIENT_REGISTRY.openai_client(api_data.api_key, api_data.base_url, timeout=request_timeout())
         model = api_data.model
 
         LOGGER.info(f"Generating embeddings for {len(inputs)} with total char length {[len(input) for input in inputs]} inputs using model: {model}")
@@ -4,6 +4,7 @@ from workflow.core.data_structures import (
     ModelConfig, EmbeddingChunk
     )
 from workflow.core.api.engines.embedding_engines.embedding_engine import EmbeddingEngine
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 from workflow.util import LOGGER, est_token_count, get_traceback
 
 class GeminiEmbeddingsEngine(EmbeddingEngine):
@@ -13,7 +14,7 @@ class GeminiEmbeddingsEngine(EmbeddingEngine):
         """
         Generates embeddings for the given inputs using OpenAI's API.
         """
-        genai.configure(api_key=api_data.api_key)
+        CLIENT_REGISTRY.configure_global("gemini", api_data.api_key, lambda: genai.configure(api_key=api_data.api_key))
         embeddings: List[List[float]] = []
         model = api_data.model
         LOGGER.info(f"Generating embeddings for {len(inputs)} with total char length {[len(input) for input in inputs]} inputs using model: {model}")
@@ -45,7 +46,7 @@ class GeminiEmbeddingsEngine(EmbeddingEngine):
         Generates embeddings for the given inputs using OpenAI's API.
         """
 
-        genai.configure(api_key=api_data.api_key)
+        CLIENT_REGISTRY.configure_global("gemini", api_data.api_key, lambda: genai.configure(api_key=api_data.api_key))
         model = api_data.model
 
         LOGGER.info(f"Generating embeddings for {len(inputs)} with total char length {[len(input) for input in inputs]} inputs using model: {model}")
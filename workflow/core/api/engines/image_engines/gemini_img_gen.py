@@ -5,6 +5,7 @@ from workflow.core.data_structures import (
     ModelConfig, ApiType, FileContentReference, MessageDict, ContentType, FileType, References, FunctionParameters, ParameterDefinition
     )
 from workflow.core.api.engines.image_engines.image_gen_engine import ImageGenerationEngine
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 class GeminiImageGenerationEngine(ImageGenerationEngine):
     input_variables: FunctionParameters = Field(
@@ -35,7 +36,7 @@ class GeminiImageGenerationEngine(ImageGenerationEngine):
         """
         Generates images using Google's Gemini model.
         """
-        genai.configure(api_key=api_data.api_key)
+        CLIENT_REGISTRY.configure_global("gemini", api_data.api_key, lambda: genai.configure(api_key=api_data.api_key))
         imagen = genai.ImageGenerationModel(api_data.model)
 
         # Map size to aspect ratio (this is an approximation, adjust as needed)
@@ -1,6 +1,5 @@
 from pydantic import Field
 from typing import List
-from openai import AsyncOpenAI
 from workflow.core.data_structures import (
     ModelConfig,
     ApiType,
@@ -15,7 +14,8 @@ from workflow.core.data_structures import (
     MessageGenerators,
 )
 from workflow.core.api.engines.api_engine import APIEngine
-from workflow.util import LOGGER, get_traceback
+from workflow.util import LOGGER, get_traceback, request_timeout
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 
 class ImageGenerationEngine(APIEngine):
@@ -96,7 +96,7 @@ class ImageGenerationEngine(APIEngine):
         Returns:
             References: Generated image information wrapped in a MessageDict object.
         """
-        client = AsyncOpenAI(api_key=api_data.api_key, base_url=api_data.base_url)
+        client = CLIENT_REGISTRY.openai_client(api_data.api_key, api_data.base_url, timeout=request_timeout())
         model = api_data.model
         if quality not in ["standard", "hd"]:
             quality = "standard"
@@ -1,26 +1,30 @@
 import traceback, json
 from pydantic import Field
-from typing import Dict, Any, List, Optional
-from anthropic import AsyncAnthropic
+from typing import Dict, Any, List, Optional, Tuple, Union
 from anthropic.types import TextBlock, ToolUseBlock, ToolParam, Message
 from workflow.core.data_structures import ToolCall, ToolCallConfig, ToolFunction
 from workflow.core.api.engines.llm_engines.llm_engine import LLMEngine
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 from workflow.core.data_structures import (
     MessageDict,
     ContentType,
     ModelConfig,
+    CacheUsageDict,
     References,
     RoleTypes,
     MessageGenerators,
 )
 from workflow.util import (
     LOGGER,
+    request_timeout,
     est_messages_token_count,
     est_token_count,
     CHAR_TO_TOKEN,
     MessagePruner,
     ScoreConfig,
     MessageApiFormat,
+    emit_event,
+    streaming_enabled,
 )
 from workflow.core.api.engines.llm_engines.anthropic_tool_util import ToolNameMapping
 
@@ -47,6 +51,10 @@ class LLMAnthropic(LLMEngine):
     The class handles Anthropic-specific features such as message adaptation,
     tool parameter conversion, and cost calculation based on Anthropic's pricing.
 
+    With prompt caching enabled, cache breakpoints are set on the tools, the system message
+    and the two most recent user turns, so every request reads the prefix written by the
+    previous one and only the latest turns are processed anew.
+
     Attributes:
         Inherits all attributes from LLMEngine.
 
@@ -194,7 +202,7 @@ class LLMAnthropic(LLMEngine):
         if not api_data.api_key:
             raise ValueError("Anthropic API key not found in API data")
 
-        client = AsyncAnthropic(api_key=api_data.api_key, base_url=api_data.base_url)
+        client = CLIENT_REGISTRY.anthropic_client(api_data.api_key, api_data.base_url, timeout=request_timeout())
 
         # Handle token estimation and pruning
         estimated_tokens = est_messages_token_count(messages, tools) + est_token_count(
@@ -236,10 +244,23 @@ class LLMAnthropic(LLMEngine):
             api_params["tools"] = anthropic_tools
             api_params["tool_choice"] = {"type": "auto"}
 
+        if self.prompt_caching:
+            api_params["system"], tools_with_breakpoint, api_params["messages"] = self.add_cache_breakpoints(
+                system, anthropic_tools, adjusted_messages
+            )
+            if anthropic_tools:
+                api_params["tools"] = tools_with_breakpoint
+
         LOGGER.debug(f"API parameters: {api_params}")
 
         try:
-            response: Message = await client.messages.create(**api_params)
+            if streaming_enabled():
+                async with client.messages.stream(**api_params) as stream:
+                    async for text in stream.text_stream:
+                        await emit_event("token_delta", delta=text)
+                    response: Message = await stream.get_final_message()
+            else:
+                response: Message = await client.messages.create(**api_params)
 
             message_text = ""
             tool_calls: Optional[List[ToolCall]] = None
@@ -251,6 +272,9 @@ class LLMAnthropic(LLMEngine):
                     if tool_calls is None:
                         tool_calls = []
                     tool_calls.append(self._process_tool_call(content))
+            cache = self.get_cache_usage(response.usage)
+            # Anthropic's input tokens exclude those read from or written to the cache
+            prompt_tokens = response.usage.input_tokens + cache["hit_tokens"] + cache["write_tokens"]
             msg = MessageDict(
                 role=RoleTypes.ASSISTANT,
                 content=message_text,
@@ -260,16 +284,18 @@ class LLMAnthropic(LLMEngine):
                 creation_metadata={
                     "model": response.model,
                     "usage": {
-                        "prompt_tokens": response.usage.input_tokens,
+                        "prompt_tokens": prompt_tokens,
                         "completion_tokens": response.usage.output_tokens,
-                        "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+                        "total_tokens": prompt_tokens + response.usage.output_tokens,
                     },
+                    "cache": cache,
                     "finish_reason": response.stop_reason,
                     "system_fingerprint": response.id,
                     "cost": self.calculate_cost(
-                        response.usage.input_tokens,
+                        prompt_tokens,
                         response.usage.output_tokens,
                         api_data,
+                        cache,
                     ),
                     "estimated_tokens": int(estimated_tokens),
                 },
@@ -281,6 +307,52 @@ class LLMAnthropic(LLMEngine):
             LOGGER.error(traceback.format_exc())
             raise
 
+    def add_cache_breakpoints(
+        self,
+        system: Optional[str],
+        tools: Optional[List[ToolParam]],
+        messages: List[Dict[str, Any]],
+    ) -> Tuple[Union[str, List[Dict[str, Any]], None], Optional[List[ToolParam]], List[Dict[str, Any]]]:
+        """
+        Set prompt cache breakpoints on the stable prefixes of a request, within Anthropic's
+        limit of 4: the last tool, the system message, and the last two user messages. The
+        breakpoint on the latest user message writes the conversation so far to the cache, for
+        the next request to read; the one on the previous user message reads what the last
+        request wrote.
+
+        The tools and messages are copied where marked, as tool params are shared by every
+        request made with the same tool functions.
+
+        Returns:
+            Tuple: The system blocks, tools and messages to send.
+        """
+        cache_control = {"type": "ephemeral"}
+        if system:
+            system = [{"type": "text", "text": system, "cache_control": cache_control}]
+        if tools:
+            tools = tools[:-1] + [{**tools[-1], "cache_control": cache_control}]
+
+        messages = list(messages)
+        user_indexes = [i for i, msg in enumerate(messages) if msg["role"] == RoleTypes.USER and msg.get("content")]
+        for i in user_indexes[-2:]:
+            content = messages[i]["content"]
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content, "cache_control": cache_control}]
+            else:
+                content = content[:-1] + [{**content[-1], "cache_control": cache_control}]
+            messages[i] = {**messages[i], "content": content}
+        return system, tools, messages
+
+    def get_cache_usage(self, usage) -> CacheUsageDict:
+        """Prompt cache hits, misses and writes from the usage of an Anthropic message."""
+        hit_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+        write_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return CacheUsageDict(
+            hit_tokens=hit_tokens,
+            miss_tokens=usage.input_tokens + write_tokens,
+            write_tokens=write_tokens,
+        )
+
     def _convert_into_tool_params(self, tools: List[ToolFunction]) -> List[ToolParam]:
         """
         Convert the general tool functions into Anthropic-specific tool parameters.
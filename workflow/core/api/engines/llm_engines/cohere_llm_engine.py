@@ -2,6 +2,7 @@ import cohere
 from cohere import NonStreamedChatResponse
 from typing import List, Optional
 from workflow.core.api.engines.llm_engines.llm_engine import LLMEngine
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 from workflow.core.data_structures import (
     MessageDict,
     ContentType,
@@ -37,7 +38,7 @@ class CohereLLMEngine(LLMEngine):
         if not api_data.api_key:
             raise ValueError("API key not found in API data")
 
-        client = cohere.Client(api_data.api_key)
+        client = CLIENT_REGISTRY.get("cohere", None, api_data.api_key, lambda: cohere.Client(api_data.api_key))
 
         try:
             # Prepare messages, including system message if provided
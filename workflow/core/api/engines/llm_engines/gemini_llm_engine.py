@@ -2,6 +2,7 @@ import google.generativeai as genai
 from google.generativeai.types import GenerateContentResponse
 from typing import List, Optional
 from workflow.core.api.engines.llm_engines.llm_engine import LLMEngine
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 from workflow.core.data_structures import (
     MessageDict,
     ContentType,
@@ -40,20 +41,14 @@ class GeminiLLMEngine(LLMEngine):
 
         LOGGER.debug(f"Gemini llm response generation with tools: {tools}")
 
-        genai.configure(api_key=api_data.api_key)
+        CLIENT_REGISTRY.configure_global("gemini", api_data.api_key, lambda: genai.configure(api_key=api_data.api_key))
 
         function_declarations = []
         if tools:
             LOGGER.debug(f"Tools: {tools}")
             # Convert tools to Gemini's function declarations format
             for tool in tools:
-                function_declarations.append(
-                    {
-                        "name": tool.function.name,
-                        "description": tool.function.description,
-                        "parameters": tool.function.parameters.get_gemini_function(),
-                    }
-                )
+                function_declarations.append(tool.get_gemini_declaration())
 
         # Set up function calling configuration
         tool_config = None
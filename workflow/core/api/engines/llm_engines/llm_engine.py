@@ -1,13 +1,18 @@
-import traceback
+import traceback, hashlib, json, os
+from urllib.parse import urlparse
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 from pydantic import Field
 from typing import List, Optional, TypedDict
 from workflow.core.api.engines.api_engine import APIEngine
-from workflow.util import LOGGER, est_messages_token_count, ScoreConfig, est_token_count, MessagePruner, CHAR_TO_TOKEN, MessageApiFormat
+from workflow.core.api.client_registry import CLIENT_REGISTRY
+from workflow.util import (
+    LOGGER, est_messages_token_count, ScoreConfig, est_token_count, MessagePruner, CHAR_TO_TOKEN, MessageApiFormat,
+    emit_event, streaming_enabled, request_timeout
+    )
 from workflow.core.data_structures import (
     MessageDict, ContentType, ModelConfig, ApiType, References, FunctionParameters, ParameterDefinition, ToolCall, RoleTypes, MessageGenerators, ToolFunction,
-    MetadataDict, CostDict
+    MetadataDict, CostDict, CacheUsageDict
     )
 
 class LLMEngine(APIEngine):
@@ -24,6 +29,12 @@ class LLMEngine(APIEngine):
     
     The engine implements automatic message pruning when context limits are
     approached and provides detailed usage metrics in the response metadata.
+
+    Prompts are laid out for the provider's prompt cache: the system message and tools, which
+    are stable along a chat, come first, followed by the conversation, which only grows. On
+    OpenAI, requests sharing a system message and tools are also routed together with a
+    `prompt_cache_key`. Cached prompt tokens are reported in the `cache` of the metadata and
+    billed at the cached input price.
     
     Input Interface:
         - messages: List of conversation messages
@@ -86,6 +97,7 @@ class LLMEngine(APIEngine):
         description="The inputs this API engine takes: requires a list of messages and optional function/tool related inputs."
     )
     required_api: ApiType = Field(ApiType.LLM_MODEL, title="The API engine required")
+    prompt_caching: bool = Field(os.getenv("PROMPT_CACHING", "true").lower() == "true", description="Whether to request provider prompt caching of stable prompt prefixes")
 
 
     async def generate_api_response(self, 
@@ -101,8 +113,8 @@ class LLMEngine(APIEngine):
         Generates the API response for the task, using the provided API data and messages.
 
         This method can work with any OpenAI-compatible endpoint (OpenAI, Azure, LMStudio).
-        It creates an AsyncOpenAI client with the provided configuration and generates
-        a chat completion based on the input parameters.
+        It uses the shared AsyncOpenAI client of the endpoint and API key, from the client
+        registry, and generates a chat completion based on the input parameters.
 
         Args:
             api_data (ModelConfig): Configuration for the API client.
@@ -133,11 +145,8 @@ class LLMEngine(APIEngine):
         
         LOGGER.debug(f"Generating API response for model {api_data.model} with base URL {base_url}")
 
-        # Create the client with the correct base_url
-        client = AsyncOpenAI(
-            api_key=api_data.api_key,
-            base_url=base_url
-        )
+        # Shared client for this endpoint and key, with the correct base_url
+        client = CLIENT_REGISTRY.openai_client(api_data.api_key, base_url, timeout=request_timeout())
         if system:
             messages = [{"role": "system", "content": system}] + messages
         
@@ -175,9 +184,20 @@ class LLMEngine(APIEngine):
             if tools:
                 api_params["tools"] = tools
                 api_params["tool_choice"] = tool_choice
+
+            # Only OpenAI takes the cache key and stream options, other compatible endpoints may reject unknown parameters
+            is_openai = urlparse(base_url).hostname == "api.openai.com"
+            if self.prompt_caching and is_openai:
+                api_params["extra_body"] = {"prompt_cache_key": self.prompt_cache_key(api_data.model, system, tools)}
                 
             LOGGER.debug(f"API call parameters: {api_params}")
-            response: ChatCompletion = await client.chat.completions.create(**api_params)
+            if streaming_enabled():
+                stream_params = {**api_params, "stream": True}
+                if is_openai:
+                    stream_params["stream_options"] = {"include_usage": True}
+                response: ChatCompletion = await self.stream_chat_completion(client, stream_params, estimated_tokens)
+            else:
+                response: ChatCompletion = await client.chat.completions.create(**api_params)
 
             # We'll use the first choice for the MessageDict
             choice = response.choices[0]
@@ -198,20 +218,24 @@ class LLMEngine(APIEngine):
                 except Exception as e:
                     LOGGER.error(f"Error validating function call: {str(e)}\nFunction call: {function_call}")
                     LOGGER.error(traceback.format_exc())
+            cache = self.get_cache_usage(response.usage)
+            metadata = MetadataDict(
+                model = response.model,
+                usage = response.usage.model_dump(),
+                cost = self.calculate_cost(response.usage.prompt_tokens, response.usage.completion_tokens, api_data, cache),
+                estimated_tokens = int(estimated_tokens),
+                system_fingerprint = response.system_fingerprint,
+                finish_reason = choice.finish_reason,
+                )
+            if cache:
+                metadata["cache"] = cache
             msg = MessageDict(
                 role=RoleTypes.ASSISTANT,
                 content=content,
                 references=References(tool_calls=tool_calls),
                 generated_by=MessageGenerators.LLM,
                 type=ContentType.TEXT,
-                creation_metadata=MetadataDict(
-                    model = response.model,
-                    usage = response.usage.model_dump(),
-                    cost = self.calculate_cost(response.usage.prompt_tokens, response.usage.completion_tokens, api_data),
-                    estimated_tokens = int(estimated_tokens),
-                    system_fingerprint = response.system_fingerprint,
-                    finish_reason = choice.finish_reason,
-                    )
+                creation_metadata=metadata
             )
             return References(messages=[msg])
 
@@ -220,24 +244,108 @@ class LLMEngine(APIEngine):
             LOGGER.error(traceback.format_exc())
             raise Exception(f"Error in LLM API call: {str(e)}")
 
-    def calculate_cost(self, prompt_tokens: int, completion_tokens: int, model_config: ModelConfig) -> CostDict:
+    async def stream_chat_completion(self, client: AsyncOpenAI, api_params: dict, estimated_tokens: int) -> ChatCompletion:
+        """
+        Runs the completion in streaming mode, emitting a `token_delta` event for every content
+        chunk, and folds the chunks back into a ChatCompletion so the caller can build the
+        message exactly as it does for a non-streamed response.
+
+        Only the first choice is accumulated. Usage is only requested from OpenAI (through
+        `stream_options` in `api_params`); if the endpoint does not report it, token counts fall
+        back to the local estimates.
+        """
+        stream = await client.chat.completions.create(**{**api_params, "stream": True})
+        completion = {"id": "", "created": 0, "model": api_params["model"], "system_fingerprint": None, "usage": None}
+        content = ""
+        finish_reason = None
+        tool_calls: dict = {}
+        async for chunk in stream:
+            completion["id"] = chunk.id or completion["id"]
+            completion["created"] = chunk.created or completion["created"]
+            completion["model"] = chunk.model or completion["model"]
+            completion["system_fingerprint"] = chunk.system_fingerprint or completion["system_fingerprint"]
+            if chunk.usage:
+                completion["usage"] = chunk.usage.model_dump()
+            for choice in chunk.choices:
+                if choice.index != 0:
+                    continue
+                finish_reason = choice.finish_reason or finish_reason
+                delta = choice.delta
+                if delta.content:
+                    content += delta.content
+                    await emit_event("token_delta", delta=delta.content)
+                for tool_delta in delta.tool_calls or []:
+                    tool_call = tool_calls.setdefault(
+                        tool_delta.index, {"id": None, "type": "function", "function": {"name": "", "arguments": ""}}
+                    )
+                    if tool_delta.id:
+                        tool_call["id"] = tool_delta.id
+                    if tool_delta.function:
+                        tool_call["function"]["name"] += tool_delta.function.name or ""
+                        tool_call["function"]["arguments"] += tool_delta.function.arguments or ""
+
+        if not completion["usage"]:
+            completion_tokens = est_token_count(content + "".join(call["function"]["arguments"] for call in tool_calls.values()))
+            completion["usage"] = {
+                "prompt_tokens": int(estimated_tokens),
+                "completion_tokens": completion_tokens,
+                "total_tokens": int(estimated_tokens) + completion_tokens,
+            }
+        message = {"role": "assistant", "content": content or None}
+        if tool_calls:
+            message["tool_calls"] = [tool_calls[index] for index in sorted(tool_calls)]
+        return ChatCompletion.model_validate({
+            **completion,
+            "object": "chat.completion",
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason or "stop"}],
+        })
+
+    @staticmethod
+    def prompt_cache_key(model: str, system: Optional[str], tools: Optional[List[dict]]) -> str:
+        """Identifies the stable prefix of a prompt (model, system message and tools) for cache routing."""
+        prefix = json.dumps([model, system or "", tools or []], sort_keys=True, default=str)
+        return hashlib.sha256(prefix.encode()).hexdigest()[:32]
+
+    def get_cache_usage(self, usage) -> Optional[CacheUsageDict]:
+        """
+        Prompt cache hits and misses from the usage of an OpenAI completion, or None if the
+        endpoint doesn't report cached tokens. OpenAI writes the cache implicitly and doesn't
+        report cache writes.
+        """
+        details = getattr(usage, "prompt_tokens_details", None)
+        hit_tokens = getattr(details, "cached_tokens", None) if details else None
+        if hit_tokens is None:
+            return None
+        return CacheUsageDict(hit_tokens=hit_tokens, miss_tokens=max(usage.prompt_tokens - hit_tokens, 0))
+
+    def calculate_cost(self, prompt_tokens: int, completion_tokens: int, model_config: ModelConfig, cache: Optional[CacheUsageDict] = None) -> CostDict:
         """
         Calculate the cost of the API call based on token usage and model.
 
         Args:
             prompt_tokens (int): Number of tokens in the prompt.
             completion_tokens (int): Number of tokens in the completion.
-            model (str): The model used for the API call.
+            model_config (ModelConfig): The configuration of the model used for the API call.
+            cache (Optional[CacheUsageDict]): Prompt cache usage, if reported. Cache hits are billed
+                at the cached input price (the input price if the model has none), the rest of the
+                prompt at the input price. Without it, the whole prompt is billed at the cached
+                price if the model config has `use_cache` set.
 
         Returns:
-            float: The calculated cost of the API call.
+            CostDict: The input, output and total cost of the API call.
         """
-        input_cost_per_mill = model_config.model_costs.input_token_cost_per_million if not model_config.use_cache else model_config.model_costs.cached_input_token_cost_per_million
-        input_cost = (prompt_tokens / 1000000) * input_cost_per_mill
-        output_cost = (completion_tokens / 1000000) * model_config.model_costs.output_token_cost_per_million
+        costs = model_config.model_costs
+        if cache:
+            hit_tokens = cache.get("hit_tokens", 0)
+            cached_cost_per_mill = costs.cached_input_token_cost_per_million or costs.input_token_cost_per_million
+            input_cost = (hit_tokens * cached_cost_per_mill + (prompt_tokens - hit_tokens) * costs.input_token_cost_per_million) / 1000000
+        else:
+            input_cost_per_mill = costs.input_token_cost_per_million if not model_config.use_cache else costs.cached_input_token_cost_per_million
+            input_cost = (prompt_tokens / 1000000) * input_cost_per_mill
+        output_cost = (completion_tokens / 1000000) * costs.output_token_cost_per_million
         output = {
             "input_cost": input_cost,
             "output_cost": output_cost,
             "total_cost": input_cost + output_cost
         }
-        return output
\ No newline at end of file
+        return output
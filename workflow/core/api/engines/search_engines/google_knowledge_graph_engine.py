@@ -12,7 +12,8 @@ from workflow.core.data_structures import (
     ReferenceCategory, 
     ImageReference
 )
-from workflow.util import LOGGER
+from workflow.util import LOGGER, request_timeout
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 ALLOWED_TYPES = [
     "book", "bookseries", "educationalorganization", "event", "governmentorganization",
@@ -106,27 +107,27 @@ class GoogleGraphEngine(APISearchEngine):
 
         entity_references = []
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        error_text = await resp.text()
-                        LOGGER.error(f"Error from API: {resp.status} {error_text}")
-                        raise Exception(f"API request failed with status {resp.status}")
-                    response_data = await resp.json()
+        session = CLIENT_REGISTRY.http_session("google_knowledge_graph")
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=request_timeout())) as resp:
+                if resp.status != 200:
+                    error_text = await resp.text()
+                    LOGGER.error(f"Error from API: {resp.status} {error_text}")
+                    raise Exception(f"API request failed with status {resp.status}")
+                response_data = await resp.json()
 
-                    # Parse the response and create EntityReference objects
-                    for element in response_data.get('itemListElement', []):
-                        try:
-                            result = element.get('result', {})
-                            entity_reference = self.create_entity_from_data(result)
-                            entity_references.append(entity_reference)
-                        except Exception as e:
-                            LOGGER.error(f"Error parsing entity data: {e} -> {element}")
-                            continue
-            except Exception as e:
-                LOGGER.error(f"Error fetching data for prompt '{prompt}': {e}")
-                raise
+                # Parse the response and create EntityReference objects
+                for element in response_data.get('itemListElement', []):
+                    try:
+                        result = element.get('result', {})
+                        entity_reference = self.create_entity_from_data(result)
+                        entity_references.append(entity_reference)
+                    except Exception as e:
+                        LOGGER.error(f"Error parsing entity data: {e} -> {element}")
+                        continue
+        except Exception as e:
+            LOGGER.error(f"Error fetching data for prompt '{prompt}': {e}")
+            raise
 
         return References(entity_references=entity_references)
     
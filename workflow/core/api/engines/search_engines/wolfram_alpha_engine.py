@@ -9,7 +9,8 @@ from workflow.core.data_structures import (
     MessageDict, ContentType,
     ApiType,
 )
-from workflow.util import LOGGER
+from workflow.util import LOGGER, request_timeout
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 class WolframAlphaEngine(APISearchEngine):
     """
@@ -94,41 +95,41 @@ class WolframAlphaEngine(APISearchEngine):
         service_url = 'https://api.wolframalpha.com/v1/llm-api'
         url = service_url + '?' + urllib.parse.urlencode(params)
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        error_text = await resp.text() # Generate a message with this text and return that
-                        msg = MessageDict(
-                            role=RoleTypes.ASSISTANT,
-                            content=error_text,
-                            generated_by=MessageGenerators.TOOL,
-                            type=ContentType.TEXT,
-                            creation_metadata={
-                                "source": "Wolfram Alpha - Error Message",
-                                "parameters": prompt_params,
-                            },
-                        )
-                        LOGGER.error(f"Error from API: {resp.status} {error_text}")
-                        return References(messages=[msg])
-                    LOGGER.debug(f"Response status: {await resp.read()}")
-                    response_data = await resp.read()
-
-                    LOGGER.debug(f"Response data: {response_data}")
-                    # Create a MessageDict with the content
+        session = CLIENT_REGISTRY.http_session("wolfram_alpha")
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=request_timeout())) as resp:
+                if resp.status != 200:
+                    error_text = await resp.text() # Generate a message with this text and return that
                     msg = MessageDict(
                         role=RoleTypes.ASSISTANT,
-                        content=response_data,
+                        content=error_text,
                         generated_by=MessageGenerators.TOOL,
                         type=ContentType.TEXT,
                         creation_metadata={
-                            "source": "Wolfram Alpha",
+                            "source": "Wolfram Alpha - Error Message",
                             "parameters": prompt_params,
                         },
                     )
-
+                    LOGGER.error(f"Error from API: {resp.status} {error_text}")
                     return References(messages=[msg])
+                LOGGER.debug(f"Response status: {await resp.read()}")
+                response_data = await resp.read()
+
+                LOGGER.debug(f"Response data: {response_data}")
+                # Create a MessageDict with the content
+                msg = MessageDict(
+                    role=RoleTypes.ASSISTANT,
+                    content=response_data,
+                    generated_by=MessageGenerators.TOOL,
+                    type=ContentType.TEXT,
+                    creation_metadata={
+                        "source": "Wolfram Alpha",
+                        "parameters": prompt_params,
+                    },
+                )
+
+                return References(messages=[msg])
 
-            except Exception as e:
-                LOGGER.error(f"Error fetching data for prompt '{prompt}': {e}")
-                raise
+        except Exception as e:
+            LOGGER.error(f"Error fetching data for prompt '{prompt}': {e}")
+            raise
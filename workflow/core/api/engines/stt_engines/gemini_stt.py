@@ -11,6 +11,7 @@ from workflow.core.data_structures import (
     ContentType,
 )
 from workflow.core.api.engines.stt_engines.stt_engine import SpeechToTextEngine
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 from workflow.util import LOGGER
 import io
 
@@ -39,7 +40,7 @@ class GeminiSpeechToTextEngine(SpeechToTextEngine):
         )
         LOGGER.info(f"API data: {api_data}")
 
-        genai.configure(api_key=api_data.api_key)
+        CLIENT_REGISTRY.configure_global("gemini", api_data.api_key, lambda: genai.configure(api_key=api_data.api_key))
         model = genai.GenerativeModel(api_data.model)
 
         try:
@@ -1,11 +1,11 @@
 from typing import List
 from pydantic import Field
-from openai import AsyncOpenAI
 from workflow.core.data_structures import (
     ModelConfig, ApiType, FileReference, MessageDict, References, FunctionParameters, ParameterDefinition, MessageGenerators, ContentType, RoleTypes
     )
 from workflow.core.api.engines.api_engine import APIEngine
-from workflow.util import LOGGER
+from workflow.util import LOGGER, request_timeout
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 class SpeechToTextEngine(APIEngine):
     """
@@ -71,10 +71,7 @@ class SpeechToTextEngine(APIEngine):
         """
         LOGGER.info(f"Transcribing audio file {file_reference.storage_path} using OpenAI speech-to-text model {model}")
         LOGGER.info(f"API data: {api_data}")
-        client = AsyncOpenAI(
-            api_key=api_data.api_key,
-            base_url=api_data.base_url
-        )
+        client = CLIENT_REGISTRY.openai_client(api_data.api_key, api_data.base_url, timeout=request_timeout())
         model = api_data.model
         if model != 'whisper-1':
             LOGGER.debug(f"Model {model} not recognized. Defaulting to whisper-1.")
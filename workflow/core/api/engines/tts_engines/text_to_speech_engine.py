@@ -16,7 +16,8 @@ from workflow.core.data_structures import (
     MessageGenerators,
 )
 from workflow.core.api.engines.api_engine import APIEngine
-from workflow.util import LOGGER, get_traceback, TextSplitter, Language, LengthType
+from workflow.util import LOGGER, request_timeout, get_traceback, TextSplitter, Language, LengthType
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 
 class TextToSpeechEngine(APIEngine):
@@ -88,7 +89,7 @@ class TextToSpeechEngine(APIEngine):
         Returns:
             References: A message dict containing information about the generated audio file.
         """
-        client = AsyncOpenAI(api_key=api_data.api_key, base_url=api_data.base_url)
+        client = CLIENT_REGISTRY.openai_client(api_data.api_key, api_data.base_url, timeout=request_timeout())
         model = api_data.model
         inputs: List[str] = []
         if len(input) > api_data.ctx_size:
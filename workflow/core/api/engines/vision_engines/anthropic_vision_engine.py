@@ -13,7 +13,8 @@ from workflow.core.data_structures import (
 from workflow.core.api.engines.vision_engines.vision_model_engine import (
     VisionModelEngine,
 )
-from anthropic import AsyncAnthropic
+from workflow.util import request_timeout
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 
 class AnthropicVisionEngine(VisionModelEngine):
@@ -36,7 +37,7 @@ class AnthropicVisionEngine(VisionModelEngine):
         Returns:
             MessageDict: Analysis results wrapped in a MessageDict object.
         """
-        client = AsyncAnthropic(api_key=api_data.api_key)
+        client = CLIENT_REGISTRY.anthropic_client(api_data.api_key, timeout=request_timeout())
 
         content = []
         for file_ref in file_references:
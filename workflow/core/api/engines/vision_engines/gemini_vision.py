@@ -15,6 +15,7 @@ from workflow.core.api.engines.vision_engines.vision_model_engine import (
     VisionModelEngine,
 )
 from workflow.util import LOGGER
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 
 class GeminiVisionEngine(VisionModelEngine):
@@ -37,7 +38,7 @@ class GeminiVisionEngine(VisionModelEngine):
         Returns:
             References: Analysis results wrapped in a References object.
         """
-        genai.configure(api_key=api_data.api_key)
+        CLIENT_REGISTRY.configure_global("gemini", api_data.api_key, lambda: genai.configure(api_key=api_data.api_key))
         model = genai.GenerativeModel(api_data.model)
 
         content = [prompt]
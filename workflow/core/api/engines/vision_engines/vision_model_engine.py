@@ -1,12 +1,12 @@
 import base64
 from pydantic import Field
 from typing import List, Union, Optional
-from openai import AsyncOpenAI
 from workflow.core.data_structures import (
     MessageDict, ModelConfig, FileReference, get_file_content, ApiType, References, FunctionParameters, ParameterDefinition, 
     RoleTypes, MessageGenerators, ContentType, MetadataDict)
 from workflow.core.api.engines.llm_engines import LLMEngine
-from workflow.util import LOGGER
+from workflow.util import LOGGER, request_timeout
+from workflow.core.api.client_registry import CLIENT_REGISTRY
 
 # TODO: Vision model apis tend to charge images at a flat "token" rate, so we should consider adding a cost calculation method to the VisionModelEngine class.
 
@@ -73,10 +73,7 @@ class VisionModelEngine(LLMEngine):
         Returns:
             References: Analysis results wrapped in a References object.
         """
-        client = AsyncOpenAI(
-            api_key=api_data.api_key,
-            base_url=api_data.base_url
-        )
+        client = CLIENT_REGISTRY.openai_client(api_data.api_key, api_data.base_url, timeout=request_timeout())
         content = [{"type": "text", "text": prompt}]
         for file_ref in file_references:
             image_data = get_file_content(file_ref)
@@ -1,7 +1,7 @@
 from enum import Enum
-from pydantic import Field, model_validator, BaseModel
+from pydantic import Field, PrivateAttr, model_validator, BaseModel
 from typing import List, Optional, Dict, Any, Callable, Union
-from workflow.util import LOGGER, get_traceback
+from workflow.util import LOGGER, get_traceback, emit_event
 from workflow.core.data_structures import (
     MessageDict, ContentType, ToolFunction,
     UserInteraction, UserCheckpoint, Prompt, User, 
@@ -11,7 +11,7 @@ from workflow.core.data_structures import (
 )
 from workflow.core.agent import AliceAgent
 from workflow.core.api import APIManager
-from workflow.core.tasks import AliceTask, create_task_from_json
+from workflow.core.tasks import AliceTask, ToolRegistry, create_task_from_json
 
 class CheckpointType(str, Enum):
     TOOL_CALL = "tool_call"
@@ -70,6 +70,8 @@ class AliceChat(BaseDataStructure):
         default=None,
         description="Associated data cluster"
     )
+    _tool_registry: Optional[ToolRegistry] = PrivateAttr(default=None)
+    _conversation_summary: Optional[str] = PrivateAttr(default=None)
     
     @model_validator(mode='before')
     @classmethod
@@ -278,6 +280,27 @@ class AliceChat(BaseDataStructure):
             LOGGER.error(error_msg)
             return [self._create_error_message(error_msg)]
 
+    def load_thread(self, thread: ChatThread):
+        """
+        Continues the conversation of `thread`: its messages not yet folded into its summary
+        become the chat's messages, and the summary is added to the system message.
+        """
+        self.messages = thread.recent_messages()
+        self._conversation_summary = thread.summary
+
+    async def update_thread_summary(self, api_manager: APIManager, thread: ChatThread) -> bool:
+        """
+        Folds the older messages of `thread` into its summary once it grows past the agent's
+        summary threshold, keeping the agent's summary window as is. Returns whether the summary
+        changed.
+        """
+        messages = thread.messages_to_summarize(self.alice_agent.summary_threshold, self.alice_agent.summary_window)
+        if not messages:
+            return False
+        summary = await self.alice_agent.summarize_messages(api_manager, messages, thread.summary)
+        thread.fold_summary(summary, len(messages))
+        return True
+
     async def continue_user_interaction(self, api_manager: APIManager, interaction: UserInteraction) -> Optional[MessageDict]:
         """
         Process a specific user interaction, potentially from earlier in the conversation.
@@ -354,6 +377,7 @@ class AliceChat(BaseDataStructure):
         
         while turn_count < self.alice_agent.max_consecutive_auto_reply:
             try:
+                await emit_event("turn_started", chat_id=self.id, turn=turn_count)
                 turn_message = await self._execute_single_turn(api_manager, all_generated_messages, user_data)
                 
                 if not turn_message:
@@ -387,7 +411,8 @@ class AliceChat(BaseDataStructure):
                 api_manager,
                 self.messages + previous_messages,
                 self._get_available_tool_functions(api_manager),
-                user_data=user_data
+                user_data=user_data,
+                conversation_summary=self._conversation_summary
             )
             
             # If LLM generation failed, raise the exception
@@ -550,21 +575,22 @@ class AliceChat(BaseDataStructure):
         tools.extend(self.retrieval_tools)
         return tools if tools else None
 
+    def tool_registry(self) -> ToolRegistry:
+        """The compiled tools of the chat, rebuilt only when its agent or retrieval tools change."""
+        tools = self.available_tools() or []
+        if self._tool_registry is None or not self._tool_registry.matches(tools):
+            self._tool_registry = ToolRegistry.build(tools)
+        else:
+            self._tool_registry.bind(tools)
+        return self._tool_registry
+
     def _get_available_tool_functions(self, api_manager: APIManager) -> Optional[List[ToolFunction]]:
         """Get all available tools including retrieval tools if applicable."""
-        tools = self.available_tools()
-        tool_functions = [tool.get_function(api_manager)["tool_function"] for tool in tools] if tools else None
-        return tool_functions if tool_functions else None
+        return self.tool_registry().tool_functions or None
     
     def _get_available_tool_map(self, api_manager: APIManager) -> Optional[Dict[str, Callable]]:
         """Get a map of all available tools."""
-        tools = self.available_tools()
-        if tools:
-            tool_map = {}
-            for tool in tools:
-                tool_map.update(tool.get_function(api_manager)["function_map"])
-            return tool_map if tool_map else None
-        return None
+        return self.tool_registry().tool_map(api_manager) or None
     
     def deep_validate_required_apis(self, api_manager: APIManager) -> Dict[str, Any]:
         """Validate all required APIs for the chat and its tools."""
@@ -2,10 +2,11 @@ from .message import MessageDict, MessageGenerators, RoleTypes, convert_message_
 from .file_reference import FileReference, FileContentReference, generate_file_content_reference, get_file_content
 from .task_response import TaskResponse, complete_inner_execution_history
 from .node_response import NodeResponse, ExecutionHistoryItem
+from .execution_history import ExecutionHistory
 from .user_checkpoint import UserCheckpoint
 from .user_interaction import UserInteraction, UserResponse, InteractionOwnerType, InteractionOwner
 from .user import User, UserRoles
-from .references import References, DataCluster, get_reference_object, references_model_map
+from .references import References, OffloadedReferences, offload_references, offload_node_references, load_node_references, DataCluster, get_reference_object, references_model_map
 from .model import AliceModel, ModelConfig
 from .prompt import Prompt
 from .api_utils import ApiName, ApiType, ModelType, ModelApis, API_CONFIG_TYPES, API_CAPABILITIES
@@ -14,7 +15,7 @@ from .code import CodeBlock, CodeOutput, CodeExecution, get_run_commands
 from .entity_reference import EntityReference, ReferenceCategory, ImageReference
 from .threads import ChatThread
 from .parameters import ParameterDefinition, FunctionConfig, FunctionParameters, ToolFunction, ensure_tool_function
-from .base_models import EntityType, FileType, ContentType, TasksEndCodeRouting, EmbeddingChunk, Embeddable, BaseDataStructure, MetadataDict, CostDict, UsageDict
+from .base_models import EntityType, FileType, ContentType, TasksEndCodeRouting, EmbeddingChunk, Embeddable, BaseDataStructure, MetadataDict, CostDict, UsageDict, CacheUsageDict
 # Rebuild all models
 MessageDict.model_rebuild()
 ChatThread.model_rebuild()
@@ -48,9 +49,9 @@ EntityReference.model_rebuild()
 ImageReference.model_rebuild()
 
 __all__ = ['FileReference', 'ContentType', 'FileType', 'FileContentReference', 'generate_file_content_reference', 'get_file_content', 'MessageDict', 'ModelConfig',
-           'TaskResponse', 'User', 'UserRoles', 'UserInteraction', 'ExecutionHistoryItem', 'NodeResponse', 'TasksEndCodeRouting', 'EmbeddingChunk', 'get_run_commands',
+           'TaskResponse', 'User', 'UserRoles', 'UserInteraction', 'ExecutionHistoryItem', 'ExecutionHistory', 'NodeResponse', 'TasksEndCodeRouting', 'EmbeddingChunk', 'get_run_commands',
            'ApiName', 'ApiType', 'ModelType', 'ParameterDefinition', 'FunctionConfig', 'FunctionParameters', 'ToolCall', 'ToolCallConfig', 'UserCheckpoint', 'UserResponse',
-           'ToolFunction', 'ensure_tool_function', 'EntityType', 'ModelApis', 'FileOutput', 'References', 'complete_inner_execution_history', 'Embeddable', 'convert_message_dict_to_api_format',
+           'ToolFunction', 'ensure_tool_function', 'EntityType', 'ModelApis', 'FileOutput', 'References', 'OffloadedReferences', 'offload_references', 'offload_node_references', 'load_node_references', 'complete_inner_execution_history', 'Embeddable', 'convert_message_dict_to_api_format',
            'AliceModel', 'Prompt', 'BaseDataStructure', 'DataCluster', 'InteractionOwnerType', 'InteractionOwner', 'MessageGenerators', 'RoleTypes', 'CodeBlock',
            'CodeOutput', 'CodeExecution', 'API_CONFIG_TYPES', 'API_CAPABILITIES', 'EntityReference', 'ReferenceCategory', 'ImageReference', 'get_reference_object', 'references_model_map', 
-           'MetadataDict', 'CostDict', 'UsageDict', 'ChatThread']
\ No newline at end of file
+           'MetadataDict', 'CostDict', 'UsageDict', 'CacheUsageDict', 'ChatThread']
\ No newline at end of file
@@ -83,9 +83,15 @@ class UsageDict(TypedDict, total=False):
     completion_tokens: int
     total_tokens: int
 
+class CacheUsageDict(TypedDict, total=False):
+    hit_tokens: int # Prompt tokens read from the provider's prompt cache
+    miss_tokens: int # Prompt tokens processed without the cache, including those written to it
+    write_tokens: int # Prompt tokens written to the cache
+
 class MetadataDict(TypedDict, total=False):
     model: str
     usage: UsageDict
+    cache: CacheUsageDict
     estimated_tokens: int
     finish_reason: str
     system_fingerprint: str | None
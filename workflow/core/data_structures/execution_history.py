@@ -0,0 +1,166 @@
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from workflow.core.data_structures.node_response import NodeResponse
+
+class ExecutionHistory(list):
+    """
+    List of NodeResponses that indexes its items by node name and parent task as they are added.
+
+    It behaves like the plain `List[NodeResponse]` used throughout the tasks, so it can be passed
+    anywhere one is expected (and to pydantic fields, which copy it into a plain list). On top
+    of that, the lookups tasks make for every node answer without scanning the history:
+    the last node of a task or with a given name, the nodes with a given name, and how many
+    times a task ran a node with given exit codes (its attempts), and the value a node's name
+    resolves to as an input variable. `exit_code_counts` and `resolved_values` snapshot the
+    counts and the values resolved so far, and `restore` rebuilds a history from them.
+
+    Appending and extending update the indexes incrementally. Other in-place changes (insert,
+    item assignment, deletion, sorting) rebuild them. Items must not have their `node_name`,
+    `parent_task_id`, `exit_code` or `references` changed after being added.
+    """
+    def __init__(self, nodes: Iterable[NodeResponse] = ()):
+        super().__init__(nodes)
+        self._reindex()
+
+    @classmethod
+    def restore(
+        cls,
+        nodes: Iterable[NodeResponse],
+        exit_code_counts: Dict[Tuple[Optional[str], str], Dict[int, int]],
+        resolved_values: Dict[str, str],
+    ) -> "ExecutionHistory":
+        """
+        History of `nodes` with the attempt counts and resolved values of a snapshot (see
+        `exit_code_counts` and `resolved_values`), so they are neither recounted nor resolved
+        again, which would load offloaded node outputs.
+        """
+        history = cls(nodes)
+        history._exit_codes = defaultdict(Counter, {key: Counter(counts) for key, counts in exit_code_counts.items()})
+        for node_name, value in resolved_values.items():
+            node = history._resolved.get(node_name)
+            if node is not None:
+                history._resolved_values[node_name] = (node, value)
+        return history
+
+    @classmethod
+    def wrap(cls, nodes: Optional[Iterable[NodeResponse]]) -> "ExecutionHistory":
+        """Returns `nodes` itself if it is already an ExecutionHistory, else an indexed copy."""
+        if isinstance(nodes, ExecutionHistory):
+            return nodes
+        return cls(nodes or [])
+
+    def _reindex(self):
+        self._by_name: Dict[str, List[NodeResponse]] = defaultdict(list)
+        self._by_parent: Dict[Optional[str], List[NodeResponse]] = defaultdict(list)
+        self._exit_codes: Dict[Tuple[Optional[str], str], Counter] = defaultdict(Counter)
+        self._resolved: Dict[str, NodeResponse] = {}
+        self._resolved_values: Dict[str, Tuple[NodeResponse, str]] = {}
+        for node in self:
+            self._index(node)
+
+    def _index(self, node: NodeResponse):
+        self._by_name[node.node_name].append(node)
+        self._by_parent[node.parent_task_id].append(node)
+        self._exit_codes[(node.parent_task_id, node.node_name)][node.exit_code] += 1
+        if node.references:
+            self._resolved[node.node_name] = node
+
+    # Indexed lookups
+    def by_name(self, node_name: str) -> List[NodeResponse]:
+        """Nodes with the given name, in execution order."""
+        return self._by_name.get(node_name, [])
+
+    def last_by_name(self, node_name: str) -> Optional[NodeResponse]:
+        nodes = self._by_name.get(node_name)
+        return nodes[-1] if nodes else None
+
+    def last_by_parent(self, parent_task_id: Optional[str]) -> Optional[NodeResponse]:
+        nodes = self._by_parent.get(parent_task_id)
+        return nodes[-1] if nodes else None
+
+    def count_by_parent(self, parent_task_id: Optional[str]) -> int:
+        return len(self._by_parent.get(parent_task_id, []))
+
+    def count_attempts(self, parent_task_id: Optional[str], node_name: str, exit_codes: Optional[Iterable[int]] = None) -> int:
+        """Times the task ran the node, counting only the given exit codes if any are given."""
+        counts = self._exit_codes.get((parent_task_id, node_name))
+        if not counts:
+            return 0
+        if exit_codes is None:
+            return sum(counts.values())
+        return sum(counts[code] for code in exit_codes)
+
+    def resolved_node(self, node_name: str) -> Optional[NodeResponse]:
+        """Last node with the given name that produced references, the one its variable resolves to."""
+        return self._resolved.get(node_name)
+
+    def resolved_value(self, node_name: str) -> Optional[str]:
+        """
+        Value of the variable named after a node: the detailed summary of the references of the
+        last node with that name that produced any. Summaries are built once per node.
+        """
+        node = self._resolved.get(node_name)
+        if node is None:
+            return None
+        resolved = self._resolved_values.get(node_name)
+        if resolved is None or resolved[0] is not node:
+            resolved = (node, node.references.detailed_summary())
+            self._resolved_values[node_name] = resolved
+        return resolved[1]
+
+    # Snapshots
+    def exit_code_counts(self) -> Dict[Tuple[Optional[str], str], Dict[int, int]]:
+        """Times each task ran each node, by exit code."""
+        return {key: dict(counts) for key, counts in self._exit_codes.items()}
+
+    def resolved_values(self) -> Dict[str, str]:
+        """Values of the node-named variables resolved so far, for nodes still the last to resolve them."""
+        return {
+            node_name: value
+            for node_name, (node, value) in self._resolved_values.items()
+            if self._resolved.get(node_name) is node
+        }
+
+    # List mutations
+    def append(self, node: NodeResponse):
+        super().append(node)
+        self._index(node)
+
+    def extend(self, nodes: Iterable[NodeResponse]):
+        nodes = list(nodes)
+        super().extend(nodes)
+        for node in nodes:
+            self._index(node)
+
+    def __iadd__(self, nodes: Iterable[NodeResponse]):
+        self.extend(nodes)
+        return self
+
+    def pop(self, index: int = -1) -> NodeResponse:
+        node = super().pop(index)
+        self._reindex()
+        return node
+
+    def copy(self) -> "ExecutionHistory":
+        history = ExecutionHistory(self)
+        history._exit_codes = defaultdict(Counter, {key: Counter(counts) for key, counts in self._exit_codes.items()})
+        history._resolved_values = dict(self._resolved_values)
+        return history
+
+    def _mutation(name):
+        def method(self, *args, **kwargs):
+            result = getattr(super(ExecutionHistory, self), name)(*args, **kwargs)
+            self._reindex()
+            return result
+        method.__name__ = name
+        return method
+
+    insert = _mutation("insert")
+    remove = _mutation("remove")
+    clear = _mutation("clear")
+    sort = _mutation("sort")
+    reverse = _mutation("reverse")
+    __setitem__ = _mutation("__setitem__")
+    __delitem__ = _mutation("__delitem__")
+    __imul__ = _mutation("__imul__")
+    del _mutation
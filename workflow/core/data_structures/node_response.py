@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Optional, Dict, TYPE_CHECKING, Union
 from pydantic import Field, field_validator, BaseModel
 from workflow.core.data_structures.central_types import ReferencesType
+from workflow.util import BlobHandle
 
 if TYPE_CHECKING:
     from workflow.core.data_structures.references import References
@@ -22,9 +23,11 @@ class NodeResponse(ExecutionHistoryItem):
     @field_validator('references')
     @classmethod
     def validate_references(cls, value: Union[Dict, References]) -> References:
-        from workflow.core.data_structures.references import References
+        from workflow.core.data_structures.references import References, OffloadedReferences
         if isinstance(value, References):
             return value
+        if isinstance(value, dict) and isinstance(value.get("blob"), dict):
+            return OffloadedReferences.from_handle(BlobHandle(**value["blob"]))
         if isinstance(value, dict):
             return References(**value)
         return get_default_references()
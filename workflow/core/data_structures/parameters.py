@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import Annotated, Optional, Any, Literal, Dict, List, Union
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Annotated, Callable, Optional, Any, Literal, Dict, List, Tuple, Union
 from anthropic.types import ToolParam
+from workflow.util import compile_type_converter, resolve_json_type
 from workflow.core.data_structures.base_models import BaseDataStructure
 
 class ParameterDefinition(BaseDataStructure):
@@ -58,6 +59,69 @@ class FunctionParameters(BaseModel):
     type: Annotated[Literal["object"], Field(default="object", description="Type of the parameters")]
     properties: Annotated[Dict[str, ParameterDefinition], Field(description="Dict of parameters name to their type, description, and default value")]
     required: Annotated[List[str], Field(default_factory=list, description="Required parameters")]
+    _converters: Optional[Dict[str, Callable[[Any, str], Any]]] = PrivateAttr(default=None)
+    _argument_types: Optional[Dict[str, Optional[type]]] = PrivateAttr(default=None)
+
+    @property
+    def converters(self) -> Dict[str, Callable[[Any, str], Any]]:
+        """
+        Type converter of each parameter, as returned by `compile_type_converter`, built on first
+        use. Reassigning `properties` drops them; call `invalidate_converters` after changing the
+        type of a parameter in place.
+        """
+        if self._converters is None:
+            self._converters = {
+                param_name: compile_type_converter(param.type)
+                for param_name, param in self.properties.items()
+            }
+        return self._converters
+
+    @property
+    def argument_types(self) -> Dict[str, Optional[type]]:
+        """Python type of each parameter, None for unsupported types, built on first use like `converters`."""
+        if self._argument_types is None:
+            self._argument_types = {}
+            for param_name, param in self.properties.items():
+                try:
+                    self._argument_types[param_name] = resolve_json_type(param.type)
+                except ValueError:
+                    self._argument_types[param_name] = None
+        return self._argument_types
+
+    def invalidate_converters(self):
+        self._converters = None
+        self._argument_types = None
+
+    def validate_arguments(self, arguments: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """
+        Checks the arguments of a call: required parameters are present, there are no unknown
+        ones, and each value is of its parameter's type or converts to it.
+        """
+        for param in self.required:
+            if param not in arguments:
+                return False, f"Missing required parameter: {param}"
+
+        for param, value in arguments.items():
+            if param not in self.properties:
+                return False, f"Unexpected parameter: {param}"
+
+            expected_type = self.properties[param].type
+            python_type = self.argument_types.get(param)
+            if python_type is None:
+                return False, f"Unknown type '{expected_type}' for parameter '{param}'"
+
+            if not isinstance(value, python_type):
+                try:
+                    self.converters[param](value, param)
+                except (ValueError, TypeError) as e:
+                    return False, f"Error converting value for parameter '{param}': expected {expected_type} {str(e)}"
+
+        return True, None
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name == "properties":
+            self.invalidate_converters()
     
     def model_dump(self, *args, **kwargs):
         """
@@ -119,19 +183,45 @@ class FunctionConfig(BaseModel):
         return data
  
 class ToolFunction(BaseModel):
-    """A function under tool as defined by the OpenAI API."""
+    """
+    A function under tool as defined by the OpenAI API.
+
+    The provider schemas of the tool (OpenAI dict, Anthropic `ToolParam`, Gemini declaration)
+    are built on first use and reused, so a tool function must not be changed once used.
+    """
     type: Annotated[Literal["function"], Field(default="function", description="Type of the tool function")]
     function: Annotated[FunctionConfig, Field(description="Function under tool")]
+    _schemas: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def _schema(self, provider: str, build: Callable[[], Any]) -> Any:
+        if provider not in self._schemas:
+            self._schemas[provider] = build()
+        return self._schemas[provider]
 
     def convert_to_tool_params(self) -> ToolParam:
-        return self.function.convert_to_tool_params()
+        return self._schema("anthropic", self.function.convert_to_tool_params)
     
     def get_dict(self) -> Dict[str, Any]:
-        dict_data = {
+        return self._schema("openai", lambda: {
             "type": self.type,
             "function": self.function.get_dict()
-        }
-        return dict_data
+        })
+
+    def get_gemini_declaration(self) -> Dict[str, Any]:
+        return self._schema("gemini", lambda: {
+            "name": self.function.name,
+            "description": self.function.description,
+            "parameters": self.function.parameters.get_gemini_function(),
+        })
+
+    def compile(self) -> "ToolFunction":
+        """Builds the provider schemas and argument validation of the tool ahead of its first use."""
+        self.get_dict()
+        self.convert_to_tool_params()
+        self.get_gemini_declaration()
+        self.function.parameters.converters
+        self.function.parameters.argument_types
+        return self
     
     def model_dump(self, *args, **kwargs):
         data = super().model_dump(*args, **kwargs)
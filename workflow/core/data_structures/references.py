@@ -1,5 +1,7 @@
+import asyncio
 from typing import List, Optional, Union, Any, Dict
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+from workflow.util import LOGGER, BLOB_STORE, BlobHandle
 from workflow.core.data_structures.base_models import BaseDataStructure
 from workflow.core.data_structures.message import MessageDict
 from workflow.core.data_structures.file_reference import FileReference, FileContentReference
@@ -9,6 +11,7 @@ from workflow.core.data_structures.base_models import EmbeddingChunk
 from workflow.core.data_structures.tool_calls import ToolCall
 from workflow.core.data_structures.code import CodeExecution
 from workflow.core.data_structures.entity_reference import EntityReference
+from workflow.core.data_structures.node_response import NodeResponse
 
 references_model_map = {
     'messages': MessageDict,
@@ -236,7 +239,118 @@ class References(BaseModel):
                 return False
                 
         return True
-    
+
+class OffloadedReferences(References):
+    """
+    References kept in the blob store, standing in for large node outputs (scraped pages, file
+    contents, embeddings, code logs) in task responses.
+
+    They serialize as their handle, `{"blob": {...}}`, and are loaded from the store the first
+    time one of the reference lists is read or assigned. Truthiness, length and `summary`
+    come from the handle, so they don't load them. Async code loads them beforehand with
+    `load_async` (see `load_node_references`), which reads the blob in a worker thread.
+    """
+    _blob: Optional[BlobHandle] = PrivateAttr(default=None)
+    _loaded: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def from_handle(cls, handle: BlobHandle) -> "OffloadedReferences":
+        references = cls()
+        references._blob = handle
+        return references
+
+    @property
+    def blob(self) -> Optional[BlobHandle]:
+        return self._blob
+
+    def load(self):
+        """Reads the references from the blob store, if not done yet."""
+        if self._loaded or self._blob is None:
+            return
+        self._loaded = True
+        try:
+            data = BLOB_STORE.get_json(self._blob.blob_id)
+        except Exception as e:
+            LOGGER.error(f"Error loading references from blob {self._blob.blob_id}: {e}")
+            return
+        self._fill(data)
+
+    async def load_async(self):
+        """Like `load`, reading the blob in a worker thread."""
+        if self._loaded or self._blob is None:
+            return
+        try:
+            data = await asyncio.to_thread(BLOB_STORE.get_json, self._blob.blob_id)
+        except Exception as e:
+            LOGGER.error(f"Error loading references from blob {self._blob.blob_id}: {e}")
+            data = None
+        # Unless loaded meanwhile by a read
+        if self._loaded:
+            return
+        self._loaded = True
+        if data is not None:
+            self._fill(data)
+
+    def _fill(self, data: Dict[str, Any]):
+        loaded = References(**data)
+        fields = object.__getattribute__(self, "__dict__")
+        for name in references_model_map:
+            fields[name] = loaded.__dict__[name]
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in references_model_map:
+            object.__getattribute__(self, "load")()
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in references_model_map:
+            self.load()
+        super().__setattr__(name, value)
+
+    def model_dump(self, *args, **kwargs) -> Dict[str, Any]:
+        return {"blob": self._blob.model_dump() if self._blob else None}
+
+    def summary(self) -> str:
+        return self._blob.summary if self._blob else ""
+
+    def detailed_summary(self) -> str:
+        self.load()
+        return super().detailed_summary()
+
+    def __bool__(self) -> bool:
+        return self._blob is not None and self._blob.count > 0
+
+    def __len__(self) -> int:
+        return self._blob.count if self._blob else 0
+
+def offload_references(references: Optional[References]) -> Optional[References]:
+    """
+    Returns the references as OffloadedReferences if their payload reaches the blob store's
+    `min_size`, otherwise the references themselves.
+    """
+    if not references or isinstance(references, OffloadedReferences) or not BLOB_STORE.enabled:
+        return references
+    handle = BLOB_STORE.put_json(references.model_dump(by_alias=True))
+    if handle is None:
+        return references
+    handle.count = len(references)
+    handle.summary = references.summary()
+    return OffloadedReferences.from_handle(handle)
+
+async def offload_node_references(nodes: List[NodeResponse]) -> List[NodeResponse]:
+    """Copies of the nodes with their references offloaded (see `offload_references`), written in a worker thread."""
+    if not BLOB_STORE.enabled:
+        return list(nodes)
+    return await asyncio.to_thread(
+        lambda: [node.model_copy(update={"references": offload_references(node.references)}) for node in nodes]
+    )
+
+async def load_node_references(nodes: List[NodeResponse]):
+    """Loads the offloaded references of the nodes in worker threads, so reading them doesn't block."""
+    await asyncio.gather(*[
+        node.references.load_async() for node in nodes if isinstance(node.references, OffloadedReferences)
+    ])
+
 class DataCluster(References, BaseDataStructure):
     """DataCluster is a container for various types of references."""
     pass
\ No newline at end of file
@@ -1,11 +1,38 @@
 from typing import Optional, List
 from pydantic import Field
-from workflow.core.data_structures.message import MessageDict
+from workflow.core.data_structures.message import MessageDict, RoleTypes
 from workflow.core.data_structures.base_models import BaseDataStructure
 
 class ChatThread(BaseDataStructure):
     name: Optional[str] = Field(None, description="The name of the chat thread")
     messages: List[MessageDict] = Field(default_factory=list, description="A list of messages in the chat thread")
+    summary: Optional[str] = Field(None, description="Rolling summary of the messages folded out of the context")
+    summarized_messages: int = Field(0, description="Number of leading messages folded into the summary")
+
+    def recent_messages(self) -> List[MessageDict]:
+        """The messages not yet folded into the summary, sent as they are to the model."""
+        return self.messages[self.summarized_messages:]
+
+    def messages_to_summarize(self, threshold: int, window: int) -> List[MessageDict]:
+        """
+        Messages to fold into the summary: once more than `threshold` messages are unsummarized,
+        all but the `window` most recent ones. Empty while under the threshold, or if it's 0.
+
+        The window never starts with a tool result: it's extended back to the assistant message
+        with the tool call, so the model never sees a result without its call.
+        """
+        recent = self.recent_messages()
+        if threshold <= 0 or len(recent) <= threshold:
+            return []
+        start = max(len(recent) - window, 0)
+        while start > 0 and recent[start].role == RoleTypes.TOOL:
+            start -= 1
+        return recent[:start]
+
+    def fold_summary(self, summary: str, message_count: int):
+        """Replaces the summary with one also covering the next `message_count` messages."""
+        self.summary = summary
+        self.summarized_messages = min(self.summarized_messages + message_count, len(self.messages))
     
     def __str__(self) -> str:
         messages = "\n".join([str(msg) for msg in self.messages])
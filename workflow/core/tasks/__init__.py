@@ -5,6 +5,10 @@ from .api_tasks import APITask
 from .task import AliceTask
 from .workflow import Workflow
 from .task_utils import generate_node_responses_summary, validate_and_process_function_inputs
+from .node_cache import NodeResultCache, NODE_RESULT_CACHE
+from .registry import TaskTypeRegistry, TaskCache, TASK_CACHE, task_version_key
+from .checkpoint import ExecutionCheckpoint, CheckpointStore, CHECKPOINT_STORE, checkpointing
+from .tool_registry import ToolRegistry
 
 available_task_types: list[AliceTask] = [
     Workflow,
@@ -19,8 +23,13 @@ available_task_types: list[AliceTask] = [
     TextToSpeechTask,
     WebScrapeBeautifulSoupTask
 ]
+TASK_TYPES = TaskTypeRegistry(available_task_types)
 
 def create_task_from_json(task_dict: dict) -> AliceTask:
+    """Builds a task from its JSON definition. Stored definitions seen before come from TASK_CACHE."""
+    return TASK_CACHE.get_or_create(task_dict, _build_task_from_json)
+
+def _build_task_from_json(task_dict: dict) -> AliceTask:
     task_type = task_dict.pop("task_type", "")
     if not task_type:
         LOGGER.error(f'Task type not specified in task definition: {task_dict}')
@@ -38,17 +47,18 @@ def create_task_from_json(task_dict: dict) -> AliceTask:
                 LOGGER.error(f"Invalid task data for key '{task_key}': {task_data}")
                 raise ValueError(f"Invalid task data for key '{task_key}': {task_data}")
 
-    for task_class in available_task_types:
-        if task_type == task_class.__name__:
-            try:                
-                task = task_class(**task_dict)
-                # LOGGER.debug(f"Just created task: {task.model_dump()}")
-                return task
-            except Exception as e:
-                LOGGER.error(f"Error creating task of type {task_type}: {str(e)} \n Task data: {task_dict}")
-                raise ValidationError(f"Error creating task of type {task_type}: {str(e)}")
-    LOGGER.error(f"Task type {task_type} not found in available task types.")
-    raise ValueError(f"Task type {task_type} not found in available task types.")
+    task_class = TASK_TYPES.get(task_type)
+    if task_class is None:
+        LOGGER.error(f"Task type {task_type} not found in available task types.")
+        raise ValueError(f"Task type {task_type} not found in available task types.")
+    try:
+        task = task_class(**task_dict)
+        # LOGGER.debug(f"Just created task: {task.model_dump()}")
+        return task
+    except Exception as e:
+        LOGGER.error(f"Error creating task of type {task_type}: {str(e)} \n Task data: {task_dict}")
+        raise ValidationError(f"Error creating task of type {task_type}: {str(e)}")
 
-__all__ = ['AliceTask', 'Workflow', 'PromptAgentTask', 'APITask', 'APISearchTask', 'GenerateImageTask', 'RetrievalTask', 'generate_node_responses_summary', 'validate_and_process_function_inputs',
-           'CheckTask', 'CodeExecutionLLMTask', 'CodeGenerationLLMTask', 'EmbeddingTask', 'TextToSpeechTask', 'WebScrapeBeautifulSoupTask', 'create_task_from_json']
\ No newline at end of file
+__all__ = ['AliceTask', 'ToolRegistry', 'Workflow', 'NodeResultCache', 'NODE_RESULT_CACHE', 'ExecutionCheckpoint', 'CheckpointStore', 'CHECKPOINT_STORE', 'checkpointing', 'PromptAgentTask', 'APITask', 'APISearchTask', 'GenerateImageTask', 'RetrievalTask', 'generate_node_responses_summary', 'validate_and_process_function_inputs',
+           'CheckTask', 'CodeExecutionLLMTask', 'CodeGenerationLLMTask', 'EmbeddingTask', 'TextToSpeechTask', 'WebScrapeBeautifulSoupTask', 'create_task_from_json',
+           'TASK_TYPES', 'TaskTypeRegistry', 'TaskCache', 'TASK_CACHE', 'task_version_key']
\ No newline at end of file
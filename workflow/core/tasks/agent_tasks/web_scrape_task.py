@@ -134,6 +134,7 @@ class WebScrapeBeautifulSoupTask(AliceTask):
     )
     required_apis: List[ApiType] = Field([ApiType.LLM_MODEL], description="A list of required APIs for the task")
     start_node: str = Field(default='fetch_url', description="The name of the starting node")
+    cached_nodes: List[str] = Field(default=['fetch_url'], description="Nodes whose results are replayed from the node result cache")
     node_end_code_routing: TasksEndCodeRouting = Field(default={
         'fetch_url': {
             0: ('generate_selectors_and_parse', False),
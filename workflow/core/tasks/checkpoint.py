@@ -0,0 +1,229 @@
+import asyncio, json, os, re, time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from pydantic import BaseModel, Field, ConfigDict
+import redis.asyncio as aioredis
+from workflow.core.data_structures import NodeResponse, ExecutionHistory, offload_node_references
+from workflow.util import LOGGER
+
+class NodeAttempts(BaseModel):
+    """Times a task ran a node, by exit code."""
+    parent_task_id: Optional[str] = Field(None, description="Id of the task that ran the node")
+    node_name: str = Field(..., description="Name of the node")
+    exit_codes: Dict[int, int] = Field(default_factory=dict, description="Number of runs by exit code")
+
+class ExecutionCheckpoint(BaseModel):
+    """
+    Snapshot of a task run, written when the root task pauses for a user interaction.
+
+    It holds the state the resume would otherwise rebuild from the stored TaskResponse:
+    - `nodes`: the node responses of the run, with outputs reaching the blob store's
+      `min_size` kept as blob handles, loaded only if read
+    - `attempts`: how many times each node ended with each exit code, for the retry limits
+    - `resolved_variables`: values of the node-named variables resolved during the run
+
+    From the stored response, the resume then only needs the paused node, which holds the
+    user's answer (see `restore_history`). A checkpoint only applies to a response with as
+    many nodes as it covers, so one left behind by an interrupted run is ignored instead of
+    resuming from the wrong place.
+    """
+    task_id: str = Field(..., description="Id of the task that wrote the checkpoint")
+    node_name: Optional[str] = Field(None, description="Node waiting for the user")
+    status: str = Field("pending", description="pending while waiting for a user interaction")
+    nodes: List[NodeResponse] = Field(default_factory=list, description="Node responses of the run, the paused node last")
+    attempts: List[NodeAttempts] = Field(default_factory=list, description="Runs of each node by exit code")
+    resolved_variables: Dict[str, str] = Field(default_factory=dict, description="Resolved values of node-named variables")
+    updated_at: float = Field(default_factory=time.time)
+
+    @classmethod
+    async def capture(
+        cls,
+        task_id: str,
+        node_name: str,
+        execution_history: List[NodeResponse],
+        node_responses: List[NodeResponse],
+    ) -> "ExecutionCheckpoint":
+        """
+        Snapshot of the run paused at `node_name`, whose nodes are `node_responses`. Large node
+        outputs are written to the blob store in a worker thread.
+        """
+        history = ExecutionHistory.wrap(node_responses)
+        nodes = await offload_node_references(history)
+        resolved_variables = {}
+        for source in (ExecutionHistory.wrap(execution_history), history):
+            for name, value in source.resolved_values().items():
+                # Only values of the run's own nodes, which the resumed history holds. The paused
+                # node is replaced on resume by the stored one, with the user's answer
+                if name != node_name and source.resolved_node(name) is history.resolved_node(name):
+                    resolved_variables[name] = value
+        return cls(
+            task_id=task_id,
+            node_name=node_name,
+            nodes=nodes,
+            attempts=[
+                NodeAttempts(parent_task_id=parent_task_id, node_name=name, exit_codes=counts)
+                for (parent_task_id, name), counts in history.exit_code_counts().items()
+            ],
+            resolved_variables=resolved_variables,
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self.nodes)
+
+    def applies_to(self, task_id: Optional[str], node_count: int) -> bool:
+        return self.task_id == task_id and self.node_count == node_count
+
+    def restore_history(self, paused_node: NodeResponse) -> ExecutionHistory:
+        """History of the run, ending with the stored `paused_node` instead of the one snapshotted."""
+        return ExecutionHistory.restore(
+            [*self.nodes[:-1], paused_node],
+            {(item.parent_task_id, item.node_name): item.exit_codes for item in self.attempts},
+            self.resolved_variables,
+        )
+
+    def model_dump(self, *args, **kwargs) -> Dict[str, Any]:
+        data = super().model_dump(*args, **kwargs)
+        # Offloaded outputs serialize as their handle
+        data["nodes"] = [node.model_dump(*args, **kwargs) for node in self.nodes]
+        return data
+
+    def model_dump_json(self, **kwargs) -> str:
+        return json.dumps(self.model_dump(mode="json"), default=str)
+
+class CheckpointStore(BaseModel):
+    """
+    Stores execution checkpoints by key, usually the id of the task response they resume.
+
+    Backends, by priority:
+    - Redis, shared between replicas and restarts, once `initialize` has been called
+    - One JSON file per checkpoint under `directory`, if set
+    - An in-process LRU of at most `max_size` checkpoints otherwise
+
+    Checkpoints expire after `ttl` seconds. Storage errors are logged and never fail the task:
+    a missing checkpoint only means the resume rebuilds its state from the history.
+    """
+    ttl: float = Field(float(os.getenv("CHECKPOINT_TTL", "604800")), description="Seconds a checkpoint is kept")
+    directory: str = Field(os.getenv("CHECKPOINT_DIR", ""), description="Directory of the disk backend, disabled if empty")
+    max_size: int = Field(int(os.getenv("CHECKPOINT_MAX_SIZE", "1024")), description="Maximum number of checkpoints kept in process")
+    redis_url: str = Field(os.getenv("REDIS_URL", "redis://redis:6379/0"), description="Redis used as backend")
+    key_prefix: str = Field(os.getenv("CHECKPOINT_PREFIX", "checkpoint:"), description="Prefix of the Redis keys")
+    entries: Dict[str, ExecutionCheckpoint] = Field(default_factory=OrderedDict, exclude=True)
+    redis_client: Optional[aioredis.Redis] = Field(None, exclude=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    async def initialize(self):
+        """Enables the Redis backend."""
+        self.redis_client = aioredis.from_url(self.redis_url)
+
+    async def cleanup(self):
+        if self.redis_client:
+            await self.redis_client.close()
+            self.redis_client = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^\w.-]", "_", key) + ".json")
+
+    def _expired(self, checkpoint: ExecutionCheckpoint) -> bool:
+        return checkpoint.updated_at + self.ttl <= time.time()
+
+    async def save(self, key: str, checkpoint: ExecutionCheckpoint):
+        try:
+            if self.redis_client:
+                await self.redis_client.set(self.key_prefix + key, checkpoint.model_dump_json(), ex=max(int(self.ttl), 1))
+            elif self.directory:
+                await asyncio.to_thread(self._write_file, key, checkpoint.model_dump_json())
+            else:
+                self.entries[key] = checkpoint.model_copy(deep=True)
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.max_size:
+                    self.entries.popitem(last=False)
+        except Exception as e:
+            LOGGER.error(f"Error saving checkpoint {key}: {e}")
+
+    def _write_file(self, key: str, data: str):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        # Written aside and renamed, so a crash never leaves a truncated checkpoint
+        with open(path + ".tmp", "w") as file:
+            file.write(data)
+        os.replace(path + ".tmp", path)
+
+    async def load(self, key: str) -> Optional[ExecutionCheckpoint]:
+        try:
+            if self.redis_client:
+                data = await self.redis_client.get(self.key_prefix + key)
+                checkpoint = ExecutionCheckpoint.model_validate_json(data) if data else None
+            elif self.directory:
+                data = await asyncio.to_thread(self._read_file, key)
+                checkpoint = ExecutionCheckpoint.model_validate_json(data) if data else None
+            else:
+                checkpoint = self.entries.get(key)
+                checkpoint = checkpoint.model_copy(deep=True) if checkpoint else None
+        except Exception as e:
+            LOGGER.error(f"Error loading checkpoint {key}: {e}")
+            return None
+        if checkpoint and self._expired(checkpoint):
+            await self.delete(key)
+            return None
+        return checkpoint
+
+    def _read_file(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key)) as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    async def delete(self, key: str):
+        try:
+            if self.redis_client:
+                await self.redis_client.delete(self.key_prefix + key)
+            elif self.directory:
+                await asyncio.to_thread(self._remove_file, key)
+            else:
+                self.entries.pop(key, None)
+        except Exception as e:
+            LOGGER.error(f"Error deleting checkpoint {key}: {e}")
+
+    def _remove_file(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+CHECKPOINT_STORE = CheckpointStore()
+
+class CheckpointScope(BaseModel):
+    """
+    Where the checkpoints of a run go: the task writing them and the key they're stored under,
+    if known. Without a key the checkpoint is only kept in `checkpoint` for the caller.
+    """
+    task_id: Optional[str]
+    key: Optional[str] = None
+    checkpoint: Optional[ExecutionCheckpoint] = None
+
+_checkpoint_scope: ContextVar[Optional[CheckpointScope]] = ContextVar("checkpoint_scope", default=None)
+
+@contextmanager
+def checkpointing(task_id: Optional[str], key: Optional[str] = None) -> Iterator[CheckpointScope]:
+    """
+    Checkpoints the run of task `task_id` made within the block under `key`, if it pauses for
+    a user interaction. Runs that don't pause write nothing.
+
+    Only the task with that id writes checkpoints: nested tasks run within the same context
+    but their state is part of the root task's history. Without a key (a new run, whose
+    response isn't stored yet) the checkpoint is only available as `scope.checkpoint`, and
+    the caller stores it once it knows the response id.
+    """
+    scope = CheckpointScope(task_id=task_id, key=key)
+    token = _checkpoint_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _checkpoint_scope.reset(token)
+
+def current_checkpoint_scope() -> Optional[CheckpointScope]:
+    return _checkpoint_scope.get()
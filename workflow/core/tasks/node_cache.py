@@ -0,0 +1,102 @@
+import hashlib, json, os, time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from pydantic import BaseModel, Field, ConfigDict
+import redis.asyncio as aioredis
+from workflow.core.data_structures import NodeResponse
+from workflow.util import LOGGER
+
+class NodeResultCache(BaseModel):
+    """
+    Memoizes successful node results of tasks, for the nodes listed in `AliceTask.cached_nodes`.
+
+    Results are keyed by task id, task version (`updatedAt`), node name and a stable hash of
+    the task inputs the node was run with, so retries and resumes replay the stored
+    NodeResponse instead of calling the external service again, and editing a task stops its
+    old results from being replayed. Only nodes whose result depends on nothing but the task
+    inputs (no earlier node outputs, no side effects on the task) and doesn't go stale within
+    `ttl` should opt in; search results, for instance, do change.
+
+    Lookups go through two tiers:
+    - An in-process LRU of at most `max_size` entries, each kept for `ttl` seconds.
+    - Redis, shared between replicas and restarts, once `initialize` has been called. Entries
+      expire after `ttl` seconds; size is bounded by the Redis eviction policy.
+
+    Redis errors are logged and treated as misses, the in-process tier keeps working.
+    """
+    ttl: float = Field(float(os.getenv("NODE_CACHE_TTL", "3600")), description="Seconds a node result is replayed")
+    max_size: int = Field(int(os.getenv("NODE_CACHE_MAX_SIZE", "256")), description="Maximum number of results kept in process")
+    redis_url: str = Field(os.getenv("REDIS_URL", "redis://redis:6379/0"), description="Redis holding the shared tier")
+    key_prefix: str = Field(os.getenv("NODE_CACHE_PREFIX", "node_cache:"), description="Prefix of the Redis keys")
+    entries: Dict[str, Tuple[float, NodeResponse]] = Field(default_factory=OrderedDict, exclude=True)
+    stats: Dict[str, int] = Field(default_factory=lambda: {"hits": 0, "redis_hits": 0, "misses": 0}, exclude=True)
+    redis_client: Optional[aioredis.Redis] = Field(None, exclude=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    async def initialize(self):
+        """Enables the Redis tier."""
+        self.redis_client = aioredis.from_url(self.redis_url)
+
+    async def cleanup(self):
+        if self.redis_client:
+            await self.redis_client.close()
+            self.redis_client = None
+
+    @staticmethod
+    def make_key(task_id: str, node_name: str, inputs: Dict[str, Any], version: Optional[str] = None) -> str:
+        def encode(value: Any) -> Any:
+            if isinstance(value, BaseModel):
+                return value.model_dump(mode="json")
+            return str(value)
+
+        payload = json.dumps({"task_id": task_id, "version": version, "node_name": node_name, "inputs": inputs}, sort_keys=True, default=encode)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[NodeResponse]:
+        """Returns a copy of the stored result, or None."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            expires_at, node_response = entry
+            if expires_at > time.monotonic():
+                self.entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return node_response.model_copy(deep=True)
+            del self.entries[key]
+
+        if self.redis_client:
+            try:
+                data = await self.redis_client.get(self.key_prefix + key)
+                if data:
+                    node_response = NodeResponse.model_validate_json(data)
+                    ttl = await self.redis_client.ttl(self.key_prefix + key)
+                    self._store(key, node_response, ttl if ttl > 0 else self.ttl)
+                    self.stats["redis_hits"] += 1
+                    return node_response.model_copy(deep=True)
+            except Exception as e:
+                LOGGER.error(f"Error reading node result {key} from Redis: {e}")
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, node_response: NodeResponse):
+        if self.ttl <= 0:
+            return
+        self._store(key, node_response.model_copy(deep=True), self.ttl)
+        if self.redis_client:
+            try:
+                await self.redis_client.set(self.key_prefix + key, node_response.model_dump_json(), ex=int(self.ttl))
+            except Exception as e:
+                LOGGER.error(f"Error writing node result {key} to Redis: {e}")
+
+    def _store(self, key: str, node_response: NodeResponse, ttl: float):
+        if self.max_size <= 0:
+            return
+        self.entries[key] = (time.monotonic() + ttl, node_response)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"size": len(self.entries), "max_size": self.max_size, "ttl": self.ttl, "redis": self.redis_client is not None, **self.stats}
+
+NODE_RESULT_CACHE = NodeResultCache()
@@ -0,0 +1,85 @@
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Type
+from pydantic import BaseModel, Field
+from workflow.core.tasks.task import AliceTask
+
+class TaskTypeRegistry(BaseModel):
+    """Task classes by `task_type`, the name of the class, as stored in task definitions."""
+    types: Dict[str, Type[AliceTask]] = Field(default_factory=dict)
+
+    def __init__(self, task_classes: Iterable[Type[AliceTask]] = (), **data):
+        super().__init__(**data)
+        for task_class in task_classes:
+            self.register(task_class)
+
+    def register(self, task_class: Type[AliceTask]) -> Type[AliceTask]:
+        self.types[task_class.__name__] = task_class
+        return task_class
+
+    def get(self, task_type: str) -> Optional[Type[AliceTask]]:
+        return self.types.get(task_type)
+
+    def __contains__(self, task_type: str) -> bool:
+        return task_type in self.types
+
+def task_version_key(task_dict: Dict[str, Any]) -> Optional[Tuple[Hashable, ...]]:
+    """
+    Identifies a stored task definition: its type, id and `updatedAt`, followed by the id and
+    `updatedAt` of every entity populated into it (subtasks, prompts, ...), whose edits don't
+    bump the task's own `updatedAt`. None if the task, or any embedded entity, has no version.
+    """
+    versions = []
+
+    def collect(value: Any) -> bool:
+        if isinstance(value, dict):
+            if "_id" in value:
+                if not value.get("updatedAt"):
+                    return False
+                versions.append((str(value["_id"]), str(value["updatedAt"])))
+            return all(collect(item) for item in value.values())
+        if isinstance(value, list):
+            return all(collect(item) for item in value)
+        # Already built entities carry no version the key could follow
+        return not isinstance(value, BaseModel)
+
+    if not task_dict.get("task_type") or "_id" not in task_dict or not collect(task_dict):
+        return None
+    return (task_dict["task_type"], *versions)
+
+class TaskCache(BaseModel):
+    """
+    LRU of tasks built from stored definitions, keyed by `task_version_key`.
+
+    Building a task validates its whole definition, including nested tasks and routing, which
+    dominates loading a chat with many tools. Definitions seen before are instead served as a
+    deep copy of the task built the first time: callers own the task they get and can mutate it
+    (tasks are mutated while they run). Editing the task, or anything populated into it, changes
+    its key, so stale entries are never served and simply age out.
+    """
+    max_size: int = Field(int(os.getenv("TASK_CACHE_MAX_SIZE", "512")), description="Maximum number of cached task definitions")
+    entries: Dict[Hashable, AliceTask] = Field(default_factory=OrderedDict, exclude=True)
+    stats: Dict[str, int] = Field(default_factory=lambda: {"hits": 0, "misses": 0}, exclude=True)
+
+    def get_or_create(self, task_dict: Dict[str, Any], create: Callable[[Dict[str, Any]], AliceTask]) -> AliceTask:
+        """Returns the task for `task_dict`, calling `create(task_dict)` to build it if not cached."""
+        key = task_version_key(task_dict) if self.max_size > 0 else None
+        if key is None:
+            return create(task_dict)
+        task = self.entries.get(key)
+        if task is not None:
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return task.model_copy(deep=True)
+
+        self.stats["misses"] += 1
+        task = create(task_dict)
+        self.entries[key] = task.model_copy(deep=True)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return task
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"size": len(self.entries), "max_size": self.max_size, **self.stats}
+
+TASK_CACHE = TaskCache()
@@ -0,0 +1,167 @@
+import hashlib, json, os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+from workflow.core.data_structures.base_models import TasksEndCodeRouting, RouteMapTuple
+from workflow.util import LOGGER
+
+def normalize_routing(routing: Dict[str, Dict[Any, Any]]) -> TasksEndCodeRouting:
+    """
+    Converts routing as stored in the database (string exit codes, list or dict routes) to
+    the `{node: {exit_code: (next_node, is_retry)}}` form used internally. Invalid routes are
+    skipped with a warning, as are nodes left without any valid route.
+    """
+    converted_routing = {}
+    for node, routes in routing.items():
+        converted_routes = {}
+        for code, route in routes.items():
+            try:
+                code_key = int(code) if isinstance(code, str) else code
+                if isinstance(route, (list, tuple)):
+                    if len(route) < 2:
+                        LOGGER.warning(f"Invalid route format for {node}.{code}: {route}")
+                        continue
+                    converted_routes[code_key] = (route[0], bool(route[1]))
+                elif isinstance(route, dict):
+                    converted_routes[code_key] = (route.get(0), bool(route.get(1, False)))
+                else:
+                    LOGGER.warning(f"Unexpected route format for {node}.{code}: {route}")
+            except (ValueError, TypeError, IndexError) as e:
+                LOGGER.error(f"Error processing route for {node}.{code}: {str(e)}")
+
+        if converted_routes:
+            converted_routing[node] = converted_routes
+        else:
+            LOGGER.warning(f"No valid routes found for node {node}")
+    return converted_routing
+
+class CompiledRouting(BaseModel):
+    """
+    Transition table compiled from a task's `node_end_code_routing`.
+
+    Built once per task definition and shared between every instance of it, so it is never
+    mutated after compilation (and is not copied when a task is deep-copied). Compiling also
+    checks the routing and records the problems found in `issues`:
+    - nodes, or route targets, without an implementation
+    - nodes that cannot be reached from the start node
+    - exit codes routing to a node that has no routing rules, where execution would stop
+    """
+    routing: TasksEndCodeRouting
+    transitions: Dict[Tuple[str, int], RouteMapTuple]
+    retry_codes: Dict[str, FrozenSet[int]]
+    success_codes: Dict[str, FrozenSet[int]]
+    default_codes: Dict[str, int]
+    start_node: Optional[str] = None
+    issues: Tuple[str, ...] = ()
+    model_config = ConfigDict(frozen=True)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def next_node(self, node_name: str, exit_code: int) -> Optional[RouteMapTuple]:
+        """The route for an exit code, (None, False) for codes without one, None for unrouted nodes."""
+        if node_name not in self.routing:
+            return None
+        return self.transitions.get((node_name, exit_code), (None, False))
+
+    def is_retry(self, node_name: str, exit_code: int) -> bool:
+        return exit_code in self.retry_codes[node_name]
+
+    def available_exit_code(self, node_name: str, desired_code: int) -> int:
+        """The desired code if the node routes it, otherwise 0 if routed, otherwise its lowest code."""
+        if node_name not in self.routing:
+            return 0
+        if (node_name, desired_code) in self.transitions:
+            return desired_code
+        return self.default_codes[node_name]
+
+def compile_routing(
+    routing: TasksEndCodeRouting,
+    start_node: Optional[str] = None,
+    has_implementation: Optional[Callable[[str], bool]] = None,
+    groups: Optional[Dict[str, List[str]]] = None,
+) -> CompiledRouting:
+    """
+    Compiles normalized routing into a CompiledRouting.
+
+    Args:
+        routing: Routing in normalized form, see normalize_routing
+        start_node: The node execution starts from, defaults to the first routed node
+        has_implementation: Tells whether the task can execute a node. Skipped if not given
+        groups: Parallel node groups, whose members are reached through the group
+    """
+    groups = groups or {}
+    transitions = {(node, code): route for node, routes in routing.items() for code, route in routes.items()}
+    retry_codes = {node: frozenset(code for code, (_, is_retry) in routes.items() if is_retry) for node, routes in routing.items()}
+    success_codes = {node: frozenset(code for code, (_, is_retry) in routes.items() if not is_retry) for node, routes in routing.items()}
+    default_codes = {node: (0 if 0 in routes or not routes else min(routes)) for node, routes in routing.items()}
+    start = start_node or next(iter(routing), None)
+
+    issues = []
+    if has_implementation:
+        nodes = (set(routing) | {target for target, _ in transitions.values() if target} | {start}) - {None}
+        for node in sorted(nodes):
+            if node in groups:
+                continue
+            if not has_implementation(node):
+                issues.append(f"Node {node} has no implementation")
+    for group, members in groups.items():
+        if group not in routing:
+            issues.append(f"Parallel group {group} has no routing rules")
+
+    for (node, code), (target, _) in transitions.items():
+        if target and target not in routing:
+            issues.append(f"Exit code {code} of node {node} routes to {target}, which has no routing rules")
+
+    reachable, pending = set(), [start] if start else []
+    while pending:
+        node = pending.pop()
+        if node in reachable:
+            continue
+        reachable.add(node)
+        pending.extend(groups.get(node, []))
+        pending.extend(target for target, _ in routing.get(node, {}).values() if target)
+    for node in routing:
+        if node not in reachable:
+            issues.append(f"Node {node} is not reachable from {start}")
+
+    return CompiledRouting(
+        routing=routing,
+        transitions=transitions,
+        retry_codes=retry_codes,
+        success_codes=success_codes,
+        default_codes=default_codes,
+        start_node=start,
+        issues=tuple(issues),
+    )
+
+def routing_digest(routing: TasksEndCodeRouting, start_node: Optional[str], groups: Optional[Dict[str, List[str]]] = None) -> str:
+    """Stable digest of a routing definition, used as its version when the task has none."""
+    payload = json.dumps(
+        {"routing": {node: {str(code): route for code, route in routes.items()} for node, routes in routing.items()},
+         "start_node": start_node, "groups": groups or {}},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class RoutingCache(BaseModel):
+    """LRU of compiled routing, keyed by task type, task id and task version."""
+    max_size: int = Field(int(os.getenv("ROUTING_CACHE_MAX_SIZE", "1024")), description="Maximum number of compiled task definitions")
+    entries: Dict[Hashable, CompiledRouting] = Field(default_factory=OrderedDict, exclude=True)
+
+    def get(self, key: Hashable) -> Optional[CompiledRouting]:
+        compiled = self.entries.get(key)
+        if compiled is not None:
+            self.entries.move_to_end(key)
+        return compiled
+
+    def set(self, key: Hashable, compiled: CompiledRouting):
+        self.entries[key] = compiled
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def evict(self, key: Hashable):
+        self.entries.pop(key, None)
+
+ROUTING_CACHE = RoutingCache()
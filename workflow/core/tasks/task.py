@@ -1,6 +1,7 @@
+import asyncio
 from enum import Enum
-from typing import Dict, Any, Optional, List, Tuple
-from pydantic import BaseModel, Field, model_validator
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from workflow.core.agent import AliceAgent
 from workflow.core.api import APIManager, APIEngine
 from workflow.core.data_structures import (
@@ -13,14 +14,19 @@ from workflow.core.data_structures import (
     TaskResponse,
     DataCluster,
     NodeResponse,
+    ExecutionHistory,
+    offload_node_references,
+    load_node_references,
     UserInteraction,
     UserCheckpoint,
-    NodeResponse,
     TasksEndCodeRouting,
     Prompt,
     BaseDataStructure,
 )
-from workflow.util import LOGGER, convert_value_to_type, get_traceback
+from workflow.util import LOGGER, convert_value_to_type, get_traceback, deadline_scope, span, TIMEOUT_EXIT_CODE
+from workflow.core.tasks.node_cache import NODE_RESULT_CACHE
+from workflow.core.tasks.checkpoint import CHECKPOINT_STORE, ExecutionCheckpoint, current_checkpoint_scope
+from workflow.core.tasks.routing import CompiledRouting, ROUTING_CACHE, normalize_routing, compile_routing, routing_digest
 from workflow.core.tasks.task_utils import (
     validate_and_process_function_inputs,
     generate_node_responses_summary,
@@ -43,6 +49,7 @@ class AliceTask(BaseDataStructure):
         - Tasks are divided into nodes that execute sequentially
         - Node routing is controlled by exit codes and routing rules
         - Support for conditional execution paths and retries
+        - Independent nodes can be grouped to run concurrently
 
     * User Interaction:
         - Built-in support for user checkpoints
@@ -82,6 +89,22 @@ class AliceTask(BaseDataStructure):
     node_end_code_routing : TasksEndCodeRouting
         Dictionary defining routing rules between nodes based on exit codes
 
+    parallel_nodes : Dict[str, List[str]]
+        Groups of independent nodes that run concurrently. A group name is used as a
+        routing target and routed on like a node once every member has finished
+
+    cached_nodes : List[str]
+        Nodes whose successful results are memoized by task inputs and replayed on later runs
+
+    task_timeout : Optional[float]
+        Time budget of a run of the task in seconds, shared by all its nodes and subtasks
+
+    node_timeouts : Dict[str, float]
+        Maximum time in seconds each listed node can run for
+
+    parallel_safe : bool
+        Whether the task can run as a tool call concurrently with the other calls of a turn
+
     user_checkpoints : Dict[str, UserCheckpoint]
         Node-specific user interaction checkpoints
 
@@ -142,9 +165,26 @@ class AliceTask(BaseDataStructure):
         - Maximum retry attempts are enforced automatically
 
     3. User Interaction:
-        - User checkpoints can be added to any node
+        - User checkpoints can be added to any node outside a parallel group
         - Responses are automatically handled in the execution flow
         - Task execution pauses at checkpoints until user input is received
+
+    4. Parallel Groups:
+        - Members of a group must not read each other's outputs, they all see the
+          history as it was when the group started
+        - Each member is retried according to its own routing (a retry route back to
+          itself); any other member route is ignored, the group's route decides
+        - The group ends with exit code 0 if every member ended with 0, otherwise with
+          the first non-zero member exit code, in declared order
+        - Member responses are recorded in declared order, so `execution_order` does
+          not depend on which member finished first
+
+    5. Timeouts:
+        - A node stops when its own timeout or the deadline of the run, whichever comes
+          first, expires. It then ends with exit code 124 (TIMEOUT_EXIT_CODE), which can
+          be routed like any other code
+        - The deadline is carried in the execution context: subtasks, API engines and
+          code execution only get the time left, and SDK request timeouts are set to it
     """
 
     # Basic task debugrmation
@@ -163,9 +203,26 @@ class AliceTask(BaseDataStructure):
     node_end_code_routing: TasksEndCodeRouting = Field(
         default={}, description="Routing rules between nodes based on exit codes"
     )
+    parallel_nodes: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Groups of independent nodes run concurrently, keyed by the group name used in routing",
+    )
+    cached_nodes: List[str] = Field(
+        default_factory=list,
+        description="Nodes whose results only depend on the task inputs and can be replayed from the node result cache",
+    )
     user_checkpoints: Dict[str, UserCheckpoint] = Field(
         default_factory=dict, description="Node-specific user interaction checkpoints"
     )
+    task_timeout: Optional[float] = Field(
+        default=None, gt=0, description="Time budget of a run of the task, in seconds"
+    )
+    node_timeouts: Dict[str, float] = Field(
+        default_factory=dict, description="Maximum time in seconds each listed node can run for"
+    )
+    parallel_safe: bool = Field(
+        True, description="Whether the task can run as a tool call concurrently with other tool calls. Disable for tasks whose side effects depend on the order of the calls"
+    )
 
     # Task configuration
     input_variables: FunctionParameters = Field(
@@ -205,6 +262,7 @@ class AliceTask(BaseDataStructure):
     data_cluster: Optional[DataCluster] = Field(
         default=None, description="Associated data cluster"
     )
+    _routing: Optional[CompiledRouting] = PrivateAttr(default=None)
 
     @property
     def task_type(self) -> str:
@@ -216,64 +274,21 @@ class AliceTask(BaseDataStructure):
         """
         Converts list-format routing values from database to tuples for internal use.
         Handles both string-keyed and int-keyed dictionaries with robust error handling.
+        Routing already compiled for the same task version is reused as is.
         """
         routing = values.get("node_end_code_routing")
         if not routing:
             return values
 
-        try:
-            LOGGER.debug(f"Processing routing data: {routing}")
-            converted_routing = {}
-
-            for node, routes in routing.items():
-                LOGGER.debug(f"Processing node {node} with routes: {routes}")
-                converted_routes = {}
-
-                for code, route in routes.items():
-                    try:
-                        # Convert string codes to int
-                        code_key = int(code) if isinstance(code, str) else code
-
-                        # Handle different input formats
-                        if isinstance(route, (list, tuple)):
-                            if len(route) < 2:
-                                LOGGER.warning(
-                                    f"Invalid route format for {node}.{code}: {route}"
-                                )
-                                continue
-
-                            first_elem = route[0] if route[0] is not None else None
-                            second_elem = bool(route[1])  # Ensure boolean
-                            converted_routes[code_key] = (first_elem, second_elem)
-
-                        elif isinstance(route, dict):
-                            # Handle possible dictionary format
-                            first_elem = (
-                                route.get(0) if route.get(0) is not None else None
-                            )
-                            second_elem = bool(route.get(1, False))
-                            converted_routes[code_key] = (first_elem, second_elem)
-
-                        else:
-                            LOGGER.warning(
-                                f"Unexpected route format for {node}.{code}: {route}"
-                            )
-                            continue
-
-                    except (ValueError, TypeError, IndexError) as e:
-                        LOGGER.error(
-                            f"Error processing route for {node}.{code}: {str(e)}"
-                        )
-                        continue
-
-                if converted_routes:  # Only add if we have valid routes
-                    converted_routing[node] = converted_routes
-                else:
-                    LOGGER.warning(f"No valid routes found for node {node}")
-
-            LOGGER.debug(f"Converted routing: {converted_routing}")
-            values["node_end_code_routing"] = converted_routing
+        key = cls.routing_cache_key(values.get("_id", values.get("id")), values.get("updatedAt"))
+        compiled = ROUTING_CACHE.get(key) if key else None
+        if compiled:
+            values["node_end_code_routing"] = compiled.routing
+            return values
 
+        try:
+            values["node_end_code_routing"] = normalize_routing(routing)
+            LOGGER.debug(f"Converted routing: {values['node_end_code_routing']}")
         except Exception as e:
             LOGGER.error(f"Error converting routing data: {str(e)}")
             LOGGER.error(f"Original routing data: {routing}")
@@ -281,6 +296,83 @@ class AliceTask(BaseDataStructure):
 
         return values
 
+    @model_validator(mode="after")
+    def compile_node_routing(self):
+        """Compiles the routing, or reuses the compiled routing of the same task version."""
+        self._routing = self.get_compiled_routing()
+        return self
+
+    @model_validator(mode="after")
+    def validate_parallel_nodes(self):
+        """Rejects parallel groups that could not be joined deterministically."""
+        for group, members in self.parallel_nodes.items():
+            if not members:
+                raise ValueError(f"Parallel group {group} has no nodes")
+            if group in members or any(member in self.parallel_nodes for member in members):
+                raise ValueError(f"Parallel group {group} cannot contain groups")
+            if len(set(members)) != len(members):
+                raise ValueError(f"Parallel group {group} lists a node more than once")
+            # Execution cannot pause halfway through a group
+            checkpoints = [member for member in members if member in self.user_checkpoints]
+            if checkpoints:
+                raise ValueError(
+                    f"Nodes {checkpoints} in parallel group {group} cannot have user checkpoints"
+                )
+        return self
+
+    # Routing
+    @classmethod
+    def routing_cache_key(cls, task_id: Optional[str], version: Optional[str]) -> Optional[Tuple[str, str, str]]:
+        """Key of a stored task definition in the routing cache, None for unsaved tasks."""
+        if not task_id or not version:
+            return None
+        return (cls.__name__, str(task_id), str(version))
+
+    def get_compiled_routing(self) -> CompiledRouting:
+        """
+        Returns the compiled routing of this task definition, compiling it on first use.
+        Stored tasks are keyed by id and `updatedAt`, other tasks by a digest of their routing.
+        Problems found while compiling are logged once per definition.
+        """
+        key = self.routing_cache_key(self.id, getattr(self, "updatedAt", None)) or (
+            self.__class__.__name__,
+            self.id,
+            routing_digest(self.node_end_code_routing, self.start_node, self.parallel_nodes),
+        )
+        compiled = ROUTING_CACHE.get(key)
+        if compiled is None:
+            compiled = compile_routing(
+                self.node_end_code_routing, self.start_node, self.has_node_implementation, self.parallel_nodes
+            )
+            for issue in compiled.issues:
+                LOGGER.warning(f"Routing of task {self.task_name}: {issue}")
+            ROUTING_CACHE.set(key, compiled)
+        return compiled
+
+    @property
+    def routing_table(self) -> CompiledRouting:
+        if self._routing is None:
+            self._routing = self.get_compiled_routing()
+        return self._routing
+
+    def invalidate_routing(self):
+        """
+        Drops the compiled routing. Reassigning the routing fields does this automatically; call
+        it after changing `node_end_code_routing` in place.
+        """
+        key = self.routing_cache_key(self.id, getattr(self, "updatedAt", None))
+        if key:
+            ROUTING_CACHE.evict(key)
+        self._routing = None
+
+    def has_node_implementation(self, node_name: str) -> bool:
+        return hasattr(self, f"execute_{node_name}")
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in ("node_end_code_routing", "start_node", "parallel_nodes"):
+            self.invalidate_routing()
+
     def model_dump(self, *args, exclude=None, **kwargs):
         """
         Serializes the AliceTask instance to a dictionary, ensuring proper handling of:
@@ -416,6 +508,7 @@ class AliceTask(BaseDataStructure):
             - API validation occurs before any node execution
             - Node routing follows configured routing rules
             - Execution history is preserved in the response
+            - Within a `checkpointing` block for this task, a checkpoint is written if the run pauses
 
         Example:
             ```python
@@ -437,78 +530,111 @@ class AliceTask(BaseDataStructure):
                 print(response.result_diagnostic)
             ```
         """
-        execution_history = execution_history or []
-        node_responses: List[NodeResponse] = node_responses or []
-
-        try:
-            # Validate and process inputs
-            processed_inputs, error_msg = validate_and_process_function_inputs(
-                params=self.input_variables,
-                execution_history=execution_history,
-                kwargs=kwargs,
-            )
-            if error_msg:
-                return self.get_failed_task_response(error_msg, **kwargs)
-
-            # Update kwargs with processed inputs
-            kwargs.update(processed_inputs)
-
-            # Validate required APIs
-            if self.required_apis:
-                api_manager = kwargs.get("api_manager")
-                if not api_manager:
-                    return self.get_failed_task_response(
-                        "API manager not provided", **kwargs
-                    )
-                if not self.validate_required_apis(api_manager):
-                    return self.get_failed_task_response(
-                        "Required APIs not available", **kwargs
-                    )
+        # Indexed so the per-node lookups below don't scan the history. Nested tasks receive
+        # this same object and append their own nodes to it
+        execution_history = ExecutionHistory.wrap(execution_history)
+        # Indexed too, so output templates resolve node outputs from its resolved-variable table
+        node_responses = ExecutionHistory.wrap(node_responses)
+
+        # Nodes, subtasks and API calls made in the run share the task's time budget
+        with deadline_scope(self.task_timeout), span(self.task_name, "task", task_id=self.id, task_type=self.task_type):
+            try:
+                # Validate and process inputs
+                processed_inputs, error_msg = validate_and_process_function_inputs(
+                    params=self.input_variables,
+                    execution_history=execution_history,
+                    kwargs=kwargs,
+                )
+                if error_msg:
+                    return self.get_failed_task_response(error_msg, **kwargs)
+
+                # Update kwargs with processed inputs
+                kwargs.update(processed_inputs)
+
+                # Validate required APIs
+                if self.required_apis:
+                    api_manager = kwargs.get("api_manager")
+                    if not api_manager:
+                        return self.get_failed_task_response(
+                            "API manager not provided", **kwargs
+                        )
+                    if not self.validate_required_apis(api_manager):
+                        return self.get_failed_task_response(
+                            "Required APIs not available", **kwargs
+                        )
 
-            # Determine starting node based on execution history
-            current_node = self.resolve_next_node(execution_history)
-            LOGGER.debug(f'Starting task "{self.task_name}" from node "{current_node}"')
+                # Determine starting node based on execution history
+                current_node = self.resolve_next_node(execution_history)
+                LOGGER.debug(f'Starting task "{self.task_name}" from node "{current_node}"')
 
-            # Execute nodes
-            while current_node:
-                # Execute current node
-                node_response = await self.execute_node(
-                    current_node, execution_history, node_responses, **kwargs
-                )
+                # Execute nodes
+                while current_node:
+                    if current_node in self.parallel_nodes:
+                        # Records the members and returns the join response
+                        node_response = await self.execute_parallel_nodes(
+                            current_node, execution_history, node_responses, **kwargs
+                        )
+                    else:
+                        # Execute current node
+                        node_response = await self.execute_node(
+                            current_node, execution_history, node_responses, **kwargs
+                        )
 
-                # Handle user interaction
-                if (
-                    node_response.references
-                    and node_response.references.user_interactions
-                ):
-                    LOGGER.debug(f"User interaction detected for node {current_node}")
-                    LOGGER.debug(
-                        f"Node response user interaction: {node_response.references.user_interactions[0]}"
-                    )
+                        # Handle user interaction
+                        if (
+                            node_response.references
+                            and node_response.references.user_interactions
+                        ):
+                            LOGGER.debug(f"User interaction detected for node {current_node}")
+                            LOGGER.debug(
+                                f"Node response user interaction: {node_response.references.user_interactions[0]}"
+                            )
+                            node_responses.append(node_response)
+                            await self.save_checkpoint(current_node, execution_history, node_responses)
+                            await load_node_references(node_responses)
+                            return await self.offload_outputs(self.create_partial_response(
+                                node_responses, "pending", **kwargs
+                            ))
+
+                    execution_history.append(node_response)
                     node_responses.append(node_response)
-                    return self.create_partial_response(
-                        node_responses, "pending", **kwargs
-                    )
 
-                execution_history.append(node_response)
-                node_responses.append(node_response)
+                    # Get next node
+                    next_node, is_retry = self.get_next_node(node_response)
+                    if is_retry:
+                        if not self.can_retry_node(next_node, execution_history):
+                            LOGGER.warning(f"Cannot retry node {next_node}")
+                            break
+                    current_node = next_node
+                # The response summarizes every node output
+                await load_node_references(node_responses)
+                return await self.offload_outputs(self.create_final_response(
+                    node_responses, execution_history=execution_history, **kwargs
+                ))
 
-                # Get next node
-                next_node, is_retry = self.get_next_node(node_response)
-                if is_retry:
-                    if not self.can_retry_node(next_node, execution_history):
-                        LOGGER.warning(f"Cannot retry node {next_node}")
-                        break
-                current_node = next_node
-            return self.create_final_response(
-                node_responses, execution_history=execution_history, **kwargs
-            )
+            except Exception as e:
+                LOGGER.error(
+                    f"Error executing task {self.task_name}: {str(e)}\n{get_traceback()}"
+                )
+                return self.get_failed_task_response(str(e) + get_traceback(), **kwargs)
 
-        except Exception as e:
-            LOGGER.error(
-                f"Error executing task {self.task_name}: {str(e)}\n{get_traceback()}"
-            )
-            return self.get_failed_task_response(str(e) + get_traceback(), **kwargs)
+    async def save_checkpoint(
+        self,
+        node_name: str,
+        execution_history: List[NodeResponse],
+        node_responses: List[NodeResponse],
+    ) -> None:
+        """
+        Writes the checkpoint of the current run, paused at `node_name`, if it is being
+        checkpointed for this task. The checkpoint covers the nodes in `node_responses`, which
+        is what the stored response of a paused run holds.
+        """
+        scope = current_checkpoint_scope()
+        if not scope or not self.id or scope.task_id != self.id:
+            return
+        scope.checkpoint = await ExecutionCheckpoint.capture(self.id, node_name, execution_history, node_responses)
+        if scope.key:
+            await CHECKPOINT_STORE.save(scope.key, scope.checkpoint)
 
     async def execute_node(
         self,
@@ -556,6 +682,7 @@ class AliceTask(BaseDataStructure):
             - User checkpoints take precedence over node execution
             - Node output can update variables if their names match input parameters
             - All errors are captured and returned in NodeResponse format
+            - Nodes running past their timeout or the run's deadline end with TIMEOUT_EXIT_CODE
 
         Example:
             ```python
@@ -600,11 +727,27 @@ class AliceTask(BaseDataStructure):
                 execution_order=len(execution_history),
             )
 
-        # Execute node method
+        # Execute node method, or replay its memoized result
+        cache_key = self.get_node_cache_key(node_name, kwargs)
         try:
-            node_response: NodeResponse = await getattr(self, method_name)(
-                execution_history, node_responses, **kwargs
-            )
+            with deadline_scope(self.node_timeouts.get(node_name)) as time_left, \
+                    span(node_name, "node", task_name=self.task_name) as node_span:
+                node_response: Optional[NodeResponse] = await NODE_RESULT_CACHE.get(cache_key) if cache_key else None
+                if node_response:
+                    LOGGER.debug(f"Replaying cached result for node {node_name} in task {self.task_name}")
+                    node_response.parent_task_id = self.id
+                    node_response.execution_order = len(execution_history)
+                    if node_span:
+                        node_span.set_attributes(cached=True)
+                else:
+                    node_response = await asyncio.wait_for(
+                        getattr(self, method_name)(execution_history, node_responses, **kwargs), time_left
+                    )
+                    if cache_key and node_response.exit_code == 0:
+                        await NODE_RESULT_CACHE.set(cache_key, node_response)
+                if node_span:
+                    node_span.set_attributes(exit_code=node_response.exit_code)
+                    node_span.add_references_usage(node_response.references)
             # Update kwargs if node name exists as a variable
             if node_name in kwargs:
                 try:
@@ -623,6 +766,9 @@ class AliceTask(BaseDataStructure):
                     )
 
             return node_response
+        except asyncio.TimeoutError as e:
+            LOGGER.warning(f"Node {node_name} in task {self.task_name} timed out: {str(e)}")
+            return self.get_timeout_node_response(node_name, execution_history)
         except Exception as e:
             LOGGER.error(f"Error executing node {node_name}: {str(e)}")
             return NodeResponse(
@@ -642,8 +788,100 @@ class AliceTask(BaseDataStructure):
                 execution_order=len(execution_history),
             )
 
+    def get_timeout_node_response(self, node_name: str, execution_history: List[NodeResponse]) -> NodeResponse:
+        """Response of a node that ran out of time, ending with TIMEOUT_EXIT_CODE."""
+        limit = self.node_timeouts.get(node_name)
+        reason = f"its timeout of {limit} seconds" if limit else "the deadline of the run"
+        return NodeResponse(
+            parent_task_id=self.id,
+            node_name=node_name,
+            exit_code=TIMEOUT_EXIT_CODE,
+            references=References(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"Node {node_name} in task {self.task_name} was stopped by {reason}",
+                        "generated_by": "system",
+                    }
+                ]
+            ),
+            execution_order=len(execution_history),
+        )
+
+    def get_node_cache_key(self, node_name: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Returns the node result cache key for a run of the node, or None if the node is not cached."""
+        if node_name not in self.cached_nodes or not self.id:
+            return None
+        inputs = {name: kwargs.get(name) for name in self.input_variables.properties}
+        version = getattr(self, "updatedAt", None)
+        return NODE_RESULT_CACHE.make_key(self.id, node_name, inputs, str(version) if version else None)
+
+    async def execute_parallel_nodes(
+        self,
+        group_name: str,
+        execution_history: List[NodeResponse],
+        node_responses: List[NodeResponse],
+        **kwargs,
+    ) -> NodeResponse:
+        """
+        Runs the nodes of a parallel group concurrently and joins them.
+
+        Every member runs against a copy of the history taken when the group (or its
+        current retry round) started. Member responses are appended to `execution_history`
+        and `node_responses` in declared order, with `execution_order` reassigned to match,
+        so the recorded history is the same whichever member finishes first. Members whose
+        routing sends them back to themselves as a retry are run again, together, while
+        `can_retry_node` allows it.
+
+        Args:
+            group_name (str): Name of the group in `parallel_nodes`
+            execution_history (List[NodeResponse]): Complete history of all node executions in this task
+            node_responses (List[NodeResponse]): List of responses from nodes executed in current task
+            **kwargs: Additional keyword arguments passed to every member
+
+        Returns:
+            NodeResponse: The join response for the group, not yet appended to the history.
+                Its exit code is 0 if every member ended with 0, otherwise the first non-zero
+                member exit code in declared order.
+        """
+        members = self.parallel_nodes[group_name]
+        final_responses: Dict[str, NodeResponse] = {}
+        pending = list(members)
+        while pending:
+            LOGGER.debug(f"Running nodes {pending} of parallel group {group_name} in task {self.task_name}")
+            responses = await asyncio.gather(*[
+                self.execute_node(node_name, ExecutionHistory(execution_history), list(node_responses), **kwargs)
+                for node_name in pending
+            ])
+            retries = []
+            for node_name, node_response in zip(pending, responses):
+                node_response.execution_order = len(execution_history)
+                execution_history.append(node_response)
+                node_responses.append(node_response)
+                final_responses[node_name] = node_response
+
+                next_node, is_retry = self.get_next_node(node_response) or (None, False)
+                if is_retry and next_node == node_name:
+                    if self.can_retry_node(node_name, execution_history):
+                        retries.append(node_name)
+                    else:
+                        LOGGER.warning(f"Cannot retry node {node_name}")
+            pending = retries
+
+        exit_code = next(
+            (final_responses[node_name].exit_code for node_name in members if final_responses[node_name].exit_code != 0),
+            0,
+        )
+        return NodeResponse(
+            parent_task_id=self.id,
+            node_name=group_name,
+            exit_code=exit_code,
+            references=References(),
+            execution_order=len(execution_history),
+        )
+
     async def run_from_task_response(
-        self, task_response: TaskResponse, **kwargs
+        self, task_response: TaskResponse, checkpoint: Optional[ExecutionCheckpoint] = None, **kwargs
     ) -> TaskResponse:
         """
         Continues execution of a task from a previous TaskResponse.
@@ -653,6 +891,9 @@ class AliceTask(BaseDataStructure):
 
         Args:
             task_response (TaskResponse): Previous task response to continue from
+            checkpoint (Optional[ExecutionCheckpoint]): Checkpoint written when the task paused, if
+                stored and it applies to the response. The history is then restored from it, and
+                only the last (paused) node of `task_response.node_references` is read
             **kwargs: Additional task parameters
 
         Returns:
@@ -665,9 +906,16 @@ class AliceTask(BaseDataStructure):
             )
             return task_response
 
-        # Get execution history from task response
-        node_responses = task_response.node_references or []
-        execution_history = node_responses
+        if checkpoint:
+            # The checkpoint holds the state of the run, the response only its paused node,
+            # answered by the user
+            LOGGER.debug(f'Restoring task "{self.task_name}" from checkpoint at node "{checkpoint.node_name}"')
+            execution_history = checkpoint.restore_history(task_response.node_references[-1])
+            node_responses = execution_history.copy()
+        else:
+            # Get execution history from task response
+            node_responses = task_response.node_references or []
+            execution_history = node_responses
 
         # Update task inputs with original inputs
         if task_response.task_inputs:
@@ -686,17 +934,16 @@ class AliceTask(BaseDataStructure):
         Handles user checkpoints. This method can be called by subclasses before their specific logic.
         Returns a NodeResponse if a user interaction is needed, None otherwise.
         """
-        execution_history = execution_history or []
         node_name = node_name or self.start_node or "default"
         LOGGER.debug(f"Checking user checkpoints for node {node_name}")
 
         if node_name in self.user_checkpoints:
+            execution_history = ExecutionHistory.wrap(execution_history)
             completed_interaction = next(
                 (
                     node
-                    for node in reversed(execution_history)
-                    if node.node_name == node_name
-                    and node.references.user_interactions
+                    for node in reversed(execution_history.by_name(node_name))
+                    if node.references.user_interactions
                     and node.references.user_interactions[-1].user_response is not None
                 ),
                 None,
@@ -744,12 +991,15 @@ class AliceTask(BaseDataStructure):
         self, node_name: str, execution_history: List[NodeResponse]
     ) -> int:
         """Count previous attempts for a specific node in this task."""
-        return sum(
-            1
-            for node in execution_history
-            if node.parent_task_id == self.id
-            and node.node_name == node_name
-            and self.is_exit_code_retry(node.node_name, node.exit_code)
+        execution_history = ExecutionHistory.wrap(execution_history)
+        if node_name not in self.node_end_code_routing:
+            LOGGER.warning(
+                f"No routing rules found for node {node_name} in {self.task_name} with end_code_routing: {self.node_end_code_routing}"
+            )
+            # Every exit code counts as a retry, as in is_exit_code_retry
+            return execution_history.count_attempts(self.id, node_name)
+        return execution_history.count_attempts(
+            self.id, node_name, self.routing_table.retry_codes[node_name]
         )
 
     def is_exit_code_retry(self, node_name: str, exit_code: int) -> bool:
@@ -760,7 +1010,7 @@ class AliceTask(BaseDataStructure):
             )
             return True
 
-        return self.node_end_code_routing[node_name].get(exit_code, (None, False))[1]
+        return self.routing_table.is_retry(node_name, exit_code)
 
     def can_retry_node(
         self, node_name: str, execution_history: List[NodeResponse]
@@ -802,11 +1052,7 @@ class AliceTask(BaseDataStructure):
         if not current_node:
             return None
 
-        if current_node.node_name not in self.node_end_code_routing:
-            return None
-
-        routing = self.node_end_code_routing[current_node.node_name]
-        return routing.get(current_node.exit_code, (None, False))
+        return self.routing_table.next_node(current_node.node_name, current_node.exit_code)
 
     def resolve_next_node(
         self, execution_history: List[NodeResponse]
@@ -829,14 +1075,7 @@ class AliceTask(BaseDataStructure):
                 initiating new task execution when needed.
         """
         # Find the last node from this task
-        last_task_node = next(
-            (
-                node
-                for node in reversed(execution_history)
-                if node.parent_task_id == self.id
-            ),
-            None,
-        )
+        last_task_node = ExecutionHistory.wrap(execution_history).last_by_parent(self.id)
 
         if last_task_node:
             # If node has a user interaction with response, get next node from interaction
@@ -945,7 +1184,8 @@ class AliceTask(BaseDataStructure):
         self, execution_history: List[NodeResponse]
     ) -> int:
         """Get the length of the execution history that is external to this task."""
-        return sum(1 for node in execution_history if node.parent_task_id != self.id)
+        execution_history = ExecutionHistory.wrap(execution_history)
+        return len(execution_history) - execution_history.count_by_parent(self.id)
 
     def create_partial_response(
         self, node_responses: List[NodeResponse], status: str, **kwargs
@@ -963,6 +1203,15 @@ class AliceTask(BaseDataStructure):
             **kwargs,
         )
 
+    async def offload_outputs(self, response: TaskResponse) -> TaskResponse:
+        """
+        Moves the large node outputs of the response to the blob store, in a worker thread, so
+        the response stays light to serialize, store and publish.
+        """
+        if response.node_references:
+            response.node_references = await offload_node_references(response.node_references)
+        return response
+
     def get_failed_task_response(
         self, diagnostics: str = None, **kwargs
     ) -> TaskResponse:
@@ -1024,10 +1273,12 @@ class AliceTask(BaseDataStructure):
         - Returns 0 otherwise (including if no nodes exist)
         """
         # Build a dict of last node_responses for nodes in node_end_code_routing
-        last_node_responses = {}
-        for node in node_responses:
-            if node.node_name in self.node_end_code_routing:
-                last_node_responses[node.node_name] = node
+        node_responses = ExecutionHistory.wrap(node_responses)
+        last_node_responses = {
+            node_name: node_responses.last_by_name(node_name)
+            for node_name in self.node_end_code_routing
+            if node_responses.by_name(node_name)
+        }
 
         # Now get the set of exit codes from the last_node_responses
         exit_codes = set(node.exit_code for node in last_node_responses.values())
@@ -1037,11 +1288,7 @@ class AliceTask(BaseDataStructure):
         for node_name, node in last_node_responses.items():
             # Get all codes that don't retry (success codes)
             LOGGER.debug(f"Checking success codes for node {node_name}")
-            success_codes = [
-                code
-                for code, (_, is_retry) in self.node_end_code_routing[node_name].items()
-                if not is_retry
-            ]
+            success_codes = self.routing_table.success_codes[node_name]
             LOGGER.debug(
                 f"Node name: {node_name}\nExit code: {node.exit_code}\nSuccess codes: {success_codes}"
             )
@@ -1108,27 +1355,39 @@ class AliceTask(BaseDataStructure):
     # Function representation
     def get_function(self, api_manager: Optional[APIManager] = None) -> Dict[str, Any]:
         """Get function representation for workflow integration."""
+        return {
+            "tool_function": self.get_tool_function(),
+            "function_map": {self.task_name: self.get_tool_callable(api_manager)},
+        }
+
+    def get_tool_function(self) -> ToolFunction:
+        """The tool definition of the task, as given to LLMs."""
+        return ToolFunction(
+            type="function",
+            function=FunctionConfig(
+                name=self.task_name,
+                description=self.task_description,
+                parameters=self.input_variables.model_dump(by_alias=True),
+            ),
+        )
+
+    def get_tool_callable(self, api_manager: Optional[APIManager] = None) -> Callable[..., Awaitable[TaskResponse]]:
+        """The function running the task when called as a tool."""
 
         async def function_callable(**kwargs) -> TaskResponse:
             params = {"api_manager": api_manager} if api_manager else {}
             return await self.run(**{**params, **kwargs})
 
-        return {
-            "tool_function": ToolFunction(
-                type="function",
-                function=FunctionConfig(
-                    name=self.task_name,
-                    description=self.task_description,
-                    parameters=self.input_variables.model_dump(by_alias=True),
-                ),
-            ),
-            "function_map": {self.task_name: function_callable},
-        }
+        # Read by ToolExecutionAgent to schedule the tool calls of a turn
+        function_callable.parallel_safe = self.parallel_safe
+        return function_callable
 
     # Utility methods
     def get_last_node_by_name(
         self, node_responses: List[NodeResponse], node_name: str
     ) -> Optional[NodeResponse]:
+        if isinstance(node_responses, ExecutionHistory):
+            return node_responses.last_by_name(node_name)
         for node in reversed(node_responses):
             if node.node_name == node_name:
                 return node
@@ -1155,20 +1414,4 @@ class AliceTask(BaseDataStructure):
             The closest available exit code, defaulting to 0 if the desired code
             isn't available and 0 is defined
         """
-        if node_name not in self.node_end_code_routing:
-            return 0
-
-        available_codes = self.node_end_code_routing[node_name].keys()
-        if not available_codes:
-            return 0
-
-        # If desired code is available, use it
-        if desired_code in available_codes:
-            return desired_code
-
-        # If 0 is available, use it as default success code
-        if 0 in available_codes:
-            return 0
-
-        # Return the lowest available code as last resort
-        return min(available_codes)
+        return self.routing_table.available_exit_code(node_name, desired_code)
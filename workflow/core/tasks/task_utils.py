@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional, List, Tuple
 from workflow.core.data_structures import (
-    FunctionParameters, NodeResponse, ExecutionHistoryItem, Prompt, ParameterDefinition
+    FunctionParameters, NodeResponse, ExecutionHistory, ExecutionHistoryItem, Prompt, ParameterDefinition
 )
-from workflow.util import convert_value_to_type, LOGGER
+from workflow.util import compile_type_converter, LOGGER
 
 def simplify_execution_history(execution_history: List[NodeResponse]) -> List[ExecutionHistoryItem]:
     """
@@ -83,6 +83,8 @@ def validate_and_process_function_inputs(
     """
     Validates and processes input parameters against a FunctionParameters definition.
     Can prioritize either kwargs or node outputs when looking for values.
+    Node outputs are looked up in the history's resolved-variable table, so passing an
+    ExecutionHistory (rather than a list, which gets indexed on every call) keeps this cheap.
     
     Args:
         params: FunctionParameters object defining expected inputs
@@ -93,39 +95,28 @@ def validate_and_process_function_inputs(
     Returns:
         Tuple containing processed inputs dict and error message (if any)
     """
-    def find_in_history(param_name: str) -> Optional[Any]:
-        """Helper to find parameter value in execution history, prioritizing the last version."""
-        matching_node = next(
-            (node for node in reversed(execution_history)
-             if node.node_name == param_name and node.references),
-            None
-        )
-        if matching_node:
-            return matching_node.references.detailed_summary()
-        return None
+    history = ExecutionHistory.wrap(execution_history)
+    converters = params.converters
 
     def process_parameter(param_name: str, param_def: ParameterDefinition) -> Tuple[Optional[Any], Optional[str]]:
         """Helper to process a single parameter and return (value, error)."""
-        value = None
-        
-        # Order of checking depends on prioritization
+        convert = converters.get(param_name) or compile_type_converter(param_def.type)
+
+        # Order of checking depends on prioritization. History values are only resolved when needed
         sources = [
-            (kwargs.get(param_name), "kwargs"),
-            (find_in_history(param_name), "history")
+            (lambda: kwargs.get(param_name), "kwargs"),
+            (lambda: history.resolved_value(param_name), "history")
         ]
         
         if not prioritize_kwargs:
             sources.reverse()
             
         # Check sources in order
-        for val, source in sources:
+        for resolve, source in sources:
+            val = resolve()
             if val is not None:
                 try:
-                    value = convert_value_to_type(
-                        value=val,
-                        param_name=param_name,
-                        param_type=param_def.type
-                    )
+                    value = convert(val, param_name)
                     LOGGER.debug(f"Found value for {param_name} in {source}")
                     return value, None
                 except (ValueError, TypeError) as e:
@@ -0,0 +1,68 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+from workflow.core.data_structures import ToolFunction
+from workflow.core.api import APIManager
+from workflow.core.tasks.task import AliceTask
+
+def tools_key(tools: List[AliceTask]) -> Tuple[Hashable, ...]:
+    """
+    Identifies a list of tools: the id and `updatedAt` of each stored task, and the identity of
+    unsaved ones, with the name and definition they are exposed with.
+    """
+    return tuple(
+        (
+            (tool.id, str(getattr(tool, "updatedAt", None))) if tool.id and getattr(tool, "updatedAt", None) else id(tool),
+            tool.task_name,
+            tool.task_description,
+        )
+        for tool in tools
+    )
+
+class ToolRegistry(BaseModel):
+    """
+    Tools of a chat, compiled once and reused on every turn: their tool functions, with the
+    provider schemas and argument validation built ahead, indexed by name, and the callables
+    running them.
+
+    The registry matches the tools it was built from (`key`), and rebuilds its tool map when
+    called with another API manager, which is what the callables run the tools with. Copies
+    share the compiled tool functions, and run the tools they are bound to.
+    """
+    key: Tuple[Hashable, ...] = Field(default=(), description="Key of the tools the registry was built from")
+    tool_functions: List[ToolFunction] = Field(default_factory=list, description="Tool functions, in the order of the tools")
+    _tools: List[AliceTask] = PrivateAttr(default_factory=list)
+    _by_name: Dict[str, ToolFunction] = PrivateAttr(default_factory=dict)
+    _tool_map: Optional[Dict[str, Callable]] = PrivateAttr(default=None)
+    _api_manager: Optional[APIManager] = PrivateAttr(default=None)
+
+    @classmethod
+    def build(cls, tools: List[AliceTask]) -> "ToolRegistry":
+        registry = cls(key=tools_key(tools), tool_functions=[tool.get_tool_function().compile() for tool in tools])
+        registry._tools = list(tools)
+        registry._by_name = {tool_function.function.name: tool_function for tool_function in registry.tool_functions}
+        return registry
+
+    def matches(self, tools: List[AliceTask]) -> bool:
+        return self.key == tools_key(tools)
+
+    def bind(self, tools: List[AliceTask]):
+        """Runs `tools`, which must match the registry, from now on (e.g. the tools of a copied chat)."""
+        if len(tools) != len(self._tools) or any(tool is not bound for tool, bound in zip(tools, self._tools)):
+            self._tools = list(tools)
+            self._tool_map = None
+
+    def get(self, name: str) -> Optional[ToolFunction]:
+        return self._by_name.get(name)
+
+    def tool_map(self, api_manager: Optional[APIManager]) -> Dict[str, Callable]:
+        """Callables running each tool with `api_manager`, by tool name."""
+        if self._tool_map is None or self._api_manager is not api_manager:
+            self._tool_map = {tool.task_name: tool.get_tool_callable(api_manager) for tool in self._tools}
+            self._api_manager = api_manager
+        return self._tool_map
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ToolRegistry":
+        # Tool functions are never changed once compiled, but the tools belong to the chat copied
+        registry = ToolRegistry(key=self.key, tool_functions=self.tool_functions)
+        registry._by_name = self._by_name
+        return registry
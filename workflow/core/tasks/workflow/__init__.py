@@ -1,3 +1,3 @@
-from .workflow import Workflow
+from .workflow import Workflow, MapNodeConfig
 
-__all__ = ['Workflow']
\ No newline at end of file
+__all__ = ['Workflow', 'MapNodeConfig']
\ No newline at end of file
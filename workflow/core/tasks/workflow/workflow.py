@@ -1,10 +1,17 @@
+import asyncio
 from typing import Dict, Any, Optional, List
-from pydantic import Field
-from workflow.core.data_structures import References, NodeResponse
-from workflow.util import LOGGER
+from pydantic import BaseModel, Field, model_validator
+from workflow.core.data_structures import References, NodeResponse, TaskResponse, ExecutionHistory
+from workflow.util import LOGGER, convert_value_to_type, deadline_scope, span
 from workflow.util.utils import get_traceback
 from workflow.core.tasks import AliceTask
 
+class MapNodeConfig(BaseModel):
+    """Configuration of a workflow node that runs its task once per element of a list."""
+    input_variable: str = Field(..., description="Workflow variable, or earlier node, holding the list to map over")
+    item_variable: str = Field(..., description="Input variable of the task that receives each element")
+    max_concurrency: int = Field(4, ge=1, description="Maximum number of elements processed at the same time")
+
 class Workflow(AliceTask):
     """
     A specialized AliceTask implementation that orchestrates multiple tasks in a defined sequence.
@@ -29,6 +36,7 @@ class Workflow(AliceTask):
         - Task-level retry logic
         - Error propagation and handling
         - State management across tasks
+        - Map nodes that run a task over every element of a list
 
     Attributes:
     -----------
@@ -41,6 +49,9 @@ class Workflow(AliceTask):
     node_end_code_routing : TasksEndCodeRouting
         Routing rules for task execution sequence
 
+    map_nodes : Dict[str, MapNodeConfig]
+        Nodes, by task name, that run their task once per element of a list input
+
     Example:
     --------
     ```python
@@ -90,9 +101,27 @@ class Workflow(AliceTask):
         - No need to implement individual node methods
         - Tasks define their own execution logic
         - Workflow manages orchestration automatically
+
+    5. Map Nodes:
+        - The list is read from the workflow inputs, or from the output of the last node
+          with the same name, and may be a JSON string
+        - Each element is passed to the task as `item_variable`, alongside the workflow inputs
+        - Task responses are kept in element order; the node exits with 1 if any element
+          did not complete, naming the failed elements in a system message
     """
     tasks: Dict[str, AliceTask] = Field(..., description="A dictionary of tasks in the workflow")
     recursive: bool = Field(False, description="Whether the workflow can be executed recursively")
+    map_nodes: Dict[str, MapNodeConfig] = Field(default_factory=dict, description="Nodes that run their task once per element of a list input, by task name")
+
+    @model_validator(mode="after")
+    def validate_map_nodes(self):
+        for node_name, config in self.map_nodes.items():
+            task = self.find_task_by_name(node_name)
+            if not task:
+                raise ValueError(f"Map node {node_name} does not match any task in the workflow")
+            if config.item_variable not in task.input_variables.properties:
+                raise ValueError(f"Task {node_name} has no input variable {config.item_variable} to map over")
+        return self
 
     async def execute_node(self, node_name: str, execution_history: List[NodeResponse], node_responses: List[NodeResponse], **kwargs) -> NodeResponse:
         """
@@ -109,13 +138,19 @@ class Workflow(AliceTask):
             if not current_task:
                 raise ValueError(f"Task {node_name} not found in workflow.")
 
-            # Execute the task using the common input validation logic
-            # We don't pass the node responses because the task inputs are already validated in the kwargs
-            # And the task's run method should not be aware of the prior nodes in the workflow beyond kwarg variables
-            task_result = await current_task.run(
-                execution_history=execution_history,
-                **kwargs
-            )
+            with deadline_scope(self.node_timeouts.get(node_name)) as time_left, \
+                    span(node_name, "node", task_name=self.task_name):
+                if node_name in self.map_nodes:
+                    return await asyncio.wait_for(
+                        self.execute_map_node(node_name, current_task, execution_history, **kwargs), time_left
+                    )
+
+                # Execute the task using the common input validation logic
+                # We don't pass the node responses because the task inputs are already validated in the kwargs
+                # And the task's run method should not be aware of the prior nodes in the workflow beyond kwarg variables
+                task_result = await asyncio.wait_for(
+                    current_task.run(execution_history=execution_history, **kwargs), time_left
+                )
 
             # Create node response
             node_response = NodeResponse(
@@ -128,6 +163,9 @@ class Workflow(AliceTask):
 
             return node_response
 
+        except asyncio.TimeoutError as e:
+            LOGGER.warning(f"Task {node_name} in workflow {self.task_name} timed out: {str(e)}")
+            return self.get_timeout_node_response(node_name, execution_history)
         except Exception as e:
             LOGGER.error(f"Error executing task {node_name}: {str(e)}\n{get_traceback()}")
             return NodeResponse(
@@ -144,6 +182,61 @@ class Workflow(AliceTask):
                 execution_order=len(execution_history)
             )
         
+    async def execute_map_node(self, node_name: str, task: AliceTask, execution_history: List[NodeResponse], **kwargs) -> NodeResponse:
+        """
+        Runs a task once per element of the node's list input, at most `max_concurrency` at a time,
+        each on its own copy of the task. The node's references hold one TaskResponse per element,
+        in element order.
+        """
+        config = self.map_nodes[node_name]
+        items = kwargs.get(config.input_variable)
+        if items is None:
+            source_node = self.get_last_node_by_name(execution_history, config.input_variable)
+            if source_node and source_node.references:
+                items = source_node.references.detailed_summary()
+        if items is None:
+            raise ValueError(f"No list found in {config.input_variable} for map node {node_name}")
+        items = convert_value_to_type(items, config.input_variable, "array")
+
+        semaphore = asyncio.Semaphore(config.max_concurrency)
+
+        async def run_item(index: int, item: Any) -> TaskResponse:
+            async with semaphore:
+                item_kwargs = {**kwargs, config.item_variable: item}
+                # Each run gets its own copy: tasks are mutated while they run
+                item_task = task.model_copy(deep=True)
+                try:
+                    return await item_task.run(execution_history=ExecutionHistory(execution_history), **item_kwargs)
+                except Exception as e:
+                    LOGGER.error(f"Error executing task {node_name} on element {index}: {str(e)}\n{get_traceback()}")
+                    return item_task.get_failed_task_response(f"Error executing task: {str(e)}\n\n" + get_traceback(), **item_kwargs)
+
+        LOGGER.debug(f"Mapping task {node_name} over {len(items)} elements of {config.input_variable}")
+        task_results = await asyncio.gather(*[run_item(index, item) for index, item in enumerate(items)])
+
+        failed = [
+            f"{index} ({result.status}: {result.result_diagnostic})"
+            for index, result in enumerate(task_results)
+            if result.status != "complete" or result.result_code != 0
+        ]
+        messages = None
+        if failed:
+            messages = [{
+                "role": "system",
+                "content": f"Task {node_name} failed for {len(failed)} of {len(task_results)} elements: " + ", ".join(failed),
+                "generated_by": "system"
+            }]
+        return NodeResponse(
+            parent_task_id=self.id,
+            node_name=node_name,
+            exit_code=1 if failed else 0,
+            references=References(task_responses=task_results, messages=messages),
+            execution_order=len(execution_history)
+        )
+
+    def has_node_implementation(self, node_name: str) -> bool:
+        return self.find_task_by_name(node_name) is not None
+
     def find_task_by_name(self, task_name: str) -> Optional[AliceTask]:
         """Finds a task in the workflow by its name."""
         for task in self.tasks.values():
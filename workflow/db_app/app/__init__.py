@@ -1,5 +1,6 @@
 from .db import BackendAPI, token_validation_middleware
 from .db_functionality import BackendFunctionalityAPI
 from .db_container import ContainerAPI
+from .message_outbox import MessageOutbox
 
-__all__ = ['BackendAPI', 'ContainerAPI', 'BackendFunctionalityAPI', 'token_validation_middleware']
\ No newline at end of file
+__all__ = ['BackendAPI', 'ContainerAPI', 'BackendFunctionalityAPI', 'token_validation_middleware', 'MessageOutbox']
\ No newline at end of file
@@ -1,13 +1,15 @@
-import requests, aiohttp, asyncio, json
+import requests, aiohttp, asyncio, json, os, hashlib
 from aiohttp import ClientError
 from bson import ObjectId
-from typing import Dict, Any, Optional, Literal, Union
+from typing import Dict, Any, Optional, Literal, Union, Callable, Awaitable, List
 from pydantic import BaseModel, Field, ConfigDict
-from workflow.core.tasks import available_task_types
+from workflow.core.tasks import available_task_types, TASK_TYPES, TASK_CACHE
 from workflow.core import AliceChat, AliceTask, API, MessageDict, FileReference, FileContentReference, ChatThread
 from workflow.util.const import BACKEND_PORT, DOCKER_HOST, WORKFLOW_SERVICE_KEY
 from workflow.core.data_structures import EntityType
 from workflow.util import LOGGER
+from workflow.db_app.app.token_cache import TokenValidationCache
+from workflow.db_app.app.entity_cache import EntityCache
 
 class BackendAPI(BaseModel):
     """
@@ -20,6 +22,7 @@ class BackendAPI(BaseModel):
     Attributes:
         base_url (str): The base URL of the backend API.
         user_token (str): The authentication token for API requests.
+        session (aiohttp.ClientSession): Shared, pooled session used for every request to the backend.
         available_task_types (list[AliceTask]): List of available task types.
         collection_map (Dict[EntityType, str]): Mapping of entity types to collection names.
 
@@ -33,10 +36,13 @@ class BackendAPI(BaseModel):
         update_api_health(api_id: str, health_status: str) -> bool: Updates API health status.
         get_chat(chat_id: str) -> AliceChat: Retrieves chat.
         store_chat_message(chat_id: str, message: MessageDict) -> AliceChat: Stores a chat message.
+        store_chat_messages(chat_id: str, thread_id: str, messages: List[MessageDict]) -> List[str]: Stores several chat messages in one all-or-nothing request.
+        update_chat_thread_summary(thread_id: str, summary: str, summarized_messages: int) -> bool: Stores the rolling summary of a thread.
         store_task_response(task_response: TaskResponse) -> TaskResponse: Stores a task response.
         validate_token(token: str) -> dict: Validates an authentication token.
         create_entity_in_db(entity_type: EntityType, entity_data: dict) -> str: Creates an entity in the database.
         check_existing_data(max_retries=3, retry_delay=1) -> bool: Checks for existing data in the database.
+        get_pool_stats() -> dict: Reports the state of the shared connection pool.
 
     Example:
         >>> api = BackendAPI(base_url="http://api.example.com", user_token="your_token_here")
@@ -69,6 +75,21 @@ class BackendAPI(BaseModel):
         "code_executions": "codeexecutions",
         "api_configs": "apiconfigs"
     }, description="Map of entity types to collection names")
+    token_cache: TokenValidationCache = Field(default_factory=TokenValidationCache, exclude=True, description="Cache of recent token validation results")
+    pool_limit: int = Field(int(os.getenv("BACKEND_POOL_LIMIT", "100")), description="Maximum number of open connections to the backend")
+    pool_limit_per_host: int = Field(int(os.getenv("BACKEND_POOL_LIMIT_PER_HOST", "50")), description="Maximum number of open connections per backend host")
+    keepalive_timeout: float = Field(float(os.getenv("BACKEND_KEEPALIVE_TIMEOUT", "30")), description="Seconds an idle connection is kept open for reuse")
+    dns_cache_ttl: int = Field(int(os.getenv("BACKEND_DNS_CACHE_TTL", "300")), description="Seconds resolved backend addresses are cached")
+    request_timeout: float = Field(float(os.getenv("BACKEND_REQUEST_TIMEOUT", "300")), description="Total timeout of a single backend request")
+    entity_cache: EntityCache = Field(default_factory=EntityCache, exclude=True, description="Cache of parsed tasks, chats and APIs")
+    session: Optional[aiohttp.ClientSession] = Field(None, exclude=True, description="Shared session used for every backend request")
+    session_loop: Optional[asyncio.AbstractEventLoop] = Field(None, exclude=True, description="Event loop the shared session is bound to")
+    pool_counters: Dict[str, int] = Field(default_factory=lambda: {
+        "sessions_opened": 0,
+        "requests": 0,
+        "connections_created": 0,
+        "connections_reused": 0,
+    }, exclude=True, description="Counters reported by get_pool_stats")
     model_config = ConfigDict(protected_namespaces=(), json_encoders = {ObjectId: str}, arbitrary_types_allowed=True)
     
     def model_dump(self, *args, **kwargs):
@@ -82,13 +103,13 @@ class BackendAPI(BaseModel):
 
     @property
     def task_types(self) -> Dict[str, AliceTask]:
-        return {task.__name__: task for task in self.available_task_types}
+        return TASK_TYPES.types
 
 
-    def _get_headers(self):
+    def _get_headers(self, user_token: Optional[str] = None):
         return {
             "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.user_data.get('user_token')}"
+            "Authorization": f"Bearer {user_token or self.user_data.get('user_token')}"
         }
     def _get_headers_workflow(self):
         return {
@@ -117,192 +138,385 @@ class BackendAPI(BaseModel):
         url = f"{self.base_url}/tasks/{task_id}/populated"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    if response is None:
-                        raise ValueError(f"Failed to get a response from {url}")
-                    response.raise_for_status()
-                    task = await response.json()
-
-                    task = await self.preprocess_data(task)
-                    return await self.task_initializer(task)
-            except aiohttp.ClientError as e:
-                LOGGER.error(f"Error retrieving tasks: {e}")
-                return {}
+        async def parse(task: dict) -> AliceTask:
+            task = await self.preprocess_data(task)
+            return await self.task_initializer(task)
+
+        try:
+            return await self._get_cached_entity("tasks", task_id, url, headers, parse)
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error retrieving tasks: {e}")
+            return {}
 
     async def get_apis(self) -> Dict[str, API]:
         url = f"{self.base_url}/workflow/api_request"
         headers = self._get_headers_workflow()
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    response.raise_for_status()
-                    response_object = await response.json()
-                    if response_object.get("message") != "Success":
-                        raise ValueError(f"Failed to retrieve APIs: {response_object.get('message')}")
-                    apis = [await self.preprocess_data(api) for api in response_object.get("apis")]
-                    return {api["_id"]: API(**api) for api in apis}
-            except aiohttp.ClientError as e:
-                LOGGER.error(f"Error retrieving APIs: {e}")
-                return {}
+        try:
+            return await self._get_cached_entity("apis", "*", url, headers, self._parse_apis)
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error retrieving APIs: {e}")
+            return {}
+            
+    async def _get_cached_entity(self, entity_type: str, entity_id: str, url: str, headers: dict, parse: Callable[[dict], Awaitable[Any]], shared: bool = False) -> Any:
+        """
+        Read-through lookup in `entity_cache`. Fresh entries are returned without contacting
+        the backend; stale ones are revalidated with If-None-Match, and by comparing the
+        digest of the refetched payload, before `parse` rebuilds the object.
+        """
+        scope = self._cache_scope()
+        cached = self.entity_cache.get_fresh(entity_type, entity_id, scope)
+        if cached is not None:
+            return cached
+
+        entry = self.entity_cache.get_entry(entity_type, entity_id, scope)
+        request_headers = {**headers, "If-None-Match": entry.etag} if entry and entry.etag else headers
+        session = await self.get_session()
+        async with session.get(url, headers=request_headers) as response:
+            if response.status == 304:
+                cached = self.entity_cache.revalidated(entity_type, entity_id, scope)
+                if cached is not None:
+                    return cached
+                # Invalidated while the request was in flight: fetch it unconditionally
+                return await self._get_cached_entity(entity_type, entity_id, url, headers, parse, shared)
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get("ETag")
+
+        version = hashlib.sha256(body).hexdigest()
+        if entry and entry.version == version:
+            cached = self.entity_cache.revalidated(entity_type, entity_id, scope)
+            if cached is not None:
+                return cached
+        value = await parse(json.loads(body))
+        self.entity_cache.set(entity_type, entity_id, scope, value, version, etag, shared)
+        return value
+
+    async def _invalidate_cached_entity(self, entity_type: EntityType, entity_id: Optional[str] = None):
+        # API maps and managers are cached per user as a whole, with their configs embedded
+        if entity_type in ("apis", "api_configs"):
+            await self.entity_cache.invalidate("apis")
+            await self.entity_cache.invalidate("api_managers")
+        else:
+            await self.entity_cache.invalidate(entity_type, entity_id)
+
+    def _cache_scope(self) -> str:
+        """Identifies the user entities are fetched for, so cached entities are never shared across users."""
+        user = self.user_data.get("user_obj") or {}
+        user_id = user.get("_id") if isinstance(user, dict) else getattr(user, "id", None)
+        if user_id:
+            return str(user_id)
+        return hashlib.sha256(str(self.user_data.get("user_token")).encode()).hexdigest()
+
+    async def _parse_apis(self, response_object: dict) -> Dict[str, API]:
+        if response_object.get("message") != "Success":
+            raise ValueError(f"Failed to retrieve APIs: {response_object.get('message')}")
+        apis = [await self.preprocess_data(api) for api in response_object.get("apis")]
+        return {api["_id"]: API(**api) for api in apis}
             
     async def update_api_config_health(self, api_config_id: str, health_status: str) -> bool:
         url = f"{self.base_url}/apiconfigs/{api_config_id}"
         headers = self._get_headers()
         data = {"health_status": health_status}
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.patch(url, json=data, headers=headers) as response:
-                    response.raise_for_status()
-                    return True
-            except aiohttp.ClientError as e:
-                LOGGER.error(f"Error updating API health: {e}")
-                return False
+        session = await self.get_session()
+        try:
+            async with session.patch(url, json=data, headers=headers) as response:
+                response.raise_for_status()
+            await self._invalidate_cached_entity("api_configs", api_config_id)
+            return True
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error updating API health: {e}")
+            return False
     
     async def task_initializer(self, task: dict) -> AliceTask:
-        if not task["task_type"] in self.task_types:
+        # Versions seen before are copied from TASK_CACHE instead of being validated again
+        return TASK_CACHE.get_or_create(task, self._build_task)
+
+    def _build_task(self, task: dict) -> AliceTask:
+        task_class = TASK_TYPES.get(task["task_type"])
+        if task_class is None:
             raise ValueError(f"Task type {task['task_type']} not found in available task types.")
-        
+
         if "tasks" in task and isinstance(task["tasks"], dict):
-            # Use asyncio.gather to initialize subtasks concurrently
-            subtasks = await asyncio.gather(*[
-                self.task_initializer(subtask) 
-                for subtask in task["tasks"].values()
-            ])
             task["tasks"] = {
-                subtask["_id"]: initialized_subtask 
-                for subtask, initialized_subtask in zip(task["tasks"].values(), subtasks)
+                subtask["_id"]: TASK_CACHE.get_or_create(subtask, self._build_task)
+                for subtask in task["tasks"].values()
             }
-    
-        # Assuming the task_types constructors are async
-        return self.task_types[task["task_type"]](**task)
+
+        return task_class(**task)
     
     async def get_chat(self, chat_id: str) -> AliceChat:
         # Retrieves populated chats but without threads
         url = f"{self.base_url}/workflow/chat_without_threads/{chat_id}"
         headers = self._get_headers_workflow()
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    response.raise_for_status()
-                    chat_response = await response.json()
-                    chat_data = chat_response['chat']
-                    del chat_data['threads']
-                    chat = await self.preprocess_data(chat_response['chat'])
-                    return AliceChat(**chat)
-            except aiohttp.ClientError as e:
-                LOGGER.error(f"Error retrieving chats: {e}")
-                return {}
+        async def parse(chat_response: dict) -> AliceChat:
+            chat_data = chat_response['chat']
+            del chat_data['threads']
+            chat = await self.preprocess_data(chat_response['chat'])
+            return AliceChat(**chat)
+
+        try:
+            return await self._get_cached_entity("chats", chat_id, url, headers, parse)
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error retrieving chats: {e}")
+            return {}
             
     async def get_chat_thread(self, thread_id: str) -> AliceChat:
         url = f"{self.base_url}/chatthreads/{thread_id}/populated"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    response.raise_for_status()
-                    thread = await response.json()
-                    thread = await self.preprocess_data(thread)
-                    return ChatThread(**thread)
-            except aiohttp.ClientError as e:
-                LOGGER.error(f"Error retrieving chats: {e}")
-                return {}
+        session = await self.get_session()
+        try:
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                thread = await response.json()
+                thread = await self.preprocess_data(thread)
+                return ChatThread(**thread)
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error retrieving chats: {e}")
+            return {}
+
+    async def update_chat_thread_summary(self, thread_id: str, summary: Optional[str], summarized_messages: int, user_token: Optional[str] = None) -> bool:
+        """
+        Stores the rolling summary of a thread and the number of messages it covers, as the user
+        of `user_token` if given (for updates made after the request moved on), else the current one.
+        """
+        url = f"{self.base_url}/chatthreads/{thread_id}"
+        headers = self._get_headers(user_token)
+        data = {"summary": summary, "summarized_messages": summarized_messages}
+        try:
+            session = await self.get_session()
+            async with session.patch(url, json=data, headers=headers) as response:
+                response.raise_for_status()
+                return True
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error storing thread summary: {e}")
+            return False
 
     async def store_chat_message(self, chat_id: str, thread_id: str, message: MessageDict) -> AliceChat:
         url = f"{self.base_url}/chats/{chat_id}/add_message"
         headers = self._get_headers()
         data = {"message": message.model_dump(by_alias=True), "threadId": thread_id}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(url, json=data, headers=headers) as response:
-                    response.raise_for_status()
-                    return True
+            session = await self.get_session()
+            async with session.patch(url, json=data, headers=headers) as response:
+                response.raise_for_status()
+                return True
         except aiohttp.ClientError as e:
             LOGGER.error(f"Error storing messages: {e}")
             return None
         
+    async def store_chat_messages(self, chat_id: str, thread_id: str, messages: List[MessageDict]) -> List[str]:
+        """
+        Stores several messages in a thread with a single request, keeping their order. The
+        backend stores them and appends them to the thread all together, or not at all.
+
+        Returns:
+            List[str]: The ids of the stored messages.
+
+        Raises:
+            aiohttp.ClientResponseError: If the backend rejected the request, in which case none
+                of the messages were stored.
+            aiohttp.ClientError: If the request failed in transit, in which case the messages
+                may have been stored.
+        """
+        url = f"{self.base_url}/chats/{chat_id}/add_messages"
+        headers = self._get_headers()
+        data = {"messages": [message.model_dump(by_alias=True) for message in messages], "threadId": thread_id}
+        session = await self.get_session()
+        async with session.patch(url, json=data, headers=headers) as response:
+            response.raise_for_status()
+            result = await response.json()
+            return result["message_ids"]
+        
     def validate_token(self, token: str) -> dict:
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
         url = f"{self.base_url}/users/validate"
         headers = {"Authorization": f"Bearer {token}"}
         LOGGER.debug(f"Attempting to validate token at URL: {url}")
-        LOGGER.debug(f"Headers: {headers}")
         try:
             response = requests.get(url, headers=headers)
             LOGGER.debug(f"Token validation response: {response}")
             response.raise_for_status()
-            return response.json()
+            result = response.json()
+            self.token_cache.set(token, result)
+            return result
         except requests.exceptions.RequestException as e:
             LOGGER.error(f"Error validating token: {e}")
-            return {"valid": False, "message": str(e)}
-        
+            result = {"valid": False, "message": str(e)}
+            status = e.response.status_code if e.response is not None else None
+            self.token_cache.set(token, result, cacheable=status in (401, 403))
+            return result
+
+    async def validate_token_async(self, token: str) -> dict:
+        """
+        Non-blocking counterpart of `validate_token`, used by the request and WebSocket auth paths.
+        Results are served from `token_cache` when possible; otherwise the backend is called
+        once per token, however many requests are waiting on it.
+        """
+        return await self.token_cache.get_or_validate(token, self._request_token_validation)
+
+    async def _request_token_validation(self, token: str) -> tuple[dict, bool]:
+        url = f"{self.base_url}/users/validate"
+        headers = {"Authorization": f"Bearer {token}"}
+        LOGGER.debug(f"Attempting to validate token at URL: {url}")
+        session = await self.get_session()
+        try:
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status in (401, 403):
+                    # Rejected whatever the body holds, which only provides the message
+                    message = "Invalid token"
+                    try:
+                        body = await response.json(content_type=None)
+                    except (ValueError, aiohttp.ClientError):
+                        body = None
+                    if isinstance(body, dict) and body.get("message"):
+                        message = body["message"]
+                    return {"valid": False, "message": message}, True
+                response.raise_for_status()
+                result = await response.json()
+                return result, True
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            LOGGER.error(f"Error validating token: {e}")
+            return {"valid": False, "message": str(e)}, False
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared session, opening it on first use. The session is bound to the
+        event loop it was created on, so a caller running on a different loop (e.g. a script
+        using asyncio.run) gets a fresh one, and the previous session is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self.session is None or self.session.closed or self.session_loop is not loop:
+            await self.open_session()
+        return self.session
+
+    async def open_session(self):
+        """Opens the shared session with a keep-alive connection pool and DNS cache."""
+        if self.session and not self.session.closed and self.session_loop is asyncio.get_running_loop():
+            return
+        await self.close_session()
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._count_pool_event("requests"))
+        trace_config.on_connection_create_end.append(self._count_pool_event("connections_created"))
+        trace_config.on_connection_reuseconn.append(self._count_pool_event("connections_reused"))
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_limit,
+            limit_per_host=self.pool_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            trace_configs=[trace_config],
+        )
+        self.session_loop = asyncio.get_running_loop()
+        self.pool_counters["sessions_opened"] += 1
+        LOGGER.debug(f"Opened backend session (limit={self.pool_limit}, per host={self.pool_limit_per_host})")
+
+    async def close_session(self):
+        """
+        Closes the shared session. A session opened on a loop still running in another thread
+        is closed on that loop; one whose loop has been closed has no open transports left and
+        is only marked closed.
+        """
+        session, loop = self.session, self.session_loop
+        self.session = None
+        self.session_loop = None
+        if session is None or session.closed:
+            return
+        try:
+            if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                await session.close()
+        except Exception as e:
+            LOGGER.warning(f"Error closing backend session: {e}")
+
+    def _count_pool_event(self, counter: str):
+        async def on_event(session, trace_config_ctx, params):
+            self.pool_counters[counter] += 1
+        return on_event
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Reports the configuration and usage counters of the connection pool."""
+        return {
+            "open": bool(self.session and not self.session.closed),
+            "limit": self.pool_limit,
+            "limit_per_host": self.pool_limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            **self.pool_counters,
+        }
+
     async def get_entity_from_db(self, entity_type: EntityType, entity_id: str) -> Dict[str, Any]:
         collection_name = self.collection_map[entity_type]
         url = f"{self.base_url}/{collection_name}/{entity_id}/populated"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    response.raise_for_status()
-                    result = await response.json()
-                    return result
-            except aiohttp.ClientError as e:
-                LOGGER.error(f"Error retrieving entity: {e}")
-                return {}
+        session = await self.get_session()
+        try:
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                result = await response.json()
+                return result
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error retrieving entity: {e}")
+            return {}
         
     async def create_entity_in_db(self, entity_type: EntityType, entity_data: dict) -> Dict[str, Any]:
         collection_name = self.collection_map[entity_type]
         url = f"{self.base_url}/{collection_name}"
         headers = self._get_headers()
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, json=entity_data, headers=headers) as response:
-                    if response.status == 400:
-                        error_data = await response.json()
-                        raise ValueError(f"Bad request when creating {entity_type}: {error_data}")
-                    
-                    response.raise_for_status()
-                    result = await response.json()
-                    LOGGER.debug(f'Created {entity_type} with ID: {result["_id"]}')
-                    return result
-            except aiohttp.ClientResponseError as e:
-                LOGGER.error(f"HTTP error during entity creation: {e.status} - {e.message}")
-                LOGGER.error(f"Entity data: {entity_data}")
-                raise
-            except Exception as e:
-                LOGGER.error(f"Unexpected error during entity creation: {str(e)}")
-                LOGGER.error(f"Entity data: {entity_data}")
-                raise
+        session = await self.get_session()
+        try:
+            async with session.post(url, json=entity_data, headers=headers) as response:
+                if response.status == 400:
+                    error_data = await response.json()
+                    raise ValueError(f"Bad request when creating {entity_type}: {error_data}")
+                
+                response.raise_for_status()
+                result = await response.json()
+                LOGGER.debug(f'Created {entity_type} with ID: {result["_id"]}')
+                return result
+        except aiohttp.ClientResponseError as e:
+            LOGGER.error(f"HTTP error during entity creation: {e.status} - {e.message}")
+            LOGGER.error(f"Entity data: {entity_data}")
+            raise
+        except Exception as e:
+            LOGGER.error(f"Unexpected error during entity creation: {str(e)}")
+            LOGGER.error(f"Entity data: {entity_data}")
+            raise
         
     async def update_entity_in_db(self, entity_type: EntityType, entity_id: str, entity_data: dict) -> Dict[str, Any]:
         collection_name = self.collection_map[entity_type]
         url = f"{self.base_url}/{collection_name}/{entity_id}"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.patch(url, json=entity_data, headers=headers) as response:
-                    if response.status == 400:
-                        error_data = await response.json()
-                        raise ValueError(f"Bad request when updating {entity_type}: {error_data}")
-                    response.raise_for_status()
-                    result = await response.json()
-                    LOGGER.info(f'Updated {entity_type} with ID: {entity_id}')
-                    return result
-            except aiohttp.ClientError as e:
-                LOGGER.error(f"HTTP error during entity creation: {e.status} - {e.message}")
-                LOGGER.error(f"Error updating entity: {e}")
-                raise
-            except Exception as e:
-                LOGGER.error(f"Unexpected error during entity creation: {str(e)}")
-                LOGGER.error(f"Unexpected error updating entity: {e}")
-                raise
+        session = await self.get_session()
+        try:
+            async with session.patch(url, json=entity_data, headers=headers) as response:
+                if response.status == 400:
+                    error_data = await response.json()
+                    raise ValueError(f"Bad request when updating {entity_type}: {error_data}")
+                response.raise_for_status()
+                result = await response.json()
+                LOGGER.info(f'Updated {entity_type} with ID: {entity_id}')
+            await self._invalidate_cached_entity(entity_type, entity_id)
+            return result
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"HTTP error during entity creation: {e.status} - {e.message}")
+            LOGGER.error(f"Error updating entity: {e}")
+            raise
+        except Exception as e:
+            LOGGER.error(f"Unexpected error during entity creation: {str(e)}")
+            LOGGER.error(f"Unexpected error updating entity: {e}")
+            raise
 
     async def check_existing_data(self, max_retries=3, retry_delay=1) -> bool:
         for attempt in range(max_retries):
@@ -312,13 +526,13 @@ class BackendAPI(BaseModel):
                         continue
                     url = f"{self.base_url}/{collection}"
                     headers = self._get_headers()
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url, headers=headers, timeout=30) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                if data:
-                                    LOGGER.warning(f"Existing data found in collection: {collection} - {data}")
-                                    return True
+                    session = await self.get_session()
+                    async with session.get(url, headers=headers, timeout=30) as response:
+                        if response.status == 200:
+                            data = await response.json()
+                            if data:
+                                LOGGER.warning(f"Existing data found in collection: {collection} - {data}")
+                                return True
                 return False
             except (ClientError, asyncio.TimeoutError) as e:
                 if attempt == max_retries - 1:
@@ -331,17 +545,17 @@ class BackendAPI(BaseModel):
         url = f"{self.base_url}/files/{file_reference_id}"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    response.raise_for_status()
-                    file = await response.json()
-                    
-                    file = await self.preprocess_data(file)
-                    return {file['_id']: FileReference(**file)}
-            except aiohttp.ClientError as e:
-                LOGGER.error(f"Error retrieving chats: {e}")
-                return {}
+        session = await self.get_session()
+        try:
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                file = await response.json()
+                
+                file = await self.preprocess_data(file)
+                return {file['_id']: FileReference(**file)}
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error retrieving chats: {e}")
+            return {}
             
     async def update_file_reference(self, file_reference: Union[FileReference, FileContentReference]): 
         url = f"{self.base_url}/files/{file_reference.id}"
@@ -349,34 +563,34 @@ class BackendAPI(BaseModel):
         data = file_reference.model_dump(by_alias=True)
         LOGGER.info(f"Updating file reference: {json.dumps(data, indent=2)}")
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(url, json=data, headers=headers) as response:
-                    file = response.raise_for_status()
-                    file = await self.preprocess_data(file)
-                    return {file['_id']: FileReference(**file)}
+            session = await self.get_session()
+            async with session.patch(url, json=data, headers=headers) as response:
+                file = response.raise_for_status()
+                file = await self.preprocess_data(file)
+                return {file['_id']: FileReference(**file)}
         except aiohttp.ClientError as e:
             LOGGER.error(f"Error storing messages: {e}")
             return None
 
 def token_validation_middleware(api: BackendAPI):
-    def middleware(request) -> dict[str, Any]:
+    async def middleware(request) -> dict[str, Any]:
         token = request.headers.get("Authorization")
         if not token:
             return {"valid": False, "message": "Access denied. No token provided."}
 
         token = token.split(" ")[1]
-        validation_response = api.validate_token(token)
+        validation_response = await api.validate_token_async(token)
         if not validation_response.get("valid"):
             return {
                 "valid": False, 
                 "message": validation_response.get("message", "Invalid token"), 
                 "user": validation_response.get("user", None)
                 }
-        LOGGER.error('validation_response', validation_response)
+        LOGGER.debug(f'validation_response: {validation_response}')
         request.state.user_id = validation_response["user"]["_id"]
         return {
             "valid": True, 
             "message": validation_response.get("message", "Valid token"), 
             "user": validation_response.get("user")
             }
-    return middleware
\ No newline at end of file
+    return middleware
@@ -1,4 +1,5 @@
 import aiohttp
+import hashlib
 from typing import get_args, Optional
 from pydantic import Field
 from tqdm import tqdm
@@ -82,25 +83,25 @@ class BackendFunctionalityAPI(BackendAPI):
                 url = f"{self.base_url}/{self.collection_map[entity_type]}"
                 headers = self._get_headers()
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, headers=headers) as response:
-                        response.raise_for_status()
-                        db_entities = await response.json()
+                session = await self.get_session()
+                async with session.get(url, headers=headers) as response:
+                    response.raise_for_status()
+                    db_entities = await response.json()
+                    
+                    structure_entities = getattr(db_structure, entity_type, [])
+                    
+                    
+                    if len(db_entities) != len(structure_entities):
+                        LOGGER.error(f"Mismatch in {entity_type} count. Expected: {len(structure_entities)}, Found: {len(db_entities)}")
+                        return False
+                    
+                    # Check for the presence of each entity by name or email
+                    for entity in structure_entities:
                         
-                        structure_entities = getattr(db_structure, entity_type, [])
-                        
-                        
-                        if len(db_entities) != len(structure_entities):
-                            LOGGER.error(f"Mismatch in {entity_type} count. Expected: {len(structure_entities)}, Found: {len(db_entities)}")
+                        identifier = entity.get('name') or entity.get('email')
+                        if not any(db_entity.get('name') == identifier or db_entity.get('email') == identifier for db_entity in db_entities):
+                            LOGGER.error(f"Entity not found in database: {entity_type} - {identifier}")
                             return False
-                        
-                        # Check for the presence of each entity by name or email
-                        for entity in structure_entities:
-                            
-                            identifier = entity.get('name') or entity.get('email')
-                            if not any(db_entity.get('name') == identifier or db_entity.get('email') == identifier for db_entity in db_entities):
-                                LOGGER.error(f"Entity not found in database: {entity_type} - {identifier}")
-                                return False
             
             LOGGER.info("All entities validated successfully")
             return True
@@ -110,11 +111,30 @@ class BackendFunctionalityAPI(BackendAPI):
             return False
         
     async def api_setter(self) -> APIManager:
-        api_manager = APIManager()
-        apis = await self.get_apis()
-        for api in apis.values():
-            api_manager.add_api(api)
+        """
+        Returns the current user's APIManager. The manager is cached per user and token, and
+        rebuilt only when the backend reports a change to their APIs, so it is shared between
+        requests and must not be modified by callers.
+
+        LM Studio APIs authenticate with the user's token, which is set when the manager is
+        built; keying the cache by token keeps requests made with another token of the same
+        user from changing it under each other.
+        """
+        url = f"{self.base_url}/workflow/api_request"
+        headers = self._get_headers_workflow()
         user_token = self.user_data.get('user_token')
-        if user_token:
-            api_manager.update_lmstudio_token(user_token)
-        return api_manager
\ No newline at end of file
+
+        async def build_api_manager(response_object: dict) -> APIManager:
+            api_manager = APIManager()
+            for api in (await self._parse_apis(response_object)).values():
+                api_manager.add_api(api)
+            if user_token:
+                api_manager.update_lmstudio_token(user_token)
+            return api_manager
+
+        token_id = hashlib.sha256(user_token.encode()).hexdigest()[:16] if user_token else "*"
+        try:
+            return await self._get_cached_entity("api_managers", token_id, url, headers, build_api_manager, shared=True)
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Error retrieving APIs: {e}")
+            return APIManager()
@@ -0,0 +1,151 @@
+import asyncio, json, os, time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from pydantic import BaseModel, Field, ConfigDict
+import redis.asyncio as aioredis
+from workflow.util import LOGGER, get_traceback
+
+class CachedEntity(BaseModel):
+    """A parsed entity together with the version it was built from."""
+    value: Any
+    version: str
+    etag: Optional[str] = None
+    shared: bool = False
+    fetched_at: float = Field(default_factory=time.monotonic)
+
+class EntityCache(BaseModel):
+    """
+    In-process LRU cache of parsed backend entities (tasks, chats, API maps).
+
+    Lookups go through two tiers:
+    - Entries younger than `ttl` are served directly, skipping the backend round-trip.
+    - Older entries keep their ETag and a digest of the payload they were parsed from, so
+      the caller can revalidate with a conditional request (or by comparing the refetched
+      payload) and reuse the parsed object when nothing changed, skipping the pydantic
+      reconstruction. The digest covers the whole populated document, so a change to a
+      nested entity (e.g. a subtask) is caught even when the root's `updatedAt` is not bumped.
+
+    `ttl` defaults to 0, i.e. every read is revalidated: the backend does not publish
+    invalidations itself, so edits made from the frontend would otherwise stay invisible
+    for up to `ttl` seconds. Raise it where every writer publishes on `channel`.
+
+    Values are deep-copied on the way in and out: callers own what they get and can mutate
+    it freely (tasks and chats are mutated while they run) without corrupting the cache.
+    Entries stored with `shared=True` are handed out as-is instead, for objects that are
+    expensive to copy and treated as read-only (e.g. a user's APIManager).
+
+    Entries are scoped by the caller (usually the user id), since the backend only returns
+    an entity to users allowed to see it. Writes made through BackendAPI invalidate the
+    entity locally and on `channel`, which every workflow replica listens to. Anything
+    else that changes entities can publish `{"entity_type": ..., "entity_id": ...}` there
+    too; omitting `entity_id` drops every entry of that type.
+    """
+    ttl: float = Field(float(os.getenv("ENTITY_CACHE_TTL", "0")), description="Seconds an entry is served without revalidation")
+    max_size: int = Field(int(os.getenv("ENTITY_CACHE_MAX_SIZE", "512")), description="Maximum number of cached entities")
+    redis_url: str = Field(os.getenv("REDIS_URL", "redis://redis:6379/0"), description="Redis used to share invalidations between replicas")
+    channel: str = Field(os.getenv("ENTITY_CACHE_CHANNEL", "entity_invalidations"), description="Pub/sub channel carrying invalidations")
+    entries: Dict[Tuple[str, str, str], CachedEntity] = Field(default_factory=OrderedDict, exclude=True)
+    stats: Dict[str, int] = Field(default_factory=lambda: {"hits": 0, "revalidated": 0, "misses": 0, "invalidations": 0}, exclude=True)
+    redis_client: Optional[aioredis.Redis] = Field(None, exclude=True)
+    listener_task: Optional[asyncio.Task] = Field(None, exclude=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    async def initialize(self):
+        """Connects to Redis and starts applying invalidations published by other replicas."""
+        self.redis_client = aioredis.from_url(self.redis_url)
+        self.listener_task = asyncio.create_task(self.listen_for_invalidations())
+
+    async def cleanup(self):
+        if self.listener_task:
+            self.listener_task.cancel()
+            self.listener_task = None
+        if self.redis_client:
+            await self.redis_client.close()
+            self.redis_client = None
+
+    def get_fresh(self, entity_type: str, entity_id: str, scope: str) -> Optional[Any]:
+        """Returns a copy of the entry if it is younger than `ttl`."""
+        if self.redis_client and (self.listener_task is None or self.listener_task.done()):
+            # Invalidations are not being received, so only revalidated entries are safe
+            return None
+        entry = self.entries.get((entity_type, entity_id, scope))
+        if entry is None or time.monotonic() - entry.fetched_at >= self.ttl:
+            return None
+        self.entries.move_to_end((entity_type, entity_id, scope))
+        self.stats["hits"] += 1
+        return entry.value if entry.shared else self._copy(entry.value)
+
+    def get_entry(self, entity_type: str, entity_id: str, scope: str) -> Optional[CachedEntity]:
+        """Returns the entry regardless of age, for revalidation against the backend."""
+        return self.entries.get((entity_type, entity_id, scope))
+
+    def revalidated(self, entity_type: str, entity_id: str, scope: str) -> Optional[Any]:
+        """
+        Marks a stale entry as confirmed unchanged by the backend and returns a copy of it,
+        or None if it was invalidated in the meantime.
+        """
+        entry = self.entries.get((entity_type, entity_id, scope))
+        if entry is None:
+            return None
+        entry.fetched_at = time.monotonic()
+        self.entries.move_to_end((entity_type, entity_id, scope))
+        self.stats["revalidated"] += 1
+        return entry.value if entry.shared else self._copy(entry.value)
+
+    def set(self, entity_type: str, entity_id: str, scope: str, value: Any, version: str, etag: Optional[str] = None, shared: bool = False):
+        if self.max_size <= 0:
+            return
+        self.stats["misses"] += 1
+        key = (entity_type, entity_id, scope)
+        self.entries[key] = CachedEntity(value=value if shared else self._copy(value), version=version, etag=etag, shared=shared)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def evict(self, entity_type: str, entity_id: Optional[str] = None):
+        """Drops an entity for every scope, or every entity of the type when no id is given."""
+        for key in [key for key in self.entries if key[0] == entity_type and (entity_id is None or key[1] == entity_id)]:
+            del self.entries[key]
+        self.stats["invalidations"] += 1
+
+    async def invalidate(self, entity_type: str, entity_id: Optional[str] = None):
+        """Evicts the entity locally and tells the other replicas to do the same."""
+        self.evict(entity_type, entity_id)
+        if not self.redis_client:
+            return
+        try:
+            await self.redis_client.publish(self.channel, json.dumps({"entity_type": entity_type, "entity_id": entity_id}))
+        except Exception as e:
+            LOGGER.error(f"Error publishing invalidation for {entity_type} {entity_id}: {e}")
+
+    async def listen_for_invalidations(self):
+        pubsub = self.redis_client.pubsub()
+        await pubsub.subscribe(self.channel)
+        LOGGER.debug(f"Listening for entity invalidations on {self.channel}")
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                try:
+                    data = json.loads(message["data"])
+                    self.evict(data["entity_type"], data.get("entity_id"))
+                except Exception as e:
+                    LOGGER.error(f"Ignoring malformed invalidation {message['data']}: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # From here on get_fresh stops serving entries, see above
+            LOGGER.error(f"Entity invalidation listener stopped: {e}\n{get_traceback()}")
+        finally:
+            await pubsub.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"size": len(self.entries), "max_size": self.max_size, "ttl": self.ttl, **self.stats}
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return value.model_copy(deep=True)
+        if isinstance(value, dict):
+            return {key: EntityCache._copy(item) for key, item in value.items()}
+        return value
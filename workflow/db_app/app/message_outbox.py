@@ -0,0 +1,64 @@
+import aiohttp
+from typing import Any, List
+from pydantic import BaseModel, ConfigDict
+from workflow.core.data_structures import MessageDict
+from workflow.util import LOGGER
+
+class MessageOutbox(BaseModel):
+    """
+    Write-behind buffer for the messages generated in a chat thread.
+
+    Messages are collected as they are produced and written with a single bulk request when
+    the outbox is flushed, typically once per chat turn, instead of one round-trip per
+    message. The bulk write stores every message or none, so a failed flush is never
+    retried message by message, which could duplicate them. Only a backend without the
+    bulk route, which wrote nothing, gets the messages one by one as before.
+
+    Attributes:
+        db_app (BackendAPI): The backend used to store the messages.
+        chat_id (str): The chat the messages belong to.
+        thread_id (str): The thread the messages are appended to.
+    """
+    db_app: Any
+    chat_id: str
+    thread_id: str
+    pending: List[MessageDict] = []
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def add(self, message: MessageDict):
+        self.pending.append(message)
+
+    def extend(self, messages: List[MessageDict]):
+        self.pending.extend(messages)
+
+    async def flush(self) -> List[MessageDict]:
+        """
+        Writes every pending message, in order.
+
+        Returns:
+            List[MessageDict]: The messages stored, carrying the id the backend gave them. Messages
+            stored one by one have no id, as the per-message route does not report it.
+        """
+        if not self.pending:
+            return []
+        messages, self.pending = self.pending, []
+
+        try:
+            message_ids = await self.db_app.store_chat_messages(self.chat_id, self.thread_id, messages)
+            return [message.model_copy(update={"id": message_id}) for message, message_id in zip(messages, message_ids)]
+        except aiohttp.ClientResponseError as e:
+            if e.status not in (404, 405):
+                LOGGER.error(f"Failed to store {len(messages)} messages in chat_id {self.chat_id}: {e}")
+                return []
+        except aiohttp.ClientError as e:
+            LOGGER.error(f"Storing {len(messages)} messages in chat_id {self.chat_id} failed in transit, they may not be stored: {e}")
+            return []
+
+        LOGGER.warning(f"Backend has no bulk message route, storing {len(messages)} messages in chat_id {self.chat_id} one by one")
+        stored = []
+        for message in messages:
+            if await self.db_app.store_chat_message(self.chat_id, self.thread_id, message):
+                stored.append(message)
+            else:
+                LOGGER.error(f"Failed to store message: {message} in chat_id {self.chat_id}")
+        return stored
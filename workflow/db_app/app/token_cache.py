@@ -0,0 +1,86 @@
+import asyncio, hashlib, os, time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from pydantic import BaseModel, Field, ConfigDict
+
+class TokenValidationCache(BaseModel):
+    """
+    Bounded TTL cache of token validation results.
+
+    Valid tokens are kept for `ttl` seconds and rejected tokens for `negative_ttl` seconds,
+    so a burst of requests carrying the same token costs a single backend round-trip.
+    Concurrent lookups of a token that is not cached share the same in-flight validation.
+    Entries are keyed by a hash of the token and evicted least-recently-used once
+    `max_size` is reached. Transient failures (backend unreachable, 5xx) are never cached.
+    """
+    ttl: float = Field(float(os.getenv("TOKEN_CACHE_TTL", "60")), description="Seconds a valid token is trusted without revalidation")
+    negative_ttl: float = Field(float(os.getenv("TOKEN_NEGATIVE_CACHE_TTL", "10")), description="Seconds a rejected token is rejected without revalidation")
+    max_size: int = Field(int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000")), description="Maximum number of cached tokens")
+    entries: Dict[str, Tuple[float, Dict[str, Any]]] = Field(default_factory=OrderedDict, exclude=True)
+    pending: Dict[str, asyncio.Future] = Field(default_factory=dict, exclude=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self._key(token)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return result
+
+    def set(self, token: str, result: Dict[str, Any], cacheable: bool = True):
+        if not cacheable:
+            return
+        ttl = self.ttl if result.get("valid") else self.negative_ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        key = self._key(token)
+        self.entries[key] = (time.monotonic() + ttl, result)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, token: Optional[str] = None):
+        """Drops a single token, or every cached token when none is given."""
+        if token is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(self._key(token), None)
+
+    async def get_or_validate(self, token: str, validate: Callable[[str], Awaitable[Tuple[Dict[str, Any], bool]]]) -> Dict[str, Any]:
+        """
+        Returns the cached result for `token`, or runs `validate` once for all concurrent
+        callers. `validate` returns the validation result and whether it may be cached.
+        """
+        cached = self.get(token)
+        if cached is not None:
+            return cached
+        key = self._key(token)
+        if key in self.pending:
+            return await asyncio.shield(self.pending[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        try:
+            result, cacheable = await validate(token)
+            self.set(token, result, cacheable)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting on it
+            future.exception()
+            raise
+        finally:
+            self.pending.pop(key, None)
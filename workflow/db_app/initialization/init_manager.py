@@ -8,7 +8,7 @@ from workflow.core import AliceAgent, AliceChat, AliceTask, API, APIConfig
 from workflow.core.data_structures import (
     EntityType, ParameterDefinition, FunctionParameters, TaskResponse, User, UserCheckpoint, Prompt, AliceModel, UserInteraction
     )
-from workflow.core.tasks import available_task_types
+from workflow.core.tasks import TASK_TYPES
 
 class DBInitManager(BaseModel):
     """
@@ -190,17 +190,17 @@ class DBInitManager(BaseModel):
                     LOGGER.error(f"Invalid task data for key '{task_key}': {task_data}")
                     raise ValueError(f"Invalid task data for key '{task_key}': {task_data}")
 
-        for task_class in available_task_types:
-            if task_type == task_class.__name__:
-                try:                
-                    task = task_class(**task_dict)
-                    # LOGGER.debug(f"Just created task: {task.model_dump()}")
-                    return task
-                except Exception as e:
-                    LOGGER.error(f"Error creating task of type {task_type}: {str(e)} \n Task data: {task_dict}")
-                    raise ValidationError(f"Error creating task of type {task_type}: {str(e)}")
-        LOGGER.error(f"Task type {task_type} not found in available task types.")
-        raise ValueError(f"Task type {task_type} not found in available task types.")
+        task_class = TASK_TYPES.get(task_type)
+        if task_class is None:
+            LOGGER.error(f"Task type {task_type} not found in available task types.")
+            raise ValueError(f"Task type {task_type} not found in available task types.")
+        try:
+            task = task_class(**task_dict)
+            # LOGGER.debug(f"Just created task: {task.model_dump()}")
+            return task
+        except Exception as e:
+            LOGGER.error(f"Error creating task of type {task_type}: {str(e)} \n Task data: {task_dict}")
+            raise ValidationError(f"Error creating task of type {task_type}: {str(e)}")
     
     def create_chat_from_json(self, chat_data: dict) -> AliceChat:
         LOGGER.debug(f"Creating chat from JSON: {chat_data}")
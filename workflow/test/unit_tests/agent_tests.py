@@ -1,8 +1,8 @@
-import pytest
+import asyncio, pytest, time
 from typing import List
 from unittest.mock import Mock, AsyncMock
 from workflow.core import Prompt, AliceModel, APIManager, AliceAgent
-from workflow.core.data_structures import MessageDict, ToolFunction, FunctionConfig, FunctionParameters, ParameterDefinition
+from workflow.core.data_structures import MessageDict, ToolFunction, FunctionConfig, FunctionParameters, ParameterDefinition, ToolCall
 
 @pytest.fixture
 def mock_api_manager():
@@ -112,5 +112,47 @@ async def test_generate_response_recursion_limit(sample_agent, mock_api_manager)
     assert result[1].role == "tool", f"Expected second message role to be 'tool', but got {result[1].role}"
     assert result[1].content == "Function called", f"Expected second message content to be 'Function called', but got {result[1].content}"
 
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_in_call_order(sample_agent):
+    running = {"now": 0, "max": 0}
+    finished = []
+
+    async def search(query: str):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        # Earlier calls take longer, so they finish last
+        await asyncio.sleep(0.05 * (5 - int(query)))
+        running["now"] -= 1
+        finished.append(query)
+        return f"Results for {query}"
+
+    async def write(query: str):
+        assert running["now"] == 0, "Unsafe tools must run alone"
+        finished.append("write")
+        return "Written"
+    write.parallel_safe = False
+
+    async def slow(query: str):
+        await asyncio.sleep(1)
+
+    tools_list = [ToolFunction(function=FunctionConfig(
+        name=name,
+        description="Test tool",
+        parameters=FunctionParameters(type="object", properties={"query": ParameterDefinition(type="string", description="Query")}, required=["query"]),
+    )) for name in ("search", "write", "slow")]
+    tool_calls = [ToolCall(id=f"call_{index}", function={"name": name, "arguments": {"query": str(index)}})
+                  for index, name in enumerate(["search", "search", "search", "write", "search", "slow"])]
+    sample_agent.max_parallel_tools = 2
+    sample_agent.tool_timeouts = {"slow": 0.1}
+
+    start = time.monotonic()
+    result = await sample_agent.process_tool_calls(tool_calls, {"search": search, "write": write, "slow": slow}, tools_list)
+
+    assert time.monotonic() - start < 0.6
+    assert running["max"] == 2
+    assert [message.content for message in result[:5]] == ["Results for 0", "Results for 1", "Results for 2", "Written", "Results for 4"]
+    assert "timed out after 0.1 seconds" in result[5].content
+    assert finished.index("write") == 3
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
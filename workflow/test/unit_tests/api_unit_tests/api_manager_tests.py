@@ -40,6 +40,20 @@ def test_get_api_by_type(api_manager, sample_api):
     assert api_manager.get_api_by_type(ApiType.LLM_MODEL) == sample_api
     assert api_manager.get_api_by_type(ApiType.GOOGLE_SEARCH) is None
 
+def test_get_api_by_type_uses_first_active_match(api_manager):
+    inactive = API(api_type=ApiType.GOOGLE_SEARCH, api_name=ApiName.GOOGLE_SEARCH, name="Inactive", is_active=False)
+    first = API(api_type=ApiType.GOOGLE_SEARCH, api_name=ApiName.GOOGLE_SEARCH, name="First", is_active=True)
+    second = API(api_type=ApiType.GOOGLE_SEARCH, api_name=ApiName.GOOGLE_SEARCH, name="Second", is_active=True)
+    for api in (inactive, first, second):
+        api.id = api.name
+        api_manager.add_api(api)
+    assert api_manager.get_api_by_type(ApiType.GOOGLE_SEARCH).name == "First"
+    assert api_manager.get_api_by_type("google_search", "google_search").name == "First"
+
+    api_manager.apis.pop("First")
+    api_manager.invalidate_index()
+    assert api_manager.get_api_by_type(ApiType.GOOGLE_SEARCH).name == "Second"
+
 def test_retrieve_api_data_llm(api_manager, sample_api):
     api_manager.add_api(sample_api)
     llm_config = api_manager.retrieve_api_data(ApiType.LLM_MODEL)
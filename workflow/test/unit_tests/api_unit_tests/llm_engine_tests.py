@@ -2,6 +2,9 @@ import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
 from workflow.core.api.engines import LLMEngine
 from workflow.core.data_structures import MessageDict, ModelConfig
+from workflow.core.data_structures.model import ModelCosts
+from workflow.util import stream_events
+from openai.types.chat import ChatCompletionChunk
 
 class TestLLMEngine(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
@@ -82,5 +85,55 @@ class TestLLMEngine(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(usage['prompt_tokens'], 10)
         self.assertEqual(usage['completion_tokens'], 10)
 
+class TestLLMEngineStreaming(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.llm_engine = LLMEngine()
+        self.api_data = ModelConfig(
+            api_key="dummy_api_key",
+            base_url="http://api.example.com",
+            model="test-model",
+            model_costs=ModelCosts()
+        )
+        self.messages = [{"role": "user", "content": "Tell me a joke."}]
+
+    @patch('workflow.core.api.client_registry.ClientRegistry.openai_client')
+    async def test_generate_api_response_streaming(self, mock_openai_client):
+        def chunk(delta, finish_reason=None, usage=None):
+            return ChatCompletionChunk.model_validate({
+                "id": "chatcmpl-123", "object": "chat.completion.chunk", "created": 1677652288, "model": "test-model",
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if delta is not None else [],
+                "usage": usage,
+            })
+
+        async def stream():
+            for item in [
+                chunk({"role": "assistant", "content": "Why did "}),
+                chunk({"content": "the chicken"}),
+                chunk({"tool_calls": [{"index": 0, "id": "call_1", "type": "function", "function": {"name": "joke", "arguments": '{"topic": '}}]}),
+                chunk({"tool_calls": [{"index": 0, "function": {"arguments": '"birds"}'}}]}, finish_reason="tool_calls"),
+                chunk(None, usage={"prompt_tokens": 10, "completion_tokens": 12, "total_tokens": 22}),
+            ]:
+                yield item
+
+        mock_client = AsyncMock()
+        mock_openai_client.return_value = mock_client
+        mock_client.chat.completions.create.return_value = stream()
+
+        events = []
+        async def handler(event):
+            events.append(event)
+
+        with stream_events(handler):
+            response = await self.llm_engine.generate_api_response(self.api_data, messages=self.messages, system="You are a helpful assistant.")
+
+        self.assertTrue(mock_client.chat.completions.create.call_args.kwargs["stream"])
+        self.assertEqual([event["delta"] for event in events if event["type"] == "token_delta"], ["Why did ", "the chicken"])
+        message = response.messages[0]
+        self.assertEqual(message.content, "Why did the chicken")
+        self.assertEqual(message.references.tool_calls[0].id, "call_1")
+        self.assertEqual(message.references.tool_calls[0].function.arguments, '{"topic": "birds"}')
+        self.assertEqual(message.creation_metadata["usage"]["total_tokens"], 22)
+        self.assertEqual(message.creation_metadata["finish_reason"], "tool_calls")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
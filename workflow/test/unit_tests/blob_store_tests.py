@@ -0,0 +1,71 @@
+import asyncio, os, tempfile, time, unittest
+from workflow.core.data_structures import NodeResponse, References, OffloadedReferences, MessageDict, TaskResponse, offload_references, offload_node_references, load_node_references
+from workflow.util import BLOB_STORE
+
+class TestBlobStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.settings = (BLOB_STORE.directory, BLOB_STORE.min_size, BLOB_STORE.retention_days)
+        BLOB_STORE.directory, BLOB_STORE.min_size, BLOB_STORE.retention_days = self.directory.name, 1024, 1
+
+    def tearDown(self):
+        BLOB_STORE.directory, BLOB_STORE.min_size, BLOB_STORE.retention_days = self.settings
+        self.directory.cleanup()
+
+    def test_blobs_are_content_addressed(self):
+        blob_id = BLOB_STORE.put(b"payload")
+        self.assertEqual(BLOB_STORE.put(b"payload"), blob_id)
+        self.assertEqual(BLOB_STORE.get(blob_id), b"payload")
+        self.assertEqual(sum(len(files) for _, _, files in os.walk(self.directory.name)), 1)
+
+    def test_garbage_collection_keeps_blobs_used_within_retention(self):
+        expired, kept, stored_again = BLOB_STORE.put(b"expired"), BLOB_STORE.put(b"kept"), BLOB_STORE.put(b"stored again")
+        two_days_ago = time.time() - 2 * 86400
+        for blob_id in (expired, stored_again):
+            os.utime(BLOB_STORE._path(blob_id), (two_days_ago, two_days_ago))
+        BLOB_STORE.put(b"stored again")
+
+        self.assertEqual(BLOB_STORE.collect_garbage(), 1)
+        self.assertFalse(os.path.exists(BLOB_STORE._path(expired)))
+        self.assertEqual(BLOB_STORE.get(kept), b"kept")
+        self.assertEqual(BLOB_STORE.get(stored_again), b"stored again")
+
+        BLOB_STORE.retention_days = 0
+        os.utime(BLOB_STORE._path(kept), (two_days_ago, two_days_ago))
+        self.assertEqual(BLOB_STORE.collect_garbage(), 0)
+
+    def test_large_references_serialize_as_handles_and_load_lazily(self):
+        small = References(messages=[MessageDict(role="assistant", content="Short")])
+        self.assertIs(offload_references(small), small)
+
+        large = References(messages=[MessageDict(role="tool", content="<html>" + "x" * 4096 + "</html>")])
+        node = NodeResponse(parent_task_id="task_1", node_name="scrape", exit_code=0, execution_order=0, references=offload_references(large))
+        self.assertIsInstance(node.references, OffloadedReferences)
+
+        response = TaskResponse(task_name="Scrape", task_description="Scrapes", status="complete", result_code=0, node_references=[node])
+        data = response.model_dump()
+        blob = data["node_references"][0]["references"]["blob"]
+        self.assertEqual((blob["count"], blob["summary"]), (1, "Messages: 1"))
+        self.assertLess(len(str(data)), 1024)
+
+        restored = TaskResponse(**data).node_references[0].references
+        self.assertIsInstance(restored, OffloadedReferences)
+        self.assertEqual(restored.summary(), "Messages: 1")
+        self.assertEqual(restored.messages[0].content, large.messages[0].content)
+        self.assertEqual(restored.detailed_summary(), large.detailed_summary())
+
+    def test_nodes_are_offloaded_and_loaded_in_worker_threads(self):
+        large = References(messages=[MessageDict(role="tool", content="x" * 4096)])
+        nodes = [NodeResponse(parent_task_id="task_1", node_name="scrape", exit_code=0, execution_order=0, references=large)]
+        offloaded = asyncio.run(offload_node_references(nodes))
+        self.assertIs(nodes[0].references, large)
+        self.assertIsInstance(offloaded[0].references, OffloadedReferences)
+
+        restored = [NodeResponse(**node.model_dump()) for node in offloaded]
+        asyncio.run(load_node_references(restored))
+        # Already loaded, reading doesn't touch the store
+        os.remove(BLOB_STORE._path(restored[0].references.blob.blob_id))
+        self.assertEqual(restored[0].references.messages[0].content, "x" * 4096)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import copy, json, os, tempfile, unittest
+from workflow.core.data_structures import NodeResponse, References, MessageDict, FunctionParameters, ParameterDefinition, UserCheckpoint, OffloadedReferences
+from workflow.core.tasks import AliceTask, CHECKPOINT_STORE, checkpointing
+from workflow.util import BLOB_STORE
+from workflow.api_app.util.utils import TaskResumeRequest
+from workflow.api_app.routes.task_execute import run_and_store_task
+from workflow.api_app.routes.task_resume import resume_task_endpoint
+
+class ReviewTask(AliceTask):
+    async def execute_draft(self, execution_history, node_responses, **kwargs):
+        message = MessageDict(role="assistant", content=f"Draft about {kwargs['topic']}. " * 200, generated_by="llm")
+        return NodeResponse(parent_task_id=self.id, node_name="draft", exit_code=0, references=References(messages=[message]), execution_order=len(execution_history))
+
+    async def execute_review(self, execution_history, node_responses, **kwargs):
+        return NodeResponse(parent_task_id=self.id, node_name="review", exit_code=0, execution_order=len(execution_history))
+
+    async def execute_publish(self, execution_history, node_responses, **kwargs):
+        exit_code = 0 if kwargs.get("topic") == "cats" else 1
+        return NodeResponse(parent_task_id=self.id, node_name="publish", exit_code=exit_code, execution_order=len(execution_history))
+
+class FakeDBApp:
+    """Stores task responses as JSON, like the backend does."""
+    def __init__(self, task):
+        self.task = task
+        self.user_data = {"user_obj": {}}
+        self.responses = {}
+
+    async def get_task(self, task_id):
+        return self.task
+
+    async def api_setter(self):
+        return None
+
+    async def create_entity_in_db(self, entity, data):
+        response_id = f"response_{len(self.responses) + 1}"
+        self.responses[response_id] = json.loads(json.dumps({**data, "_id": response_id}, default=str))
+        return self.responses[response_id]
+
+    async def update_entity_in_db(self, entity, entity_id, data):
+        return await self.create_entity_in_db(entity, data)
+
+    async def get_entity_from_db(self, entity, entity_id):
+        return copy.deepcopy(self.responses[entity_id])
+
+class TestExecutionCheckpoints(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        for store, name, value in (
+            (CHECKPOINT_STORE, "directory", os.path.join(self.directory.name, "checkpoints")),
+            (BLOB_STORE, "directory", os.path.join(self.directory.name, "blobs")),
+            # Offloads the draft, not the user interaction
+            (BLOB_STORE, "min_size", 2048),
+        ):
+            self.addCleanup(setattr, store, name, getattr(store, name))
+            setattr(store, name, value)
+        self.task = ReviewTask(
+            _id="task_1",
+            task_name="Review",
+            task_description="Drafts and publishes after review",
+            start_node="draft",
+            node_end_code_routing={
+                "draft": {0: ("review", False)},
+                "review": {0: ("publish", False)},
+                "publish": {0: (None, False), 1: (None, True)},
+            },
+            user_checkpoints={"review": UserCheckpoint(user_prompt="Publish?", task_next_obj={0: "publish", 1: "draft"})},
+            input_variables=FunctionParameters(
+                type="object",
+                properties={"topic": ParameterDefinition(type="string", description="Topic")},
+                required=["topic"]
+            ),
+            required_apis=[],
+        )
+        self.db_app = FakeDBApp(self.task)
+
+    async def pause(self) -> str:
+        """Runs the task until it pauses and answers its user interaction in the stored response."""
+        stored = await run_and_store_task(self.db_app, self.task, None, {"topic": "cats"})
+        self.assertEqual(stored["status"], "pending")
+        self.db_app.responses[stored["_id"]]["node_references"][-1]["references"]["user_interactions"][-1]["user_response"] = {"selected_option": 0}
+        return stored["_id"]
+
+    async def resume(self, response_id: str) -> dict:
+        request = TaskResumeRequest(task_response_id=response_id)
+        return await resume_task_endpoint(request, db_app=self.db_app, queue_manager=None, enqueue=False)
+
+    async def test_paused_task_resumes_from_checkpoint(self):
+        response_id = await self.pause()
+        checkpoint = await CHECKPOINT_STORE.load(response_id)
+        self.assertEqual((checkpoint.node_name, checkpoint.status, checkpoint.node_count), ("review", "pending", 2))
+        # Node outputs are kept as blob handles, loaded only if read
+        self.assertIsInstance(checkpoint.nodes[0].references, OffloadedReferences)
+        self.assertEqual(checkpoint.nodes[0].references.blob.count, 1)
+        self.assertEqual(
+            {(item.node_name, tuple(item.exit_codes.items())) for item in checkpoint.attempts},
+            {("draft", ((0, 1),)), ("review", ((0, 1),))}
+        )
+
+        # Only the paused node is read from the stored response
+        self.db_app.responses[response_id]["node_references"][0] = {"unreadable": True}
+        result = await self.resume(response_id)
+
+        self.assertEqual(result["status"], "complete")
+        self.assertEqual([node["node_name"] for node in result["node_references"]], ["draft", "review", "publish"])
+        draft = NodeResponse(**result["node_references"][0])
+        self.assertEqual(draft.references.messages[0].content, "Draft about cats. " * 200)
+        self.assertIsNone(await CHECKPOINT_STORE.load(response_id))
+
+    async def test_stale_checkpoint_is_ignored(self):
+        response_id = await self.pause()
+        checkpoint = await CHECKPOINT_STORE.load(response_id)
+        checkpoint.nodes = checkpoint.nodes[1:]
+        await CHECKPOINT_STORE.save(response_id, checkpoint)
+
+        # Resumed from the stored nodes instead
+        result = await self.resume(response_id)
+        self.assertEqual(result["status"], "complete")
+        self.assertEqual([node["node_name"] for node in result["node_references"]], ["draft", "review", "publish"])
+
+    async def test_new_runs_keep_their_checkpoint_for_the_caller(self):
+        with checkpointing(self.task.id) as scope:
+            paused = await self.task.run(topic="cats")
+        self.assertEqual((paused.status, scope.checkpoint.node_count), ("pending", 2))
+        # Stored by the caller under the response id, nothing to write until then
+        self.assertFalse(os.path.exists(CHECKPOINT_STORE.directory))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import time, unittest
+from workflow.core.api import ClientRegistry
+
+class TestClientRegistry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.registry = ClientRegistry(idle_ttl=60)
+
+    async def asyncTearDown(self):
+        await self.registry.close()
+
+    async def test_clients_are_shared_per_provider_url_and_key(self):
+        client = self.registry.openai_client("key", "https://api.example.com/v1/")
+        self.assertIs(self.registry.openai_client("key", "https://api.example.com/v1"), client)
+        self.assertIsNot(self.registry.openai_client("other_key", "https://api.example.com/v1"), client)
+        self.assertIsNot(self.registry.anthropic_client("key", "https://api.example.com/v1"), client)
+
+        # Timeouts are per call, over the same connection pool
+        with_timeout = self.registry.openai_client("key", "https://api.example.com/v1", timeout=5)
+        self.assertEqual(with_timeout.timeout, 5)
+        self.assertIs(with_timeout._client, client._client)
+        self.assertEqual(self.registry.get_stats()["providers"], {"openai": 2, "anthropic": 1})
+        self.assertNotIn("key", str(list(self.registry.entries)))
+
+    async def test_idle_clients_are_evicted_and_closed(self):
+        session = self.registry.http_session("wolfram_alpha")
+        self.assertEqual(self.registry.evict_idle(force=True), 0)
+        next(iter(self.registry.entries.values())).last_used = time.monotonic() - 61
+        self.assertEqual(self.registry.evict_idle(force=True), 1)
+        self.assertIsNot(self.registry.http_session("wolfram_alpha"), session)
+        await self.registry.close()
+        self.assertTrue(session.closed)
+        self.assertEqual(self.registry.entries, {})
+
+    def test_global_configuration_runs_when_the_key_changes(self):
+        calls = []
+        for key in ["first", "first", "second", "first"]:
+            self.registry.configure_global("gemini", key, lambda: calls.append(key))
+        self.assertEqual(calls, ["first", "second", "first"])
+
+if __name__ == '__main__':
+    unittest.main()
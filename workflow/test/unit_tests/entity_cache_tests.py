@@ -0,0 +1,42 @@
+import unittest
+from workflow.core.data_structures import MessageDict
+from workflow.db_app.app.entity_cache import EntityCache
+
+class TestEntityCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = EntityCache(ttl=60, max_size=2)
+        self.message = MessageDict(role="user", content="Hello")
+
+    def test_reads_return_copies(self):
+        self.cache.set("chats", "chat_1", "user_1", self.message, version="v1")
+        first = self.cache.get_fresh("chats", "chat_1", "user_1")
+        first.content = "Changed"
+        self.assertEqual(self.cache.get_fresh("chats", "chat_1", "user_1").content, "Hello")
+
+    def test_entries_are_scoped_and_evicted_for_every_scope(self):
+        self.cache.set("chats", "chat_1", "user_1", self.message, version="v1")
+        self.assertIsNone(self.cache.get_fresh("chats", "chat_1", "user_2"))
+        self.cache.set("chats", "chat_1", "user_2", self.message, version="v1")
+        self.cache.evict("chats", "chat_1")
+        self.assertIsNone(self.cache.get_entry("chats", "chat_1", "user_1"))
+        self.assertIsNone(self.cache.get_entry("chats", "chat_1", "user_2"))
+
+    def test_stale_entries_are_kept_for_revalidation(self):
+        self.cache.ttl = 0
+        self.cache.set("tasks", "task_1", "user_1", self.message, version="v1", etag='W/"1"')
+        self.assertIsNone(self.cache.get_fresh("tasks", "task_1", "user_1"))
+        self.assertEqual(self.cache.get_entry("tasks", "task_1", "user_1").etag, 'W/"1"')
+        self.assertEqual(self.cache.revalidated("tasks", "task_1", "user_1").content, "Hello")
+        self.cache.evict("tasks")
+        self.assertIsNone(self.cache.revalidated("tasks", "task_1", "user_1"))
+
+    def test_least_recently_used_entry_is_dropped(self):
+        self.cache.set("tasks", "task_1", "user_1", self.message, version="v1")
+        self.cache.set("tasks", "task_2", "user_1", self.message, version="v1")
+        self.cache.get_fresh("tasks", "task_1", "user_1")
+        self.cache.set("tasks", "task_3", "user_1", self.message, version="v1")
+        self.assertIsNotNone(self.cache.get_entry("tasks", "task_1", "user_1"))
+        self.assertIsNone(self.cache.get_entry("tasks", "task_2", "user_1"))
+
+if __name__ == '__main__':
+    unittest.main()
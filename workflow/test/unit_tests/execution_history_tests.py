@@ -0,0 +1,78 @@
+import unittest
+from workflow.core.data_structures import ExecutionHistory, NodeResponse, References, MessageDict, FunctionParameters, ParameterDefinition
+from workflow.core.tasks import validate_and_process_function_inputs
+
+def node(parent_task_id, node_name, exit_code):
+    return NodeResponse(parent_task_id=parent_task_id, node_name=node_name, exit_code=exit_code, execution_order=0)
+
+class TestExecutionHistory(unittest.TestCase):
+    def setUp(self):
+        self.history = ExecutionHistory([node("task_1", "plan", 1), node("task_2", "inner", 0)])
+        self.history.append(node("task_1", "plan", 0))
+        self.history += [node("task_1", "code", 2)]
+
+    def test_is_a_list(self):
+        self.assertIsInstance(self.history, list)
+        self.assertEqual(len(self.history), 4)
+        self.assertEqual([item.node_name for item in reversed(self.history)], ["code", "plan", "inner", "plan"])
+        self.assertIs(ExecutionHistory.wrap(self.history), self.history)
+
+    def test_indexes_follow_appends(self):
+        self.assertIs(self.history.last_by_name("plan"), self.history[2])
+        self.assertIs(self.history.last_by_parent("task_1"), self.history[3])
+        self.assertEqual(self.history.count_by_parent("task_2"), 1)
+        self.assertEqual(self.history.count_attempts("task_1", "plan"), 2)
+        self.assertEqual(self.history.count_attempts("task_1", "plan", [1]), 1)
+        self.assertEqual(self.history.count_attempts("task_2", "plan"), 0)
+        self.assertIsNone(self.history.last_by_name("missing"))
+
+    def test_indexes_are_rebuilt_after_other_mutations(self):
+        del self.history[2]
+        self.assertIs(self.history.last_by_name("plan"), self.history[0])
+        self.history.insert(0, node("task_3", "plan", 0))
+        self.assertEqual(self.history.count_attempts("task_3", "plan"), 1)
+        self.history.pop()
+        self.assertIsNone(self.history.last_by_name("code"))
+        self.history.clear()
+        self.assertIsNone(self.history.last_by_parent("task_1"))
+
+    def test_resolved_values_follow_the_last_node_with_references(self):
+        self.assertIsNone(self.history.resolved_value("plan"))
+        first = NodeResponse(parent_task_id="task_1", node_name="count", exit_code=0, execution_order=4,
+                             references=References(messages=[MessageDict(role="assistant", content="3")]))
+        self.history.append(first)
+        self.assertEqual(self.history.resolved_value("count"), first.references.detailed_summary())
+        # Nodes without references don't shadow earlier outputs
+        self.history.append(node("task_1", "count", 1))
+        self.assertEqual(self.history.resolved_value("count"), first.references.detailed_summary())
+
+        params = FunctionParameters(
+            properties={
+                "count": ParameterDefinition(type="string", description="Count"),
+                "limit": ParameterDefinition(type="integer", description="Limit", default=10),
+            },
+            required=["count"],
+        )
+        inputs, error = validate_and_process_function_inputs(params, self.history, kwargs={"limit": "7.0"})
+        self.assertIsNone(error)
+        self.assertEqual(inputs, {"count": first.references.detailed_summary(), "limit": 7})
+        inputs, error = validate_and_process_function_inputs(params, ExecutionHistory(), kwargs={})
+        self.assertEqual((inputs, error), ({}, "Missing required parameter: count"))
+
+    def test_restore_takes_counts_and_values_from_the_snapshot(self):
+        output = NodeResponse(parent_task_id="task_1", node_name="count", exit_code=0, execution_order=4,
+                              references=References(messages=[MessageDict(role="assistant", content="3")]))
+        self.history.append(output)
+        self.history.resolved_value("count")
+        counts, values = self.history.exit_code_counts(), self.history.resolved_values()
+        self.assertEqual(counts[("task_1", "plan")], {1: 1, 0: 1})
+        self.assertEqual(values, {"count": output.references.detailed_summary()})
+
+        restored = ExecutionHistory.restore(list(self.history), counts, {"count": "cached"})
+        self.assertEqual(restored.count_attempts("task_1", "plan", [1]), 1)
+        # Not summarized again from the node
+        self.assertEqual(restored.resolved_value("count"), "cached")
+        self.assertEqual(restored.copy().resolved_value("count"), "cached")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import aiohttp, unittest
+from typing import List, Optional
+from yarl import URL
+from workflow.core.data_structures import MessageDict
+from workflow.db_app.app import MessageOutbox
+
+class LocalBackend:
+    """Stand-in for BackendAPI that keeps stored threads in memory."""
+    def __init__(self, bulk_status: Optional[int] = None, bulk_error: Optional[Exception] = None):
+        self.bulk_status = bulk_status
+        self.bulk_error = bulk_error
+        self.threads = {}
+        self.requests = 0
+
+    async def store_chat_messages(self, chat_id: str, thread_id: str, messages: List[MessageDict]) -> List[str]:
+        self.requests += 1
+        if self.bulk_error:
+            raise self.bulk_error
+        if self.bulk_status:
+            url = URL(f"http://backend/chats/{chat_id}/add_messages")
+            request_info = aiohttp.RequestInfo(url, "PATCH", {}, url)
+            raise aiohttp.ClientResponseError(request_info, (), status=self.bulk_status)
+        thread = self.threads.setdefault(thread_id, [])
+        ids = [f"message_{len(thread) + index}" for index in range(len(messages))]
+        thread.extend(messages)
+        return ids
+
+    async def store_chat_message(self, chat_id: str, thread_id: str, message: MessageDict) -> bool:
+        self.requests += 1
+        self.threads.setdefault(thread_id, []).append(message)
+        return True
+
+class TestMessageOutbox(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.messages = [MessageDict(role="assistant", content=f"Turn {index}") for index in range(3)]
+
+    async def test_flush_stores_turn_in_one_request(self):
+        backend = LocalBackend()
+        outbox = MessageOutbox(db_app=backend, chat_id="chat_1", thread_id="thread_1")
+        outbox.extend(self.messages)
+
+        stored = await outbox.flush()
+
+        self.assertEqual([message.id for message in stored], ["message_0", "message_1", "message_2"])
+        self.assertEqual(backend.requests, 1)
+        self.assertEqual([message.content for message in backend.threads["thread_1"]], ["Turn 0", "Turn 1", "Turn 2"])
+        self.assertEqual(await outbox.flush(), [])
+
+    async def test_falls_back_to_single_messages_without_bulk_route(self):
+        backend = LocalBackend(bulk_status=404)
+        outbox = MessageOutbox(db_app=backend, chat_id="chat_1", thread_id="thread_1")
+        for message in self.messages:
+            outbox.add(message)
+
+        stored = await outbox.flush()
+
+        self.assertEqual([message.content for message in stored], ["Turn 0", "Turn 1", "Turn 2"])
+        self.assertEqual(len(backend.threads["thread_1"]), 3)
+        self.assertEqual(backend.requests, 4)
+
+    async def test_failed_bulk_write_is_not_retried(self):
+        for backend in (LocalBackend(bulk_status=500), LocalBackend(bulk_error=aiohttp.ServerDisconnectedError())):
+            outbox = MessageOutbox(db_app=backend, chat_id="chat_1", thread_id="thread_1")
+            outbox.extend(self.messages)
+
+            self.assertEqual(await outbox.flush(), [])
+            self.assertEqual(backend.requests, 1)
+            self.assertNotIn("thread_1", backend.threads)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from workflow.core.data_structures import NodeResponse, FunctionParameters, ParameterDefinition
+from workflow.core.tasks import AliceTask, NodeResultCache, NODE_RESULT_CACHE
+from workflow.util import tracing
+
+class SearchTask(AliceTask):
+    calls: int = 0
+
+    async def execute_default(self, execution_history, node_responses, **kwargs):
+        self.calls += 1
+        exit_code = 1 if kwargs["prompt"] == "fail" else 0
+        return NodeResponse(parent_task_id=self.id, node_name="default", exit_code=exit_code, execution_order=len(execution_history))
+
+class TestNodeResultCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        NODE_RESULT_CACHE.entries.clear()
+        self.task = SearchTask(
+            _id="task_1",
+            task_name="Search",
+            task_description="Searches",
+            start_node="default",
+            cached_nodes=["default"],
+            node_end_code_routing={"default": {0: (None, False), 1: ("default", True)}},
+            input_variables=FunctionParameters(
+                type="object",
+                properties={"prompt": ParameterDefinition(type="string", description="Query")},
+                required=["prompt"]
+            )
+        )
+
+    async def test_successful_results_are_replayed_for_the_same_inputs(self):
+        first = await self.task.execute_node("default", [], [], prompt="cats", api_manager=object())
+        replayed = await self.task.execute_node("default", [first], [first], prompt="cats", api_manager=object())
+        self.assertEqual(self.task.calls, 1)
+        self.assertEqual(replayed.execution_order, 1)
+
+        await self.task.execute_node("default", [], [], prompt="dogs")
+        await self.task.execute_node("default", [], [], prompt="fail")
+        await self.task.execute_node("default", [], [], prompt="fail")
+        self.assertEqual(self.task.calls, 4)
+
+    async def test_replayed_results_are_traced_like_runs(self):
+        async with tracing("search", enabled=True) as trace:
+            await self.task.execute_node("default", [], [], prompt="cats")
+            await self.task.execute_node("default", [], [], prompt="cats")
+        self.assertEqual(self.task.calls, 1)
+        self.assertEqual([span.name for span in trace.spans], ["default", "default"])
+        self.assertEqual([span.attributes.get("cached") for span in trace.spans], [None, True])
+        self.assertEqual([span.attributes["exit_code"] for span in trace.spans], [0, 0])
+
+    def test_keys_are_stable_across_input_order(self):
+        first = NodeResultCache.make_key("task_1", "default", {"prompt": "cats", "max_results": 5})
+        second = NodeResultCache.make_key("task_1", "default", {"max_results": 5, "prompt": "cats"})
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, NodeResultCache.make_key("task_2", "default", {"prompt": "cats", "max_results": 5}))
+        edited = NodeResultCache.make_key("task_1", "default", {"prompt": "cats", "max_results": 5}, "2024-06-01T00:00:00Z")
+        self.assertNotEqual(first, edited)
+        self.assertEqual(edited, NodeResultCache.make_key("task_1", "default", {"max_results": 5, "prompt": "cats"}, "2024-06-01T00:00:00Z"))
+
+    async def test_entries_expire_and_are_bounded(self):
+        cache = NodeResultCache(ttl=60, max_size=1)
+        node = NodeResponse(node_name="default", exit_code=0, execution_order=0)
+        await cache.set("a", node)
+        await cache.set("b", node)
+        self.assertIsNone(await cache.get("a"))
+        self.assertEqual((await cache.get("b")).node_name, "default")
+
+        cache.ttl = 0
+        await cache.set("c", node)
+        self.assertIsNone(await cache.get("c"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from types import SimpleNamespace
+from workflow.core.api.engines.llm_engines.llm_engine import LLMEngine
+from workflow.core.api.engines.llm_engines.anthropic_llm_engine import LLMAnthropic
+from workflow.core.data_structures import ModelConfig
+from workflow.core.data_structures.model import ModelCosts
+
+def model_config():
+    return ModelConfig(
+        model="model",
+        api_key="key",
+        base_url="https://api.example.com",
+        model_costs=ModelCosts(input_token_cost_per_million=10, cached_input_token_cost_per_million=1, output_token_cost_per_million=20),
+    )
+
+class TestPromptCaching(unittest.TestCase):
+    def test_anthropic_breakpoints_mark_stable_prefixes(self):
+        tools = [{"name": "search", "input_schema": {}}, {"name": "fetch", "input_schema": {}}]
+        messages = [
+            {"role": "user", "content": "First"},
+            {"role": "assistant", "content": "Answer"},
+            {"role": "user", "content": "Second"},
+            {"role": "assistant", "content": "Answer"},
+            {"role": "user", "content": [{"type": "text", "text": "Third"}]},
+        ]
+        system, cached_tools, cached_messages = LLMAnthropic().add_cache_breakpoints("System", tools, messages)
+
+        self.assertEqual(system, [{"type": "text", "text": "System", "cache_control": {"type": "ephemeral"}}])
+        self.assertEqual([tool.get("cache_control") for tool in cached_tools], [None, {"type": "ephemeral"}])
+        self.assertEqual(cached_messages[0], messages[0])
+        self.assertEqual(cached_messages[2]["content"], [{"type": "text", "text": "Second", "cache_control": {"type": "ephemeral"}}])
+        self.assertEqual(cached_messages[4]["content"][-1]["cache_control"], {"type": "ephemeral"})
+        # Shared tool params and the original messages are left untouched
+        self.assertNotIn("cache_control", tools[-1])
+        self.assertEqual(messages[4]["content"], [{"type": "text", "text": "Third"}])
+
+    def test_cache_usage_and_cost(self):
+        usage = SimpleNamespace(input_tokens=100, output_tokens=10, cache_read_input_tokens=800, cache_creation_input_tokens=100)
+        cache = LLMAnthropic().get_cache_usage(usage)
+        self.assertEqual(cache, {"hit_tokens": 800, "miss_tokens": 200, "write_tokens": 100})
+
+        openai_usage = SimpleNamespace(prompt_tokens=1000, prompt_tokens_details=SimpleNamespace(cached_tokens=800))
+        self.assertEqual(LLMEngine().get_cache_usage(openai_usage), {"hit_tokens": 800, "miss_tokens": 200})
+        self.assertIsNone(LLMEngine().get_cache_usage(SimpleNamespace(prompt_tokens=1000, prompt_tokens_details=None)))
+
+        cost = LLMEngine().calculate_cost(1000, 100, model_config(), cache)
+        self.assertAlmostEqual(cost["input_cost"], (800 * 1 + 200 * 10) / 1000000)
+        self.assertAlmostEqual(cost["total_cost"], (800 * 1 + 200 * 10 + 100 * 20) / 1000000)
+        self.assertAlmostEqual(LLMEngine().calculate_cost(1000, 0, model_config())["input_cost"], 1000 * 10 / 1000000)
+
+    def test_prompt_cache_key_follows_the_stable_prefix(self):
+        key = LLMEngine.prompt_cache_key("model", "System", [{"name": "search"}])
+        self.assertEqual(key, LLMEngine.prompt_cache_key("model", "System", [{"name": "search"}]))
+        self.assertNotEqual(key, LLMEngine.prompt_cache_key("model", "Other system", [{"name": "search"}]))
+
+if __name__ == '__main__':
+    unittest.main()
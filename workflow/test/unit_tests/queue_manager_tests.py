@@ -0,0 +1,64 @@
+import asyncio, unittest
+from typing import Any, Dict, List
+from workflow.api_app.util.queue_backends import QueueBackend, QueueEntry
+from workflow.api_app.util.queue_manager import QueueManager, QueueMessage
+
+class MemoryQueueBackend(QueueBackend):
+    queue: Any = None
+
+    async def enqueue(self, payload: str):
+        await self.queue.put(payload.encode())
+
+    async def next_message(self) -> QueueEntry:
+        return QueueEntry(payload=await self.queue.get())
+
+    async def depth(self) -> int:
+        return self.queue.qsize()
+
+class RecordingQueueManager(QueueManager):
+    release: Any = None
+    finished: List[str] = []
+
+    async def handle_request(self, queue_message: QueueMessage):
+        if queue_message.endpoint == "/slow":
+            await self.release.wait()
+        self.finished.append(queue_message.data["name"])
+
+class TestQueueManager(unittest.IsolatedAsyncioTestCase):
+    async def test_saturated_endpoint_does_not_block_other_endpoints(self):
+        manager = RecordingQueueManager(
+            db_app=None,
+            max_concurrent_jobs=2,
+            max_pending_jobs=8,
+            endpoint_limits={"/slow": 1},
+            backend=MemoryQueueBackend(queue=asyncio.Queue()),
+            release=asyncio.Event(),
+            finished=[],
+        )
+        manager.global_slots = asyncio.Semaphore(manager.max_concurrent_jobs)
+        manager.pending_slots = asyncio.Semaphore(manager.max_pending_jobs)
+        for name in ("slow_1", "slow_2", "slow_3"):
+            await manager.enqueue_request("/slow", {"name": name})
+        await manager.enqueue_request("/fast", {"name": "fast_1"})
+
+        processor = asyncio.create_task(manager.process_requests())
+        try:
+            for _ in range(100):
+                if manager.finished:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(manager.finished, ["fast_1"])
+            stats: Dict[str, Any] = await manager.get_queue_stats()
+            self.assertEqual(stats["endpoints"]["/slow"], {"limit": 1, "active": 1, "waiting": 2})
+
+            manager.release.set()
+            for _ in range(100):
+                if len(manager.finished) == 4:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(manager.finished, ["fast_1", "slow_1", "slow_2", "slow_3"])
+        finally:
+            processor.cancel()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from workflow.core.data_structures import NodeResponse
+from workflow.core.tasks import AliceTask
+from workflow.core.tasks.routing import ROUTING_CACHE, compile_routing, normalize_routing
+
+class RoutedTask(AliceTask):
+    async def execute_plan(self, execution_history, node_responses, **kwargs):
+        pass
+
+    async def execute_code(self, execution_history, node_responses, **kwargs):
+        pass
+
+class TestCompiledRouting(unittest.TestCase):
+    def setUp(self):
+        ROUTING_CACHE.entries.clear()
+
+    def test_problems_are_detected_at_load(self):
+        routing = normalize_routing({
+            "plan": {"0": ["code", False], "1": ["plan", True]},
+            "code": {"0": [None, False], "2": ["review", False]},
+            "orphan": {"0": [None, False]},
+        })
+        compiled = compile_routing(routing, "plan", lambda node: node in ("plan", "code"))
+        self.assertEqual(compiled.issues, (
+            "Node orphan has no implementation",
+            "Node review has no implementation",
+            "Exit code 2 of node code routes to review, which has no routing rules",
+            "Node orphan is not reachable from plan",
+        ))
+        self.assertEqual(compiled.next_node("plan", 0), ("code", False))
+        self.assertEqual(compiled.next_node("plan", 5), (None, False))
+        self.assertIsNone(compiled.next_node("review", 0))
+        self.assertEqual(compiled.available_exit_code("code", 1), 0)
+        self.assertEqual(compiled.available_exit_code("code", 2), 2)
+
+    def test_stored_tasks_share_routing_by_version(self):
+        definition = {
+            "_id": "task_1",
+            "updatedAt": "2024-01-01T00:00:00Z",
+            "task_name": "Routed",
+            "task_description": "A routed task",
+            "start_node": "plan",
+            "node_end_code_routing": {"plan": {"0": ["code", False]}, "code": {"0": [None, False]}},
+        }
+        first = RoutedTask(**definition)
+        second = RoutedTask(**definition)
+        self.assertIs(first.routing_table, second.routing_table)
+        self.assertEqual(second.node_end_code_routing["plan"], {0: ("code", False)})
+        self.assertEqual(len(ROUTING_CACHE.entries), 1)
+
+    def test_reassigning_routing_recompiles(self):
+        task = RoutedTask(
+            task_name="Routed",
+            task_description="A routed task",
+            start_node="plan",
+            node_end_code_routing={"plan": {0: ("code", False)}, "code": {0: (None, False)}},
+        )
+        node = NodeResponse(node_name="plan", exit_code=0, execution_order=0)
+        self.assertEqual(task.get_next_node(node), ("code", False))
+        task.node_end_code_routing = {"plan": {0: (None, False)}}
+        self.assertEqual(task.get_next_node(node), (None, False))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import asyncio, unittest
+from workflow.core.data_structures import NodeResponse, FunctionParameters, ParameterDefinition
+from workflow.core.tasks import AliceTask
+from workflow.util import stream_events
+from workflow.api_app.util.utils import TaskBatchExecutionRequest
+from workflow.api_app.routes.task_batch_execute import execute_task_batch_endpoint
+
+BATCH_COUNTER = {"running": 0, "max_running": 0}
+
+class EchoTask(AliceTask):
+    async def execute_echo(self, execution_history, node_responses, **kwargs):
+        counter = BATCH_COUNTER
+        counter["running"] += 1
+        counter["max_running"] = max(counter["max_running"], counter["running"])
+        await asyncio.sleep(0.01)
+        counter["running"] -= 1
+        if kwargs["value"] == "fail":
+            raise ValueError("Boom")
+        return NodeResponse(parent_task_id=self.id, node_name="echo", exit_code=0, execution_order=len(execution_history))
+
+class FakeDBApp:
+    def __init__(self, task):
+        self.task = task
+        self.user_data = {"user_obj": {}}
+        self.responses = []
+
+    async def get_task(self, task_id):
+        return self.task
+
+    async def api_setter(self):
+        return None
+
+    async def create_entity_in_db(self, entity, data):
+        self.responses.append(data)
+        return {**data, "_id": f"response_{len(self.responses)}"}
+
+class TestTaskBatch(unittest.IsolatedAsyncioTestCase):
+    async def test_inputs_run_concurrently_within_the_limit(self):
+        task = EchoTask(
+            task_name="Echo",
+            task_description="Echoes its input",
+            start_node="echo",
+            input_variables=FunctionParameters(type="object", properties={"value": ParameterDefinition(type="string", description="Value")}, required=["value"]),
+            node_end_code_routing={"echo": {0: (None, False), 1: (None, True)}},
+            required_apis=[],
+        )
+        db_app = FakeDBApp(task)
+        events = []
+
+        async def handler(event):
+            events.append(event)
+
+        request = TaskBatchExecutionRequest(taskId="task_1", inputs=[{"value": str(i)} for i in range(5)] + [{"value": "fail"}], max_concurrency=2)
+        with stream_events(handler):
+            summary = await execute_task_batch_endpoint(request, db_app=db_app, queue_manager=None, enqueue=False)
+
+        self.assertEqual(BATCH_COUNTER["max_running"], 2)
+        self.assertEqual((summary["total"], summary["completed"], summary["failed"]), (6, 5, 1))
+        self.assertEqual(sorted(summary["task_response_ids"]), sorted(f"response_{i}" for i in range(1, 7)))
+        self.assertEqual(sorted(event["index"] for event in events), list(range(6)))
+        self.assertTrue(all(event["type"] == "batch_item_completed" for event in events))
+
+    async def test_setup_failure_fails_the_batch_once(self):
+        db_app = FakeDBApp(None)
+        request = TaskBatchExecutionRequest(taskId="missing", inputs=[{"value": str(i)} for i in range(3)])
+        with self.assertRaises(ValueError):
+            await execute_task_batch_endpoint(request, db_app=db_app, queue_manager=None, enqueue=False)
+        self.assertEqual(db_app.responses, [])
+
+    def test_max_concurrency_is_capped(self):
+        request = TaskBatchExecutionRequest(taskId="task_1", inputs=[], max_concurrency=10_000)
+        self.assertEqual(request.max_concurrency, 16)
+
+if __name__ == '__main__':
+    unittest.main()
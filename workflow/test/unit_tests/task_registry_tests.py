@@ -0,0 +1,53 @@
+import unittest
+from workflow.core.tasks import Workflow, TASK_TYPES, TASK_CACHE, create_task_from_json, task_version_key
+
+def definition(subtask_version="1"):
+    return {
+        "task_type": "Workflow",
+        "_id": "workflow_1",
+        "updatedAt": "1",
+        "task_name": "Outer",
+        "task_description": "Runs the inner workflow",
+        "tasks": {
+            "inner": {
+                "task_type": "Workflow",
+                "_id": "workflow_2",
+                "updatedAt": subtask_version,
+                "task_name": "Inner",
+                "task_description": "Does nothing",
+                "tasks": {},
+            }
+        },
+    }
+
+class TestTaskRegistry(unittest.TestCase):
+    def setUp(self):
+        TASK_CACHE.entries.clear()
+        TASK_CACHE.stats.update(hits=0, misses=0)
+
+    def test_registry_maps_task_types_to_classes(self):
+        self.assertIs(TASK_TYPES.get("Workflow"), Workflow)
+        self.assertIsNone(TASK_TYPES.get("Missing"))
+        with self.assertRaises(ValueError):
+            create_task_from_json({"task_type": "Missing", "task_name": "Task", "task_description": "Unknown"})
+
+    def test_stored_definitions_are_built_once(self):
+        first = create_task_from_json(definition())
+        second = create_task_from_json(definition())
+        self.assertEqual(TASK_CACHE.stats, {"hits": 1, "misses": 2})
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.tasks["inner"], second.tasks["inner"])
+        self.assertEqual(second.tasks["inner"].task_name, "Inner")
+
+        # Editing a subtask doesn't bump the parent's updatedAt, but still changes its key
+        create_task_from_json(definition(subtask_version="2"))
+        self.assertEqual(TASK_CACHE.stats["misses"], 4)
+
+    def test_unversioned_definitions_are_not_cached(self):
+        unversioned = definition()
+        del unversioned["tasks"]["inner"]["updatedAt"]
+        self.assertIsNone(task_version_key(unversioned))
+        self.assertEqual(task_version_key(definition()), ("Workflow", ("workflow_1", "1"), ("workflow_2", "1")))
+
+if __name__ == '__main__':
+    unittest.main()
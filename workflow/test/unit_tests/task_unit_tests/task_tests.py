@@ -1,7 +1,10 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 from workflow.core.api import APIManager, API, APIEngine
 from workflow.core import FunctionParameters, ParameterDefinition, AliceTask, TaskResponse, ApiType
+from workflow.core.data_structures import NodeResponse, UserCheckpoint
+from workflow.util import remaining_time, TIMEOUT_EXIT_CODE
 from pydantic import ValidationError
 
 class ConcreteAliceTask(AliceTask):
@@ -155,5 +158,95 @@ def test_invalid_task_creation():
             )
         )
 
+class ParallelAliceTask(AliceTask):
+    async def execute_fetch(self, execution_history, node_responses, **kwargs):
+        return self.node("fetch", 0, execution_history)
+
+    async def execute_slow(self, execution_history, node_responses, **kwargs):
+        self.started.append("slow")
+        await asyncio.sleep(0.02)
+        return self.node("slow", 0, execution_history)
+
+    async def execute_flaky(self, execution_history, node_responses, **kwargs):
+        self.started.append("flaky")
+        return self.node("flaky", 1 if self.started.count("flaky") == 1 else 0, execution_history)
+
+    async def execute_report(self, execution_history, node_responses, **kwargs):
+        return self.node("report", 0, execution_history)
+
+    def node(self, node_name, exit_code, execution_history):
+        return NodeResponse(parent_task_id=self.id, node_name=node_name, exit_code=exit_code, execution_order=len(execution_history))
+
+@pytest.fixture
+def parallel_task():
+    task = ParallelAliceTask(
+        task_name="ParallelTask",
+        task_description="A task with a parallel group",
+        input_variables=FunctionParameters(type="object", properties={}, required=[]),
+        start_node="fetch",
+        max_attempts=2,
+        parallel_nodes={"analyze": ["slow", "flaky"]},
+        node_end_code_routing={
+            "fetch": {0: ("analyze", False), 1: ("fetch", True)},
+            "slow": {0: (None, False), 1: ("slow", True)},
+            "flaky": {0: (None, False), 1: ("flaky", True)},
+            "analyze": {0: ("report", False), 1: (None, True)},
+            "report": {0: (None, False), 1: ("report", True)},
+        },
+    )
+    object.__setattr__(task, "started", [])
+    return task
+
+@pytest.mark.asyncio
+async def test_parallel_nodes_run_concurrently_in_declared_order(parallel_task):
+    result = await parallel_task.run()
+
+    # flaky finishes first but slow is declared first, and only flaky is retried
+    assert parallel_task.started == ["slow", "flaky", "flaky"]
+    history = [(node.node_name, node.exit_code, node.execution_order) for node in result.node_references]
+    assert history == [
+        ("fetch", 0, 0), ("slow", 0, 1), ("flaky", 1, 2), ("flaky", 0, 3), ("analyze", 0, 4), ("report", 0, 5)
+    ]
+    assert result.result_code == 0
+
+def test_parallel_nodes_cannot_pause_for_user_input():
+    with pytest.raises(ValidationError, match="cannot have user checkpoints"):
+        ParallelAliceTask(
+            task_name="ParallelTask",
+            task_description="A task with a parallel group",
+            parallel_nodes={"analyze": ["slow", "flaky"]},
+            user_checkpoints={"slow": UserCheckpoint(user_prompt="Continue?", task_next_obj={0: None, 1: None})},
+        )
+
+class TimedAliceTask(AliceTask):
+    async def execute_stuck(self, execution_history, node_responses, **kwargs):
+        await asyncio.sleep(10)
+        return NodeResponse(parent_task_id=self.id, node_name="stuck", exit_code=0, execution_order=len(execution_history))
+
+    async def execute_fallback(self, execution_history, node_responses, **kwargs):
+        object.__setattr__(self, "time_left", remaining_time())
+        return NodeResponse(parent_task_id=self.id, node_name="fallback", exit_code=0, execution_order=len(execution_history))
+
+@pytest.mark.asyncio
+async def test_timed_out_node_is_routed_on_timeout_exit_code():
+    task = TimedAliceTask(
+        task_name="TimedTask",
+        task_description="A task with a stuck node",
+        input_variables=FunctionParameters(type="object", properties={}, required=[]),
+        start_node="stuck",
+        task_timeout=5,
+        node_timeouts={"stuck": 0.05},
+        node_end_code_routing={
+            "stuck": {0: (None, False), TIMEOUT_EXIT_CODE: ("fallback", False)},
+            "fallback": {0: (None, False)},
+        },
+    )
+    result = await task.run()
+
+    assert [(node.node_name, node.exit_code) for node in result.node_references] == [("stuck", TIMEOUT_EXIT_CODE), ("fallback", 0)]
+    # The fallback only gets what is left of the task's budget
+    assert 4 < task.time_left < 5
+    assert remaining_time() is None
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
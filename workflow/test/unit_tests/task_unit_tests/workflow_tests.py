@@ -1,6 +1,8 @@
+import asyncio
 import pytest
 from unittest.mock import Mock
 from workflow.core import FunctionParameters, ParameterDefinition, APIManager, API, AliceTask, Workflow, TaskResponse, StringOutput
+from workflow.core.tasks.workflow import MapNodeConfig
 
 class MockTask(AliceTask):
     async def run(self, **kwargs):
@@ -222,5 +224,49 @@ async def test_workflow_exception_handling(sample_workflow):
     assert result.status == "failed"
     assert "ValueError: Test exception" in result.result_diagnostic
 
+class ScrapeMockTask(MockTask):
+    async def run(self, **kwargs):
+        url = kwargs["url"]
+        # State set while running, as tasks do, must not leak between elements
+        self.task_description = f"Scrapes {url}"
+        await asyncio.sleep(0.01 if url == "a" else 0)
+        if url == "bad" or self.task_description != f"Scrapes {url}":
+            raise ValueError("Unreachable")
+        return await super().run(**kwargs)
+
+@pytest.mark.asyncio
+async def test_map_node_keeps_element_order_and_reports_failures():
+    scrape = ScrapeMockTask(
+        task_name="Scrape_URL",
+        task_description="Scrapes a URL",
+        input_variables=FunctionParameters(
+            type="object",
+            properties={"url": ParameterDefinition(type="string", description="URL to scrape")},
+            required=["url"]
+        )
+    )
+    workflow = Workflow(
+        task_name="ScrapeAll",
+        task_description="Scrapes every URL",
+        tasks={"Scrape_URL": scrape},
+        start_node="Scrape_URL",
+        node_end_code_routing={"Scrape_URL": {0: (None, False), 1: (None, True)}},
+        map_nodes={"Scrape_URL": MapNodeConfig(input_variable="urls", item_variable="url", max_concurrency=2)},
+        input_variables=FunctionParameters(
+            type="object",
+            properties={"urls": ParameterDefinition(type="array", description="URLs to scrape")},
+            required=["urls"]
+        )
+    )
+
+    node_response = await workflow.execute_node("Scrape_URL", [], [], urls='["a", "bad", "c"]')
+
+    task_responses = node_response.references.task_responses
+    assert [response.task_inputs["url"] for response in task_responses] == ["a", "bad", "c"]
+    assert [response.status for response in task_responses] == ["complete", "failed", "complete"]
+    assert node_response.exit_code == 1
+    assert "1 of 3 elements" in node_response.references.messages[0].content
+    assert scrape.task_description == "Scrapes a URL"
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,52 @@
+import unittest
+from workflow.core.agent import AliceAgent
+from workflow.core.chat import AliceChat
+from workflow.core.data_structures import ChatThread, MessageDict, Prompt, RoleTypes
+
+class SummarizingAgent(AliceAgent):
+    async def summarize_messages(self, api_manager, messages, summary=None):
+        contents = ([summary] if summary else []) + [msg.content for msg in messages]
+        return ", ".join(contents)
+
+def thread(count):
+    return ChatThread(messages=[
+        MessageDict(role=RoleTypes.USER if i % 2 == 0 else RoleTypes.ASSISTANT, content=str(i)) for i in range(count)
+    ])
+
+class TestThreadSummary(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        agent = SummarizingAgent(name="Alice", system_message=Prompt(name="system", content="You are Alice"), summary_threshold=6, summary_window=2)
+        self.chat = AliceChat(alice_agent=agent, default_user_checkpoints={})
+
+    def test_messages_are_folded_past_the_threshold(self):
+        self.assertEqual(thread(6).messages_to_summarize(6, 2), [])
+        self.assertEqual([msg.content for msg in thread(7).messages_to_summarize(6, 2)], ["0", "1", "2", "3", "4"])
+        self.assertEqual(thread(20).messages_to_summarize(0, 2), [])
+
+        # A window of 3 would start with the results of the tool calls made in message 4
+        with_tools = thread(4)
+        with_tools.messages.extend([
+            MessageDict(role=RoleTypes.ASSISTANT, content="4"),
+            MessageDict(role=RoleTypes.TOOL, content="5"),
+            MessageDict(role=RoleTypes.TOOL, content="6"),
+            MessageDict(role=RoleTypes.ASSISTANT, content="7"),
+        ])
+        self.assertEqual([msg.content for msg in with_tools.messages_to_summarize(6, 3)], ["0", "1", "2", "3"])
+
+    async def test_turns_send_the_summary_and_the_recent_window(self):
+        chat_thread = thread(7)
+        self.assertTrue(await self.chat.update_thread_summary(None, chat_thread))
+        self.assertEqual((chat_thread.summary, chat_thread.summarized_messages), ("0, 1, 2, 3, 4", 5))
+        self.assertFalse(await self.chat.update_thread_summary(None, chat_thread))
+
+        chat_thread.messages.extend(thread(12).messages[7:])
+        self.assertTrue(await self.chat.update_thread_summary(None, chat_thread))
+        self.assertEqual((chat_thread.summary, chat_thread.summarized_messages), ("0, 1, 2, 3, 4, 5, 6, 7, 8, 9", 10))
+
+        self.chat.load_thread(chat_thread)
+        self.assertEqual([msg.content for msg in self.chat.messages], ["10", "11"])
+        system_message = self.chat.alice_agent._prepare_system_message(conversation_summary=chat_thread.summary)
+        self.assertEqual(system_message, "You are Alice\n\nSummary of the earlier conversation:\n0, 1, 2, 3, 4, 5, 6, 7, 8, 9")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+from workflow.db_app.app.token_cache import TokenValidationCache
+from workflow.db_app.app.db import BackendAPI
+
+class FakeResponse:
+    def __init__(self, status, body):
+        self.status, self.body = status, body
+
+    async def json(self, content_type="application/json"):
+        return json.loads(self.body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, **kwargs):
+        return self.response
+
+class TestTokenValidationCache(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_validations_share_one_backend_call(self):
+        cache = TokenValidationCache(ttl=60, negative_ttl=10, max_size=10)
+        calls = []
+
+        async def validate(token):
+            calls.append(token)
+            await asyncio.sleep(0.01)
+            return {"valid": True, "user": {"_id": "user_1"}}, True
+
+        results = await asyncio.gather(*[cache.get_or_validate("token", validate) for _ in range(5)])
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result["valid"] for result in results))
+
+        await cache.get_or_validate("token", validate)
+        self.assertEqual(len(calls), 1)
+
+    async def test_rejections_are_cached_but_transient_errors_are_not(self):
+        cache = TokenValidationCache(ttl=60, negative_ttl=10, max_size=10)
+
+        async def reject(token):
+            return {"valid": False, "message": "Invalid token"}, True
+
+        async def unreachable(token):
+            return {"valid": False, "message": "Connection refused"}, False
+
+        await cache.get_or_validate("bad", reject)
+        self.assertEqual(cache.get("bad")["message"], "Invalid token")
+
+        await cache.get_or_validate("other", unreachable)
+        self.assertIsNone(cache.get("other"))
+
+    def test_size_bound_and_expiry(self):
+        cache = TokenValidationCache(ttl=60, negative_ttl=0, max_size=2)
+        cache.set("a", {"valid": True})
+        cache.set("b", {"valid": True})
+        cache.get("a")
+        cache.set("c", {"valid": True})
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+        cache.set("d", {"valid": False})
+        self.assertIsNone(cache.get("d"))
+
+    async def test_rejections_are_decided_by_status_code(self):
+        api = BackendAPI()
+        for status, body, message in (
+            (401, '{"message": "Expired"}', "Expired"),
+            (401, '["not", "an", "object"]', "Invalid token"),
+            (403, "<html>Forbidden</html>", "Invalid token"),
+        ):
+            async def get_session(self, response=FakeResponse(status, body)):
+                return FakeSession(response)
+
+            with patch.object(BackendAPI, "get_session", get_session):
+                result, cacheable = await api._request_token_validation("token")
+            self.assertEqual((result, cacheable), ({"valid": False, "message": message}, True))
+
+if __name__ == '__main__':
+    unittest.main()
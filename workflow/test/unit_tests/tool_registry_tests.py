@@ -0,0 +1,51 @@
+import copy, unittest
+from workflow.core.data_structures import FunctionParameters, ParameterDefinition
+from workflow.core.tasks import AliceTask, ToolRegistry
+
+def tool(name):
+    return AliceTask(
+        _id=f"{name}_id",
+        updatedAt="1",
+        task_name=name,
+        task_description=f"Runs {name}",
+        input_variables=FunctionParameters(
+            properties={"query": ParameterDefinition(type="string", description="Query"), "limit": ParameterDefinition(type="integer", description="Limit")},
+            required=["query"],
+        ),
+    )
+
+class TestToolRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tools = [tool("search"), tool("scrape")]
+        self.registry = ToolRegistry.build(self.tools)
+
+    def test_schemas_and_validators_are_compiled_once(self):
+        search = self.registry.get("search")
+        self.assertIs(search.get_dict(), search.get_dict())
+        self.assertEqual(search.convert_to_tool_params()["input_schema"]["required"], ["query"])
+        self.assertEqual(search.get_gemini_declaration()["name"], "search")
+        parameters = search.function.parameters
+        self.assertEqual(parameters.validate_arguments({"query": "cats", "limit": "3"}), (True, None))
+        self.assertEqual(parameters.validate_arguments({"limit": 3}), (False, "Missing required parameter: query"))
+        self.assertEqual(parameters.validate_arguments({"query": "cats", "page": 2}), (False, "Unexpected parameter: page"))
+        self.assertFalse(parameters.validate_arguments({"query": "cats", "limit": "many"})[0])
+
+    def test_tool_map_follows_the_api_manager(self):
+        first = self.registry.tool_map(None)
+        self.assertEqual(list(first), ["search", "scrape"])
+        self.assertIs(self.registry.tool_map(None), first)
+        self.assertIsNot(self.registry.tool_map(object()), first)
+
+    def test_copies_share_compiled_tools_and_edits_rebuild(self):
+        tools = copy.deepcopy(self.tools)
+        registry = copy.deepcopy(self.registry)
+        self.assertTrue(registry.matches(tools))
+        registry.bind(tools)
+        self.assertIs(registry.get("search"), self.registry.get("search"))
+        self.assertEqual(list(registry.tool_map(None)), ["search", "scrape"])
+
+        tools[0].updatedAt = "2"
+        self.assertFalse(registry.matches(tools))
+
+if __name__ == '__main__':
+    unittest.main()
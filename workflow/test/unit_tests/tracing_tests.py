@@ -0,0 +1,56 @@
+import json, os, tempfile, unittest
+from workflow.core.data_structures import NodeResponse, References, MessageDict, FunctionParameters
+from workflow.core.tasks import AliceTask
+from workflow.util import tracing, span
+
+class GenerateTask(AliceTask):
+    async def execute_generate(self, execution_history, node_responses, **kwargs):
+        with span("LLMEngine", "engine"):
+            pass
+        message = MessageDict(
+            role="assistant",
+            content="Hello",
+            creation_metadata={"usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}, "cost": {"total_cost": 0.5}},
+        )
+        return NodeResponse(parent_task_id=self.id, node_name="generate", exit_code=0, references=References(messages=[message]), execution_order=len(execution_history))
+
+    async def execute_broken(self, execution_history, node_responses, **kwargs):
+        raise ValueError("Boom")
+
+class TestTracing(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.task = GenerateTask(
+            task_name="Generate",
+            task_description="Generates a message",
+            start_node="generate",
+            input_variables=FunctionParameters(type="object", properties={}, required=[]),
+            node_end_code_routing={"generate": {0: ("broken", False)}, "broken": {0: (None, False), 1: (None, False)}},
+        )
+
+    async def test_spans_nest_and_carry_usage(self):
+        with tempfile.TemporaryDirectory() as directory:
+            async with tracing("generate", enabled=True, export_dir=directory) as trace:
+                await self.task.run()
+            exported = [json.load(open(os.path.join(directory, name))) for name in os.listdir(directory)]
+
+        spans = {item.name: item for item in trace.spans}
+        self.assertEqual([item.name for item in trace.spans], ["LLMEngine", "generate", "broken", "Generate"])
+        self.assertIsNone(spans["Generate"].parent_id)
+        self.assertEqual(spans["generate"].parent_id, spans["Generate"].span_id)
+        self.assertEqual(spans["LLMEngine"].parent_id, spans["generate"].span_id)
+        self.assertEqual((spans["generate"].attributes["total_tokens"], spans["generate"].attributes["total_cost"]), (15, 0.5))
+        self.assertEqual((spans["broken"].status, spans["broken"].error), ("error", "ValueError: Boom"))
+        self.assertTrue(all(item.duration >= 0 for item in trace.spans))
+
+        otlp_spans = exported[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual(len(otlp_spans), 4)
+        self.assertEqual({item["traceId"] for item in otlp_spans}, {trace.trace_id})
+
+    async def test_disabled_tracing_records_nothing(self):
+        async with tracing("generate", enabled=False) as trace:
+            with span("LLMEngine", "engine") as engine_span:
+                self.assertIsNone(engine_span)
+        self.assertIsNone(trace)
+
+if __name__ == '__main__':
+    unittest.main()
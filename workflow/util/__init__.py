@@ -2,15 +2,21 @@ from .logger import LOGGER, LOG_LEVEL
 from .const import BACKEND_PORT, FRONTEND_PORT, WORKFLOW_PORT, HOST, CHAR_TO_TOKEN
 from .text_splitters import SemanticTextSplitter, TextSplitter, EmbeddingGenerator, SplitterType, LengthType, est_token_count, est_messages_token_count
 from .message_prune import MessagePruner, MessageScore, MessageStats, MessageApiFormat, RoleTypes, ReplacementStrategy, ScoreConfig
-from .type_utils import resolve_json_type, convert_value_to_type, json_to_python_type_mapping
+from .type_utils import resolve_json_type, convert_value_to_type, compile_type_converter, json_to_python_type_mapping
 from .utils import (
     check_cuda_availability, cosine_similarity, 
     get_traceback, sanitize_string, sanitize_and_limit_string
     )
+from .tracing import Span, Trace, tracing, span
+from .deadline import deadline_scope, remaining_time, request_timeout, TIMEOUT_EXIT_CODE
 from .code_utils import DockerCodeRunner, Language, get_language_matching, get_separators_for_language
+from .event_stream import stream_events, emit_event, streaming_enabled
+from .blob_store import BlobHandle, BlobStore, BLOB_STORE
 
 __all__ = ['BACKEND_PORT', 'FRONTEND_PORT',  'LOGGER', 'WORKFLOW_PORT', 'HOST', 'LOG_LEVEL', 'est_token_count', 'LengthType', 'json_to_python_type_mapping', 
-           'est_messages_token_count', 'RecursiveTextSplitter', 'Language', 'cosine_similarity', 'convert_value_to_type', 'CHAR_TO_TOKEN',
+           'est_messages_token_count', 'RecursiveTextSplitter', 'Language', 'cosine_similarity', 'convert_value_to_type', 'compile_type_converter', 'CHAR_TO_TOKEN',
            'get_traceback', 'sanitize_string', 'sanitize_and_limit_string', 'check_cuda_availability', 'get_language_matching', 'get_separators_for_language',
            'resolve_json_type', 'TextSplitter', 'EmbeddingGenerator', 'SplitterType', 'RecursiveTextSplitter', 'SemanticTextSplitter', 
-           'MessagePruner', 'MessageScore', 'MessageStats', 'MessageApiFormat', 'RoleTypes', 'ReplacementStrategy', 'ScoreConfig', 'DockerCodeRunner']
\ No newline at end of file
+           'MessagePruner', 'MessageScore', 'MessageStats', 'MessageApiFormat', 'RoleTypes', 'ReplacementStrategy', 'ScoreConfig', 'DockerCodeRunner',
+           'stream_events', 'emit_event', 'streaming_enabled', 'deadline_scope', 'remaining_time', 'request_timeout', 'TIMEOUT_EXIT_CODE',
+           'Span', 'Trace', 'tracing', 'span', 'BlobHandle', 'BlobStore', 'BLOB_STORE']
\ No newline at end of file
@@ -0,0 +1,113 @@
+import asyncio, hashlib, json, os, time
+from typing import Any, Optional
+from pydantic import BaseModel, Field
+from .const import SHARED_UPLOAD_DIR
+from .logger import LOGGER
+
+class BlobHandle(BaseModel):
+    """Lightweight stand-in for a payload kept in the blob store."""
+    blob_id: str = Field(..., description="SHA-256 of the stored content")
+    size: int = Field(..., description="Size of the stored content in bytes")
+    count: int = Field(0, description="Number of items in the payload")
+    summary: str = Field("", description="Short description of the payload, readable without loading it")
+
+class BlobStore(BaseModel):
+    """
+    Content-addressed store of large payloads, kept as files on the volume shared by the
+    workflow containers.
+
+    Blobs are named after the SHA-256 of their content, so storing the same payload twice
+    writes it once, and blobs are never modified once written. Payloads of at least
+    `min_size` bytes are worth offloading; 0 disables offloading.
+
+    Storing or reading a blob refreshes its modification time, and `collect_garbage` deletes
+    the blobs left untouched for `retention_days`, so responses older than that lose their
+    offloaded outputs.
+    """
+    directory: str = Field(os.getenv("BLOB_STORE_DIR", os.path.join(SHARED_UPLOAD_DIR, "blobs")), description="Directory of the blobs")
+    min_size: int = Field(int(os.getenv("BLOB_OFFLOAD_MIN_SIZE", "262144")), description="Payload size in bytes from which it is offloaded, 0 to disable")
+    retention_days: float = Field(float(os.getenv("BLOB_RETENTION_DAYS", "30")), description="Days a blob is kept after it was last stored or read, 0 to keep blobs forever")
+    gc_interval: float = Field(float(os.getenv("BLOB_GC_INTERVAL", "3600")), description="Seconds between garbage collections")
+
+    @property
+    def enabled(self) -> bool:
+        return self.min_size > 0 and bool(self.directory)
+
+    def _path(self, blob_id: str) -> str:
+        return os.path.join(self.directory, blob_id[:2], blob_id)
+
+    def put(self, data: bytes) -> str:
+        """Stores the content, returning its blob id."""
+        blob_id = hashlib.sha256(data).hexdigest()
+        path = self._path(blob_id)
+        try:
+            # Stored again, so its retention starts over
+            os.utime(path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Written aside and renamed, so readers never see a partial blob
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        return blob_id
+
+    def get(self, blob_id: str) -> bytes:
+        path = self._path(blob_id)
+        with open(path, "rb") as file:
+            data = file.read()
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put_json(self, value: Any) -> Optional[BlobHandle]:
+        """
+        Stores the JSON of `value` if it reaches `min_size`, returning its handle. Returns None
+        if it is smaller, offloading is disabled or the blob can't be written.
+        """
+        if not self.enabled:
+            return None
+        data = json.dumps(value, default=str).encode()
+        if len(data) < self.min_size:
+            return None
+        try:
+            return BlobHandle(blob_id=self.put(data), size=len(data))
+        except OSError as e:
+            LOGGER.error(f"Error writing blob to {self.directory}: {e}")
+            return None
+
+    def get_json(self, blob_id: str) -> Any:
+        return json.loads(self.get(blob_id))
+
+    def collect_garbage(self) -> int:
+        """Deletes the blobs not stored or read for `retention_days`, returning how many were deleted."""
+        if self.retention_days <= 0 or not os.path.isdir(self.directory):
+            return 0
+        cutoff = time.time() - self.retention_days * 86400
+        removed = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    # Deleted by another replica sharing the volume
+                    continue
+        return removed
+
+    async def collect_periodically(self):
+        """Runs `collect_garbage` every `gc_interval` seconds until cancelled."""
+        while True:
+            try:
+                removed = await asyncio.to_thread(self.collect_garbage)
+                if removed:
+                    LOGGER.info(f"Deleted {removed} expired blobs from {self.directory}")
+            except Exception as e:
+                LOGGER.error(f"Error collecting blobs in {self.directory}: {e}")
+            await asyncio.sleep(self.gc_interval)
+
+BLOB_STORE = BlobStore()
@@ -8,6 +8,8 @@ from docker.errors import DockerException, ContainerError, APIError
 from requests.exceptions import ReadTimeout, ConnectionError
 from urllib3.exceptions import ReadTimeoutError
 from workflow.util import LOGGER
+from workflow.util.deadline import remaining_time, request_timeout
+from workflow.util.tracing import span
 
 class DockerCodeRunner(BaseModel):
     """
@@ -59,6 +61,9 @@ class DockerCodeRunner(BaseModel):
             
         Returns:
             Tuple containing (execution logs, exit code)
+
+        The execution timeout is shortened to the time left before the deadline of the running
+        task, if any, and no further attempts are made once that deadline has passed.
             
         Raises:
             ValueError: If language is not supported
@@ -74,59 +79,68 @@ class DockerCodeRunner(BaseModel):
         errors: List[str] = []
 
         for attempt in range(self.retries):
+            if attempt and remaining_time() == 0:
+                LOGGER.warning("Deadline reached, not retrying code execution")
+                break
+            timeout = request_timeout(self.timeout)
             LOGGER.debug(f"Attempt {attempt + 1}...")
-            try:
-                command = self._get_command(code_b64, language, setup_b64)
+            with span(f"docker {language}", "docker", language=language, image=image, attempt=attempt + 1) as docker_span:
+                try:
+                    command = self._get_command(code_b64, language, setup_b64)
                 
-                container = client.containers.run(
-                    image,
-                    command,
-                    detach=True,
-                    stdout=True,
-                    stderr=True,
-                    network_disabled=False,
-                    mem_limit='512m',
-                    cpu_quota=50000
-                )
+                    container = client.containers.run(
+                        image,
+                        command,
+                        detach=True,
+                        stdout=True,
+                        stderr=True,
+                        network_disabled=False,
+                        mem_limit='512m',
+                        cpu_quota=50000
+                    )
 
-                try:
-                    log_collector = ContainerLogCollector(container)
-                    log_collector.start()
+                    try:
+                        log_collector = ContainerLogCollector(container)
+                        log_collector.start()
                     
-                    exit_status = container.wait(timeout=self.timeout)
-                    logs = log_collector.get_logs()
+                        exit_status = container.wait(timeout=timeout)
+                        logs = log_collector.get_logs()
                     
-                    # Check collector status
-                    if log_collector.collection_error:
-                        LOGGER.warning(f"Note: Log collection encountered an error: {log_collector.collection_error}")
+                        # Check collector status
+                        if log_collector.collection_error:
+                            LOGGER.warning(f"Note: Log collection encountered an error: {log_collector.collection_error}")
                         
-                    LOGGER.debug(f"Exit status: {exit_status['StatusCode']} - Execution logs: {logs}")
-                    return logs, exit_status['StatusCode']
+                        LOGGER.debug(f"Exit status: {exit_status['StatusCode']} - Execution logs: {logs}")
+                        if docker_span:
+                            docker_span.set_attributes(exit_code=exit_status['StatusCode'])
+                        return logs, exit_status['StatusCode']
                     
-                except (ReadTimeout, ReadTimeoutError, ConnectionError) as e:
-                    try:
-                        logs = log_collector.get_logs()
-                        # Check collector status in timeout case
-                        if log_collector.collection_error:
-                            LOGGER.warning(f"Log collection failed during timeout: {log_collector.collection_error}")
+                    except (ReadTimeout, ReadTimeoutError, ConnectionError) as e:
+                        try:
+                            logs = log_collector.get_logs()
+                            # Check collector status in timeout case
+                            if log_collector.collection_error:
+                                LOGGER.warning(f"Log collection failed during timeout: {log_collector.collection_error}")
                             
-                        LOGGER.warning(f"Timeout reached. Partial logs: {logs}")
-                        container.kill()
-                    except Exception as e:
-                        LOGGER.warning(f"Error killing container in timeout handler: {e}")
-                    raise TimeoutError(f"Timeout: Execution exceeded {self.timeout} seconds. Partial logs: {logs}")
-                finally:
-                    try:
-                        if log_collector.is_running:
-                            time.sleep(0.1)  # Give collector a chance to get final logs
-                        container.remove()
-                    except Exception as e:
-                        LOGGER.warning(f"Error while removing container: {e}")
+                            LOGGER.warning(f"Timeout reached. Partial logs: {logs}")
+                            container.kill()
+                        except Exception as e:
+                            LOGGER.warning(f"Error killing container in timeout handler: {e}")
+                        raise TimeoutError(f"Timeout: Execution exceeded {timeout:.0f} seconds. Partial logs: {logs}")
+                    finally:
+                        try:
+                            if log_collector.is_running:
+                                time.sleep(0.1)  # Give collector a chance to get final logs
+                            container.remove()
+                        except Exception as e:
+                            LOGGER.warning(f"Error while removing container: {e}")
 
-            except (ContainerError, DockerException, APIError, TimeoutError) as e:
-                LOGGER.warning(f"Attempt {attempt + 1} failed: {str(e)}")
-                errors.append(str(e))
-                continue
+                except (ContainerError, DockerException, APIError, TimeoutError) as e:
+                    LOGGER.warning(f"Attempt {attempt + 1} failed: {str(e)}")
+                    errors.append(str(e))
+                    if docker_span:
+                        docker_span.status, docker_span.error = "error", str(e)
+                    continue
         return "{} attempts failed: {}".format(attempt + 1, '\n'.join(errors)), 1    
     
 class ContainerLogCollector:
@@ -0,0 +1,48 @@
+import os, time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Exit code of nodes that ran out of time, the one used by coreutils `timeout`
+TIMEOUT_EXIT_CODE = 124
+# Timeout of SDK and HTTP requests made without a deadline, the default of the OpenAI and Anthropic clients
+DEFAULT_REQUEST_TIMEOUT = float(os.getenv("API_REQUEST_TIMEOUT", "600"))
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Limits the work done within the block to `timeout` seconds from now.
+
+    The deadline is stored in a context variable, so it follows the execution through awaited
+    coroutines and child tasks. Scopes nest: an inner scope can only shorten the deadline of
+    the outer one, never extend it. A None timeout keeps the current deadline. Yields the
+    remaining time, None if there is no deadline.
+    """
+    current = _deadline.get()
+    deadline = current
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+        if current is not None:
+            deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield remaining_time()
+    finally:
+        _deadline.reset(token)
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline (0 once it passed), None if there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+def request_timeout(default: float = DEFAULT_REQUEST_TIMEOUT) -> float:
+    """Timeout to give an SDK client or HTTP request: `default`, shortened to the time left."""
+    remaining = remaining_time()
+    if remaining is None:
+        return default
+    # SDKs treat 0 as "no timeout" or reject it, so an expired deadline fails fast instead
+    return max(min(default, remaining), 0.001)
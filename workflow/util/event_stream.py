@@ -0,0 +1,44 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+from .logger import LOGGER
+from .utils import get_traceback
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+_event_handler: ContextVar[Optional[EventHandler]] = ContextVar("event_handler", default=None)
+
+@contextmanager
+def stream_events(handler: Optional[EventHandler]) -> Iterator[None]:
+    """
+    Routes the incremental events emitted while the block runs to `handler`.
+
+    The handler is stored in a context variable, so it follows the request through
+    awaited coroutines and child tasks without being threaded through every signature.
+    Passing None mutes emitters for the duration of the block (e.g. nested LLM calls
+    made by a tool while the outer chat is streaming).
+    """
+    token = _event_handler.set(handler)
+    try:
+        yield
+    finally:
+        _event_handler.reset(token)
+
+def streaming_enabled() -> bool:
+    """Whether anyone is listening to events emitted from the current context."""
+    return _event_handler.get() is not None
+
+async def emit_event(event_type: str, **data: Any) -> None:
+    """
+    Sends an event to the current handler, if any. Errors raised by the handler are
+    logged and swallowed: a dropped event must never fail the generation producing it.
+    """
+    handler = _event_handler.get()
+    if handler is None:
+        return
+    event = {"type": event_type, "timestamp": time.time(), **data}
+    try:
+        await handler(event)
+    except Exception as e:
+        LOGGER.error(f"Error emitting {event_type} event: {e}\n{get_traceback()}")
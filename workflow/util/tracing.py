@@ -0,0 +1,177 @@
+import asyncio, json, os, re, secrets, time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional
+from pydantic import BaseModel, Field
+from .logger import LOGGER
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+# Traces are written here as OTLP/JSON files when set
+TRACE_EXPORT_DIR = os.getenv("TRACE_EXPORT_DIR", "")
+
+class Span(BaseModel):
+    """A timed operation: a task run, a node, an API engine call, a tool call or a code execution."""
+    name: str
+    kind: str = Field(..., description="task, node, engine, tool or docker")
+    trace_id: str
+    span_id: str = Field(default_factory=lambda: secrets.token_hex(8))
+    parent_id: Optional[str] = None
+    start_time: float = Field(default_factory=time.time)
+    end_time: Optional[float] = None
+    attributes: Dict[str, Any] = Field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        return self.end_time - self.start_time if self.end_time is not None else None
+
+    def set_attributes(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    def add_usage(self, metadata: Optional[Mapping[str, Any]]):
+        """Adds the token usage and cost of a MetadataDict to the span's totals."""
+        if not metadata:
+            return
+        for key, value in (metadata.get("usage") or {}).items():
+            if isinstance(value, (int, float)):
+                self.attributes[key] = self.attributes.get(key, 0) + value
+        total_cost = (metadata.get("cost") or {}).get("total_cost")
+        if isinstance(total_cost, (int, float)):
+            self.attributes["total_cost"] = self.attributes.get("total_cost", 0) + total_cost
+
+    def add_references_usage(self, references: Any):
+        """Adds the usage recorded on the messages and embeddings of a References object."""
+        if references is None:
+            return
+        for item in (references.messages or []) + (references.embeddings or []):
+            self.add_usage(item.creation_metadata)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "duration": self.duration,
+            "status": self.status,
+            **{key: value for key, value in self.attributes.items() if key in ("total_tokens", "total_cost")},
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        def otlp_value(value: Any) -> Dict[str, Any]:
+            if isinstance(value, bool):
+                return {"boolValue": value}
+            if isinstance(value, int):
+                return {"intValue": str(value)}
+            if isinstance(value, float):
+                return {"doubleValue": value}
+            return {"stringValue": str(value)}
+
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(int(self.start_time * 1e9)),
+            "endTimeUnixNano": str(int((self.end_time or self.start_time) * 1e9)),
+            "attributes": [
+                {"key": key, "value": otlp_value(value)}
+                for key, value in {"alice.kind": self.kind, **self.attributes}.items() if value is not None
+            ],
+            "status": {"code": 2, "message": self.error or ""} if self.status == "error" else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+class Trace(BaseModel):
+    """Spans recorded within a `tracing` block, in the order they ended."""
+    name: str
+    trace_id: str = Field(default_factory=lambda: secrets.token_hex(16))
+    spans: List[Span] = Field(default_factory=list)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        return [span.summary() for span in self.spans]
+
+    def to_otlp(self) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "workflow"}}]},
+                "scopeSpans": [{"scope": {"name": "workflow"}, "spans": [span.to_otlp() for span in self.spans]}],
+            }]
+        }
+
+    async def export(self, directory: str) -> str:
+        """Writes the trace as an OTLP/JSON file, readable by OpenTelemetry collectors and viewers."""
+        name = re.sub(r"[^\w.-]", "_", self.name)
+        path = os.path.join(directory, f"{int(time.time())}_{name}_{self.trace_id}.json")
+        await asyncio.to_thread(self._write, directory, path, self.to_otlp())
+        return path
+
+    @staticmethod
+    def _write(directory: str, path: str, otlp: Dict[str, Any]):
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(otlp, file)
+
+_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+@asynccontextmanager
+async def tracing(name: str, enabled: Optional[bool] = None, export_dir: Optional[str] = None) -> AsyncIterator[Optional[Trace]]:
+    """
+    Records the spans opened within the block into a new trace, yielded to the caller.
+
+    Tracing is off unless enabled (by default with TRACING_ENABLED), in which case it yields
+    None and spans cost nothing. When the block ends the trace is exported to `export_dir`
+    (TRACE_EXPORT_DIR by default) if set, in a worker thread; export errors are logged, never raised.
+    """
+    if not (TRACING_ENABLED if enabled is None else enabled):
+        yield None
+        return
+    trace = Trace(name=name)
+    trace_token = _trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        yield trace
+    finally:
+        _current_span.reset(span_token)
+        _trace.reset(trace_token)
+        export_dir = TRACE_EXPORT_DIR if export_dir is None else export_dir
+        if export_dir:
+            try:
+                LOGGER.debug(f"Exported trace {name} to {await trace.export(export_dir)}")
+            except Exception as e:
+                LOGGER.error(f"Error exporting trace {name}: {e}")
+
+@contextmanager
+def span(name: str, kind: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Times the block as a child of the current span. Yields the span so the block can add
+    attributes or usage, or None outside of a trace. Exceptions mark the span as failed
+    and propagate.
+    """
+    trace = _trace.get()
+    if trace is None:
+        yield None
+        return
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        kind=kind,
+        trace_id=trace.trace_id,
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end_time = time.time()
+        trace.spans.append(current)
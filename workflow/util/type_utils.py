@@ -1,7 +1,8 @@
 import json, re
 from datetime import datetime, date, time
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Type, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Type, Tuple
 from uuid import UUID
 from workflow.util.logger import LOGGER 
 
@@ -139,122 +140,140 @@ def convert_value_to_type(value: Any, param_name: str, param_type: str, format:
     Raises:
         ValueError: If conversion fails
     """
-    try:
-        # Handle null/None values
-        if value is None:
-            return None
-
-        # Construct type key
-        type_key = param_type.lower()
-        if format:
-            type_key = f"{type_key}:{format.lower()}"
-            
-        # String conversions
-        if type_key.startswith("string"):
-            if format == "date":
-                if isinstance(value, str):
-                    return date.fromisoformat(value)
-                elif isinstance(value, datetime):
-                    return value.date()
-                elif isinstance(value, date):
-                    return value
-                
-            elif format == "date-time":
-                if isinstance(value, str):
-                    return datetime.fromisoformat(value.replace('Z', '+00:00'))
-                elif isinstance(value, datetime):
-                    return value
-                    
-            elif format == "time":
-                if isinstance(value, str):
-                    return time.fromisoformat(value)
-                elif isinstance(value, time):
-                    return value
-                    
-            elif format == "uuid":
-                if isinstance(value, str):
-                    return UUID(value)
-                elif isinstance(value, UUID):
-                    return value
-                    
-            elif format == "email":
-                email_str = str(value)
-                # Basic email validation
-                if not re.match(r"[^@]+@[^@]+\.[^@]+", email_str):
-                    raise ValueError(f"Invalid email format: {email_str}")
-                return email_str
-                
-            elif format == "uri" or format == "uri-reference":
-                return str(value)  # Could add URI validation if needed
-                
-            elif format == "ipv4":
-                ip_str = str(value)
-                # Basic IPv4 validation
-                if not re.match(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", ip_str):
-                    raise ValueError(f"Invalid IPv4 format: {ip_str}")
-                return ip_str
-                
-            elif format == "binary":
-                if isinstance(value, bytes):
-                    return value
-                elif isinstance(value, str):
-                    return value.encode()
-                    
-            return str(value)
-
-        # Number conversions
-        elif type_key.startswith("number"):
-            if format == "decimal":
-                return Decimal(str(value))
-            return float(value)
+    return compile_type_converter(param_type, format)(value, param_name)
 
-        # Integer conversions
-        elif type_key.startswith("integer"):
-            if isinstance(value, str):
-                # Handle string numbers with decimals
-                return int(float(value))
-            return int(value)
+@lru_cache(maxsize=256)
+def compile_type_converter(param_type: str, format: Optional[str] = None) -> Callable[[Any, str], Any]:
+    """
+    Returns a function `(value, param_name)` converting values as `convert_value_to_type` does.
+    The conversion for the type and format is picked once and the function is cached, so
+    parameters converted on every node only pay for the conversion itself.
+    """
+    # Construct type key
+    type_key = param_type.lower()
+    if format:
+        type_key = f"{type_key}:{format.lower()}"
 
-        # Boolean conversions
-        elif type_key == "boolean":
-            if isinstance(value, str):
-                return value.lower() in ("true", "1", "yes", "y", "on", "t")
-            return bool(value)
+    if type_key.startswith("string"):
+        convert = _convert_string
+    elif type_key.startswith("number"):
+        convert = _convert_number
+    elif type_key.startswith("integer"):
+        convert = _convert_integer
+    elif type_key == "boolean":
+        convert = _convert_boolean
+    elif type_key.startswith("array"):
+        convert = _convert_array
+    elif type_key.startswith("object"):
+        convert = _convert_object
+    else:
+        # If no specific conversion needed, return as is
+        convert = None
+    type_desc = f"{param_type}" + (f" with format {format}" if format else "")
 
-        # Array conversions
-        elif type_key.startswith("array"):
-            # Handle string JSON arrays
-            if isinstance(value, str):
-                value = json.loads(value)
-                
-            # Convert to list if it's a tuple or other sequence
-            if not isinstance(value, list):
-                value = list(value)
-                
-            # If format specifies element type, convert all elements
-            if format:
-                return [convert_value_to_type(item, f"{param_name}[{i}]", format) 
-                       for i, item in enumerate(value)]
+    def converter(value: Any, param_name: str) -> Any:
+        # Handle null/None values
+        if value is None or convert is None:
             return value
+        try:
+            return convert(value, param_name, format)
+        except Exception as e:
+            raise ValueError(f"Failed to convert {param_name} to {type_desc}: {str(e)}")
+    return converter
 
-        # Object conversions
-        elif type_key.startswith("object"):
-            # Handle string JSON objects
-            if isinstance(value, str):
-                value = json.loads(value)
-                
-            if not isinstance(value, dict):
-                raise ValueError(f"Cannot convert {type(value)} to object")
-                
-            # If format specifies value type, convert all values
-            if format:
-                return {k: convert_value_to_type(v, f"{param_name}.{k}", format) 
-                       for k, v in value.items()}
+def _convert_string(value: Any, param_name: str, format: Optional[str]) -> Any:
+    if format == "date":
+        if isinstance(value, str):
+            return date.fromisoformat(value)
+        elif isinstance(value, datetime):
+            return value.date()
+        elif isinstance(value, date):
+            return value
+        
+    elif format == "date-time":
+        if isinstance(value, str):
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        elif isinstance(value, datetime):
+            return value
+            
+    elif format == "time":
+        if isinstance(value, str):
+            return time.fromisoformat(value)
+        elif isinstance(value, time):
+            return value
+            
+    elif format == "uuid":
+        if isinstance(value, str):
+            return UUID(value)
+        elif isinstance(value, UUID):
             return value
+            
+    elif format == "email":
+        email_str = str(value)
+        # Basic email validation
+        if not re.match(r"[^@]+@[^@]+\.[^@]+", email_str):
+            raise ValueError(f"Invalid email format: {email_str}")
+        return email_str
+        
+    elif format == "uri" or format == "uri-reference":
+        return str(value)  # Could add URI validation if needed
+        
+    elif format == "ipv4":
+        ip_str = str(value)
+        # Basic IPv4 validation
+        if not re.match(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", ip_str):
+            raise ValueError(f"Invalid IPv4 format: {ip_str}")
+        return ip_str
+        
+    elif format == "binary":
+        if isinstance(value, bytes):
+            return value
+        elif isinstance(value, str):
+            return value.encode()
+            
+    return str(value)
 
-        # If no specific conversion needed, return as is
-        return value
+def _convert_number(value: Any, param_name: str, format: Optional[str]) -> Any:
+    if format == "decimal":
+        return Decimal(str(value))
+    return float(value)
+
+def _convert_integer(value: Any, param_name: str, format: Optional[str]) -> Any:
+    if isinstance(value, str):
+        # Handle string numbers with decimals
+        return int(float(value))
+    return int(value)
 
-    except Exception as e:
-        type_desc = f"{param_type}" + (f" with format {format}" if format else "")
-        raise ValueError(f"Failed to convert {param_name} to {type_desc}: {str(e)}")
\ No newline at end of file
+def _convert_boolean(value: Any, param_name: str, format: Optional[str]) -> Any:
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes", "y", "on", "t")
+    return bool(value)
+
+def _convert_array(value: Any, param_name: str, format: Optional[str]) -> Any:
+    # Handle string JSON arrays
+    if isinstance(value, str):
+        value = json.loads(value)
+        
+    # Convert to list if it's a tuple or other sequence
+    if not isinstance(value, list):
+        value = list(value)
+        
+    # If format specifies element type, convert all elements
+    if format:
+        return [convert_value_to_type(item, f"{param_name}[{i}]", format) 
+               for i, item in enumerate(value)]
+    return value
+
+def _convert_object(value: Any, param_name: str, format: Optional[str]) -> Any:
+    # Handle string JSON objects
+    if isinstance(value, str):
+        value = json.loads(value)
+        
+    if not isinstance(value, dict):
+        raise ValueError(f"Cannot convert {type(value)} to object")
+        
+    # If format specifies value type, convert all values
+    if format:
+        return {k: convert_value_to_type(v, f"{param_name}.{k}", format) 
+               for k, v in value.items()}
+    return value